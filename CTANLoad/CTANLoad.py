@@ -39,7 +39,7 @@ CTANLoad.py may be started by:
 
  Requirements:
  + operating system windows 10/11 or Linux (like Linux Mint or Ubuntu or Debian)
- + wget a/o wget2 installed
+ + wget a/o wget2 installed (only for -dl wget a/o -dl wget2)
  + Python installation 3.10 or newer
  + a series of Python modules (see the import instructions below)
 
@@ -59,19 +59,40 @@ CTANLoad.py may be started by:
 # Imports
 
 import argparse                                 # parse arguments
+import ast                                      # literal_eval (xyz.lpt, ...)
+import gzip                                     # compressed XML files
+import hashlib                                  # hash values of XML files
+import http.client                              # built-in HTTP client
+import io                                       # archive members in memory
+import json                                     # plan of a load (-pl)
+import mmap                                     # validation of PDF files
 import os                                       # delete a file on disk, for
                                                 # instance
 from os import path                             # path informations
+from concurrent.futures import ProcessPoolExecutor
+                                                # parsing of XML files in
+                                                # worker processes
 import pickle                                   # read/write pickle data
 import platform                                 # get OS informations
-import random                                   # used for random integers
+import random                                   # jitter of the backoff
+from queue import Queue                         # queues between the pipeline
+                                                # stages
 import re                                       # handle regular expressions
+import shutil                                   # copy files (local source)
+import sqlite3                                  # persistent job queue
 import subprocess                               # handling of sub-processes
 import sys                                      # system calls
-import time                                     # used for random seed, time
+import tarfile                                  # tar archive as source
+import time                                     # used for time
                                                 # measurement
 import xml.etree.ElementTree as ET              # XML processing
+import zlib                                     # compressed transfer (gzip)
 from threading import Thread                    # handling of threads
+from threading import Lock                      # locks for parallel downloads
+from threading import local                     # thread-local HTTP connections
+from threading import Condition                 # adaptive concurrency
+from urllib.parse import urljoin, urlsplit      # handling of URLs
+import zipfile                                  # zip archive as source
 import pyperclip3 as pc                         # writing to clipboard
 
 
@@ -85,8 +106,8 @@ prg_name        = "CTANLoad.py"
 prg_author      = "Günter Partosch"
 prg_email       = "Guenter.Partosch@web.de;\nformerly:" + \
                   " Guenter.Partosch@hrz.uni-giessen.de"
-prg_version     = "2.50"
-prg_date        = "2025-02-12"
+prg_version     = "2.76"
+prg_date        = "2026-10-18"
 prg_inst       = "formerly: Justus-Liebig-Universität Gießen," +\
                  " Hochschulrechenzentrum"
 
@@ -105,6 +126,69 @@ wget            = "wget2"                       # wget processor
 timeoutDefault  = 60                            # default for timeout in
                                                 # subprocess (in sec.)
 
+# 2.52   2026-10-18 built-in HTTP client with persistent connections; wget
+#                   only as alternative (option -dl)
+
+downloaders     = ["http", "wget", "wget2"]     # possible values for -dl
+max_redirects   = 10                            # maximum number of HTTP
+                                                # redirections
+http_headers    = {"User-Agent": "CTANLoad/" + prg_version,
+                   "Connection": "keep-alive"}  # headers for each HTTP request
+chunk_size      = 65536                         # size of the blocks written
+                                                # by the HTTP client
+
+# 2.54   2026-10-18 pipeline: XML download --> XML analysis --> PDF download
+
+analyze_jobs    = 1                             # number of workers for the
+                                                # analysis of XML files
+queue_size      = 100                           # maximum length of the queues
+                                                # between the pipeline stages
+
+# 2.55   2026-10-18 resumable PDF downloads (built-in HTTP client)
+
+part_ext        = ".part"                       # name extension for partially
+                                                # downloaded PDF files
+journal_ext     = ".jnl"                        # name extension for the
+                                                # journal of a .part file
+
+# 2.65   2026-10-18 verification of the local files (option -vf)
+
+hash_jobs       = os.cpu_count() or 1           # number of workers for the
+                                                # hashing of local files (all
+                                                # cores)
+
+# 2.67   2026-10-18 structural validation of PDF files
+
+pdf_probe       = 4096                          # number of bytes inspected at
+                                                # the begin and at the end of
+                                                # a PDF file
+
+# 2.68   2026-10-18 telemetry of the downloads (option -tm)
+
+latency_buckets = [0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60]
+                                                # upper bounds (sec) of the
+                                                # latency histograms
+size_buckets    = [1000, 10000, 100000, 1000000, 10000000, 100000000]
+                                                # upper bounds (bytes) of the
+                                                # size histograms
+url_classes     = ["catalog", "xml", "pdf"]     # classes of the requests
+
+# 2.69   2026-10-18 repeated downloads with jittered exponential backoff
+#                   (options -rt, -bo)
+
+backoff_max     = 60                            # upper limit (sec) of a delay
+                                                # between two attempts
+
+# 2.72   2026-10-18 parsing of the XML files in worker processes (option -jx)
+
+extract_chunk   = 64                            # number of XML files parsed
+                                                # per task of a worker process
+
+# 2.63   2026-10-18 scheduler: byte and time budgets, priority policies
+# 2.64   2026-10-18 dry run: plan of a load (option -pl)
+
+priorities      = ["name", "recent", "missing"] # possible values for -p
+
 empty           = ""
 no_tp           = 0                             # number of packages selected
                                                 # per topics
@@ -130,30 +214,116 @@ author_text           = "Author of the program"
 version_text          = "Version of the program"
 output_text           = "Generic file name for output files"
 number_text           = "Maximum number of file downloads"
+byte_budget_text      = """Maximum number of downloaded bytes in this session
+(0: unlimited); the rest is loaded in the next session; files copied from a
+local source (-src) do not count"""
+time_budget_text      = """Maximum duration (sec) of the downloads in this
+session (0: unlimited); the rest is loaded in the next session"""
+priority_text         = """Order of the package XML files to be loaded: name,
+recent (most recently changed first), missing (missing before stale)"""
+jobs_text             = """Maximum number of parallel downloads of package XML
+files (upper limit of the adaptive concurrency)"""
+pdf_jobs_text         = """Maximum number of parallel downloads of PDF files (upper
+limit of the adaptive concurrency)"""
+extract_jobs_text     = """Number of worker processes for the parsing of the
+local XML files (0: all cores)"""
+request_rate_text     = "Maximum number of requests per second (0: unlimited)"
+retries_text          = """Maximum number of repetitions of a download after a
+transient error (network error, timeout, 408, 429, 5xx); failed files are
+retried first in the next session"""
+backoff_text          = """Base delay (sec) of the exponential backoff between
+two attempts (with random jitter)"""
+byte_rate_text        = """Maximum number of downloaded bytes per second (0:
+unlimited)"""
+downloader_text       = """Download method: built-in HTTP client (http) or
+external processor (wget, wget2)"""
 direc_text            = "Folder for output files in the OS"
+ttl_text              = """Time to live (sec) of the cached catalog files
+(authors, topics, licenses, packages); 0: no cache"""
+source_text           = """Source of the CTAN files: base URL, local mirror
+folder a/o archive (.tar, .tar.gz, .tgz, .zip) with xml/2.0/... and
+tex-archive/..."""
 program_text          = """Program loads XLM and PDF documentation files from
 CTAN a/o generates some special lists, and prepares data for CTANOut."""
 verbose_text          = "Flag: Output is verbose."
 download_text         = "Flag: Downloads associated documentation files [PDF]."
+refresh_text          = """Flag: Downloads and analyzes all selected package
+XML files (and their PDF files), even if they are unchanged on CTAN."""
 lists_text            = """Flag: Generates some special lists and prepare files
 for CTANOut."""
 statistics_text       = "Flag: Prints statistics."
 integrity_text        = "Flag: Checks the integrity of the 2nd .pkl file."
 regenerate_text       = "Flag: Regenerates the two pickle files."
+verify_text           = """Flag: Verifies the local XML and PDF files by
+their hashes and sizes (recorded at download time); corrupt files are
+downloaded again."""
+plan_text             = """Flag: Plans a load without loading (dry run): new,
+removed and stale packages, XML/PDF transfers, estimated bytes; output on
+terminal and in xyz.plan.json."""
+compress_text         = """Flag: Stores package XML files compressed
+(abc.xml.gz)."""
+import_text           = """Imports the package XML files of an archive in one
+streaming pass (tar, .tar.gz, .tgz, .tar.bz2, .tar.xz a/o zip; members
+xml/2.0/pkg/<name>, <name>.xml a/o <name>.xml.gz) and generates XML_toc, the
+derived dictionaries and the pickle files"""
+export_text           = """Exports the local XML files into an archive in the
+layout of a CTAN mirror (xml/2.0/...); format by name extension (.zip, .tar,
+.tar.gz, .tgz, .tar.bz2, .tar.xz); usable with -im and -src"""
+sqlite_text           = """Flag: Writes the catalog (dictionaries of the 1st
+and 2nd pickle file) also into the SQLite database CTAN.db (for CTANOut
+-sq)."""
+telemetry_text        = """Flag: Records each download (class, bytes,
+status, duration, retries) and writes a report (xyz.telemetry.json) and a
+Prometheus textfile (xyz.prom) at the end of the run."""
 
 # -----------------------------------------------------------------    
 # Defaults/variables for argparse
 
 download_default         = False        # default for option -f
                                         # (no PDF download)
+refresh_default          = False        # default for option -fr
+                                        # (conditional requests)
+compress_default         = False        # default for option -z
+                                        # (package XML files not compressed)
+sqlite_default           = False        # default for option -sq
+                                        # (no SQLite catalog)
 integrity_default        = False        # default for option -c
                                         # (no integrity check)
 lists_default            = False        # default for option -n
                                         # (special lists are not generated)
 number_default           = 250          # default for option -n
                                         # (maximum number of files to be loaded)
+byte_budget_default      = 0            # default for option -nb
+                                        # (downloaded bytes: unlimited)
+time_budget_default      = 0            # default for option -tb
+                                        # (duration of downloads: unlimited)
+priority_default         = "name"       # default for option -p
+                                        # (sorted by name)
+jobs_default             = 1            # default for option -j
+                                        # (downloads in series)
+pdf_jobs_default         = 1            # default for option -jp
+                                        # (PDF downloads in series)
+extract_jobs_default     = 1            # default for option -jx
+                                        # (parsing in series)
+request_rate_default     = 0            # default for option -rr
+                                        # (requests per second: unlimited)
+retries_default          = 3            # default for option -rt
+                                        # (three repetitions)
+backoff_default          = 1.0          # default for option -bo
+                                        # (1 s, 2 s, 4 s, ...)
+byte_rate_default        = 0            # default for option -br
+                                        # (bytes per second: unlimited)
+downloader_default       = "http"       # default for option -dl
+                                        # (built-in HTTP client)
 output_name_default      = "all"        # default for option -o
                                         # (generic file name)
+ttl_default              = 600          # default for option -ttl
+                                        # (catalog files: cache for 10 min.)
+telemetry_default        = False        # default for option -tm
+                                        # (no telemetry)
+source_default           = "https://ctan.org"
+                                        # default for option -src
+                                        # (CTAN itself)
 statistics_default       = False        # default for option -stat
                                         # (no statistics output)
 name_template_default    = empty        # default for option -t
@@ -171,6 +341,14 @@ verbose_default          = False        # default for option -n
                                         # (output is not verbose)
 regenerate_default       = False        # default for option -r
                                         # (no regeneration)
+plan_default             = False        # default for option -pl
+                                        # (no dry run)
+verify_default           = False        # default for option -vf
+                                        # (no verification)
+import_default           = empty        # default for option -im
+                                        # (no import)
+export_default           = empty        # default for option -ex
+                                        # (no export)
 debugging_default        = False        # default for option -dbg
                                         # (debugging)
 
@@ -183,12 +361,36 @@ direc_default       = act_direc + direc_sep
                                  # default for -d (output OS folder)
 
 download            = None              # option -f    (no PDF download)
+refresh             = None              # option -fr   (full refresh)
+compress            = None              # option -z    (compressed XML files)
+sqlite              = None              # option -sq   (SQLite catalog)
 integrity           = None              # option -c    (no integrity check)
 lists               = None              # option -n    (special lists are not
                                         #              generated)
 number              = 0                 # option -n    (maximum number of files
                                         #              to be loaded)
+jobs                = 1                 # option -j    (number of parallel
+                                        #              downloads)
+pdf_jobs            = 1                 # option -jp   (number of parallel
+                                        #              PDF downloads)
+extract_jobs        = 1                 # option -jx   (number of worker
+                                        #              processes for parsing)
+request_rate        = 0                 # option -rr   (requests per second)
+retries             = 0                 # option -rt   (repetitions of a
+                                        #              download)
+backoff             = 0                 # option -bo   (base delay of the
+                                        #              backoff)
+byte_rate           = 0                 # option -br   (bytes per second)
+downloader          = empty             # option -dl   (download method)
 output_name         = empty             # option -o    (generic file name)
+source              = empty             # option -src  (source of the CTAN
+                                        #              files)
+byte_budget         = 0                 # option -nb   (byte budget)
+time_budget         = 0                 # option -tb   (time budget)
+priority            = empty             # option -p    (priority policy)
+ttl                 = 0                 # option -ttl  (time to live of the
+                                        #              catalog cache)
+telemetry           = None              # option -tm   (telemetry)
 statistics          = None              # option -stat (no statistics output)
 name_template       = empty             # option -t    (name template for file
                                         #              loading)
@@ -197,6 +399,12 @@ license_template    = empty             # option -L    (license name template)
 key_template        = empty             # option -k    (key template) 
 year_template       = empty             # option -y    (year template)
 verbose             = None              # option -n    (output is not verbose)
+plan                = None              # option -pl   (dry run)
+verify              = None              # option -vf   (verification)
+import_archive      = empty             # option -im   (archive to be
+                                        #              imported)
+export_archive      = empty             # option -ex   (archive to be
+                                        #              exported)
 debugging           = None              # option -dbg  (debugging)
 
 # ------------------------------------------------------------------
@@ -220,6 +428,19 @@ XML_toc               = {}              # python dictionary: list of PDF files:
                                         # XML_toc[href]=...PDF file
 PDF_toc               = {}              # python set: list of PDF files:
                                         # PDF_toc[lfn]=...package file
+XML_state             = {}              # python dictionary: validators of the
+                                        # XML files: XML_state[package]=...
+PDF_state             = {}              # python dictionary: validators and
+                                        # hashes of the PDF files:
+                                        # PDF_state[URL]=...
+PDF_store             = {}              # python dictionary: local PDF files
+                                        # by content: PDF_store[SHA-256]=file
+XML_facts             = None            # python dictionary: facts of the
+                                        # XML files (topics, authors, ...):
+                                        # XML_facts[package]=...
+inventory             = None            # python dictionary: files in the OS
+                                        # folder (one scan, shared by all
+                                        # phases): inventory[name]=...
 PDF_notloaded         = set()           # Python set: list of PDF files:
                                         # PDF not downloaded
 not_well_formed       = set()           # Python set: list of XML files:
@@ -250,6 +471,54 @@ selected_packages_llp = set()           # python set:
 #   generated in:              get_PDF_files(d)
 #   changed in                 analyze_XML_file(file), check_integrity()
 #   inspected in:              check_integrity()
+#
+# XML_state
+#   Structure:                 XML_state[package] = (ETag, Last-Modified,
+#                              SHA-256 of the XML file, flag: analyzed with
+#                              complete PDF download)
+#   generated and changed in:  dload_XML_file(f)
+#   inspected in:              dload_XML_file(f)
+#   stored in pickle file:     generate_pickle3()
+#   loaded from pickle file:   load_XML_state()
+#
+# PDF_state
+#   Structure:                 PDF_state[URL] = (ETag, Last-Modified,
+#                              SHA-256 of the PDF file, size, local file)
+#   generated and changed in:  store_PDF_file(href, file, etag, modified)
+#   inspected in:              dload_document_file(href, key, name, XML_file)
+#   stored in pickle file:     generate_pickle3()
+#   loaded from pickle file:   load_XML_state()
+#
+# PDF_store
+#   Structure:                 PDF_store[SHA-256] = local PDF file
+#   generated in:              load_XML_state()
+#   changed in                 store_PDF_file(href, file, etag, modified)
+#   inspected in:              store_PDF_file(href, file, etag, modified)
+#
+# XML_facts
+#   Structure:                 XML_facts[package] = (file name, size, mtime,
+#                              SHA-256 of the XML file, facts)
+#                              facts = (topics, authors, licenses, year,
+#                              hrefs of the documentation) a/o None (XML
+#                              file not well-formed/empty)
+#   generated and changed in:  generate_topicspackages()
+#   inspected in:              generate_topicspackages(),
+#                              regenerate_pickle_files()
+#   stored in pickle file:     generate_pickle5()
+#   loaded from pickle file:   load_XML_facts()
+#
+# inventory
+#   Structure:                 inventory[file name] = (size, mtime)
+#   generated in:              get_inventory() (os.scandir, once per state
+#                              of the OS folder)
+#   changed in                 check_integrity(), verify_PDF_files(),
+#                              call_verify() (deleted files)
+#   reset in:                  reset_inventory() (via dload_file,
+#                              store_XML_file)
+#   inspected in:              get_PDF_files(d), get_XML_files(d),
+#                              set_PDF_toc(), check_integrity(),
+#                              verify_PDF_files(), call_plan(),
+#                              call_verify(), make_statistics()
 
 # 1st pickle file:
 #   name:      CTAN.pkl
@@ -259,6 +528,38 @@ selected_packages_llp = set()           # python set:
 # 2nd pickle file:
 #   name:      CTAN2.pkl
 #   contains:  XML_toc
+#
+# 3rd pickle file:
+#   name:      CTAN3.pkl
+#   contains:  XML_state, PDF_state
+#
+# 4th pickle file (cache with time to live, option -ttl):
+#   name:      CTAN4.pkl
+#   contains:  time of download, source, authors, packages, topics, licenses
+#
+# 5th pickle file:
+#   name:      CTAN5.pkl
+#   contains:  XML_facts
+#
+# index file (written together with the 1st pickle file):
+#   name:      CTAN.idx
+#   contains:  topicspackages, authorpackages, licensepackages (JSON lines:
+#              one line ["<name>", {key: [packages]}] per dictionary)
+#
+# SQLite catalog (option -sq; written together with the 1st and 2nd pickle
+# file):
+#   name:      CTAN.db
+#   contains:  tables authors, packages, topics, licenses (key --> values),
+#              topicspackages, packagetopics, authorpackages,
+#              licensepackages, yearpackages (key, package; indexed on both
+#              columns), documentation (XML_toc), meta
+#
+# sectioned catalog (written together with the 1st pickle file):
+#   name:      CTAN.sec
+#   contains:  directory {name: (offset, length)}, then authors, packages,
+#              topics, licenses, topicspackages, packagetopics,
+#              authorpackages, licensepackages, yearpackages (each pickled
+#              on its own; loaded one by one in CTANOut)
 
 # ------------------------------------------------------------------
 # Settings for wget (authors, packages, topics)
@@ -267,6 +568,8 @@ ctanUrl             = "https://ctan.org"
                                                 # head of a CTAN url
 ctanUrl2            = ctanUrl + "/tex-archive"
                                                 # head of another CTAN url
+ctanXML             = ctanUrl + "/xml/2.0/"     # head of the CTAN urls for
+                                                # XML files
 call1               = "wget https://ctan.org/xml/2.0/"
                                                 # base wget call for authors,
                                                 # packages, ...
@@ -281,6 +584,19 @@ parameter           = "?no-dtd=true --no-check-certificate -O "
 
 pkl_file            = "CTAN.pkl"                # name of 1st pickle file
 pkl_file2           = "CTAN2.pkl"               # name of 2nd pickle file
+pkl_file3           = "CTAN3.pkl"               # name of 3rd pickle file
+pkl_file4           = "CTAN4.pkl"               # name of 4th pickle file
+                                                # (cache for catalog files)
+pkl_file5           = "CTAN5.pkl"               # name of 5th pickle file
+                                                # (facts of the XML files)
+idx_file            = "CTAN.idx"                # name of the index file
+                                                # (key --> packages)
+catalog_file        = "CTAN.db"                 # name of the SQLite catalog
+                                                # (option -sq)
+sec_file            = "CTAN.sec"                # name of the sectioned
+                                                # catalog
+queue_file          = "CTAN-queue.db"           # name of the job queue
+                                                # (SQLite; only while loading)
 
 actDate             = time.strftime("%Y-%m-%d") # actual date of program
                                                 # execution
@@ -294,12 +610,44 @@ pdfcounter          = 0                         # counter for downloaded PDF
 pdfctrerr           = 0                         # counter for not downloaded
                                                 # PDF files
                                                 # (in the actual session)
+pdfpending          = 0                         # counter for queued a/o
+                                                # running PDF downloads
+                                                # (reserved against -n)
+unchanged           = 0                         # counter for unchanged XML
+                                                # files (in the actual session)
+pdfresumed          = 0                         # counter for resumed PDF
+                                                # downloads
+                                                # (in the actual session)
+pdfunchanged        = 0                         # counter for unchanged PDF
+                                                # files (in the actual session)
+pdflinked           = 0                         # counter for PDF files shared
+                                                # with identical files
+                                                # (in the actual session)
+slowdowns           = 0                         # counter for reductions of
+                                                # the concurrency (AIMD)
+                                                # (in the actual session)
+dbytes              = 0                         # counter for downloaded bytes
+                                                # (in the actual session)
+retried             = 0                         # counter for repeated
+                                                # downloads (-rt)
+                                                # (in the actual session)
+telemetry_records   = []                        # records of the downloads
+                                                # (option -tm)
+                                                # (in the actual session)
+verified            = 0                         # counter for verified local
+                                                # files (in the actual session)
+mismatches          = 0                         # counter for corrupt local
+                                                # files (in the actual session)
+imported            = 0                         # counter for imported XML
+                                                # files (in the actual session)
 corrected           = 0                         # counter of corrected entries
                                                 # in XML_toc
                                                 # (in the actual session)
 
 ext                 = ".xml"                    # file name extension for
                                                 # downloaded XML files
+gz_ext              = ".gz"                     # file name extension for
+                                                # compressed XML files
 rndg                = 2                         # optional rounding of float
                                                 # numbers
 left                = 35                        # width of labels in statistics
@@ -312,8 +660,32 @@ exclusion           = ["authors.xml", "topics.xml", "packages.xml",
                                                 # XML files which are not a
                                                 # ackage file
 
-random.seed(time.time())                        # seed for random number
-                                                # generation
+# 2.51   2026-10-18 package XML files can be downloaded in parallel (-j)
+
+dload_lock          = Lock()                    # lock for counters and
+                                                # dictionaries shared by
+                                                # parallel downloads
+http_pool           = local()                   # per thread: open HTTP
+                                                # connections (keep-alive)
+request_info        = local()                   # per thread: bytes and
+                                                # retries of the actual
+                                                # request (option -tm)
+analyze_queue       = None                      # queue: XML files to be
+                                                # analyzed (pipeline)
+pdf_queue           = None                      # queue: PDF files to be
+                                                # downloaded (pipeline)
+
+# 2.60   2026-10-18 persistent job queue (SQLite): an interrupted load is
+#                   resumed
+
+queue_db            = None                      # connection to the job queue
+queue_lock          = Lock()                    # lock for the job queue
+
+# 2.76   2026-10-18 failed jobs: only transient errors kept, for at most
+#                   queue_attempts sessions
+
+queue_attempts      = 3                         # maximum number of sessions
+                                                # with a failed job
 
 
 # ==================================================================
@@ -376,12 +748,42 @@ group1.add_argument("-A", "--author_template",  # Parameter -A/--author_template
                     dest    = "author_template",
                     default = author_template_default)
 
+group1.add_argument("-bo", "--backoff",         # Parameter -bo/--backoff
+                    metavar = "<seconds>",
+                    help    = backoff_text + " -- Default: " + "%(default)s",
+                    action  = "store",
+                    dest    = "backoff",
+                    type    = float,
+                    default = backoff_default)
+
+group1.add_argument("-br", "--byte_rate",       # Parameter -br/--byte_rate
+                    metavar = "<byte rate>",
+                    help    = byte_rate_text + " -- Default: " + "%(default)s",
+                    action  = "store",
+                    dest    = "byte_rate",
+                    type    = float,
+                    default = byte_rate_default)
+
+group1.add_argument("-dl", "--downloader",      # Parameter -dl/--downloader
+                    metavar = "<downloader>",
+                    help    = downloader_text + " -- Default: " + "%(default)s",
+                    action  = "store",
+                    dest    = "downloader",
+                    choices = downloaders,
+                    default = downloader_default)
+
 group1.add_argument("-f", "--download_files",   # Parameter -f/--download_files
                     help    = download_text + " -- Default: " + "%(default)s",
                     action  = "store_true",
                     dest    = "download_files",
                     default = download_default)
 
+group1.add_argument("-fr", "--full_refresh",   # Parameter -fr/--full_refresh
+                    help    = refresh_text + " -- Default: " + "%(default)s",
+                    action  = "store_true",
+                    dest    = "full_refresh",
+                    default = refresh_default)
+
 group1.add_argument("-k", "--key_template",     # Parameter -k/--key_template
                     metavar = "<key template>",
                     help    = key_template_text + " -- Default: " + \
@@ -406,6 +808,31 @@ group1.add_argument("-L", "--license_template", # Parameter -L/--license_templat
                     dest    = "license_template",
                     default = license_template_default)
 
+group1.add_argument("-j", "--jobs",             # Parameter -j/--jobs
+                    metavar = "<jobs>",
+                    help    = jobs_text + " -- Default: " + "%(default)s",
+                    action  = "store",
+                    dest    = "jobs",
+                    type    = int,
+                    default = jobs_default)
+
+group1.add_argument("-jp", "--pdf_jobs",        # Parameter -jp/--pdf_jobs
+                    metavar = "<PDF jobs>",
+                    help    = pdf_jobs_text + " -- Default: " + "%(default)s",
+                    action  = "store",
+                    dest    = "pdf_jobs",
+                    type    = int,
+                    default = pdf_jobs_default)
+
+group1.add_argument("-jx", "--extract_jobs",    # Parameter -jx/--extract_jobs
+                    metavar = "<extract jobs>",
+                    help    = extract_jobs_text + " -- Default: " +
+                              "%(default)s",
+                    action  = "store",
+                    dest    = "extract_jobs",
+                    type    = int,
+                    default = extract_jobs_default)
+
 group1.add_argument("-n", "--number",           # Parameter -n/--number
                     metavar = "<number>",
                     help    = number_text + " -- Default: " + "%(default)s",
@@ -414,6 +841,15 @@ group1.add_argument("-n", "--number",           # Parameter -n/--number
                     type    = int,
                     default = number_default)
 
+group1.add_argument("-nb", "--byte_budget",     # Parameter -nb/--byte_budget
+                    metavar = "<bytes>",
+                    help    = byte_budget_text + " -- Default: " + \
+                              "%(default)s",
+                    action  = "store",
+                    dest    = "byte_budget",
+                    type    = int,
+                    default = byte_budget_default)
+
 group1.add_argument("-o", "--output",           # Parameter -o/--output
                     metavar = "<output>",
                     help    = output_text + " -- Default: " + "%(default)s",
@@ -421,6 +857,44 @@ group1.add_argument("-o", "--output",           # Parameter -o/--output
                     dest    = "output_name",
                     default = output_name_default)
 
+group1.add_argument("-p", "--priority",         # Parameter -p/--priority
+                    metavar = "<policy>",
+                    help    = priority_text + " -- Default: " + "%(default)s",
+                    action  = "store",
+                    dest    = "priority",
+                    choices = priorities,
+                    default = priority_default)
+
+group1.add_argument("-rr", "--request_rate",    # Parameter -rr/--request_rate
+                    metavar = "<request rate>",
+                    help    = request_rate_text + " -- Default: " + \
+                    "%(default)s",
+                    action  = "store",
+                    dest    = "request_rate",
+                    type    = float,
+                    default = request_rate_default)
+
+group1.add_argument("-rt", "--retries",         # Parameter -rt/--retries
+                    metavar = "<number>",
+                    help    = retries_text + " -- Default: " + "%(default)s",
+                    action  = "store",
+                    dest    = "retries",
+                    type    = int,
+                    default = retries_default)
+
+group1.add_argument("-sq", "--sqlite",          # Parameter -sq/--sqlite
+                    help    = sqlite_text + " -- Default: " + "%(default)s",
+                    action  = "store_true",
+                    dest    = "sqlite",
+                    default = sqlite_default)
+
+group1.add_argument("-src", "--source",         # Parameter -src/--source
+                    metavar = "<source>",
+                    help    = source_text + " -- Default: " + "%(default)s",
+                    action  = "store",
+                    dest    = "source",
+                    default = source_default)
+
 group1.add_argument("-t", "--name_template",    # Parameter -t/--name_template
                     metavar = "<name template>",
                     help    = name_template_text + " -- Default: " + \
@@ -429,6 +903,29 @@ group1.add_argument("-t", "--name_template",    # Parameter -t/--name_template
                     dest    = "name_template",
                     default = name_template_default)
 
+group1.add_argument("-tb", "--time_budget",     # Parameter -tb/--time_budget
+                    metavar = "<seconds>",
+                    help    = time_budget_text + " -- Default: " + \
+                              "%(default)s",
+                    action  = "store",
+                    dest    = "time_budget",
+                    type    = int,
+                    default = time_budget_default)
+
+group1.add_argument("-tm", "--telemetry",       # Parameter -tm/--telemetry
+                    help    = telemetry_text + " -- Default: " + "%(default)s",
+                    action  = "store_true",
+                    dest    = "telemetry",
+                    default = telemetry_default)
+
+group1.add_argument("-ttl", "--catalog_ttl",    # Parameter -ttl/--catalog_ttl
+                    metavar = "<seconds>",
+                    help    = ttl_text + " -- Default: " + "%(default)s",
+                    action  = "store",
+                    dest    = "catalog_ttl",
+                    type    = int,
+                    default = ttl_default)
+
 group1.add_argument("-y", "--year_template",    # Parameter -y/--year_template
                     metavar = "<year template>",
                     help    = year_text + " -- Default: " + "%(default)s",
@@ -436,6 +933,12 @@ group1.add_argument("-y", "--year_template",    # Parameter -y/--year_template
                     dest    = "year_template",
                     default = year_template_default)
 
+group1.add_argument("-z", "--compress",         # Parameter -z/--compress
+                    help    = compress_text + " -- Default: " + "%(default)s",
+                    action  = "store_true",
+                    dest    = "compress",
+                    default = compress_default)
+
 group2 = parser.add_argument_group("Options for special actions")
 
 group2.add_argument("-c", "--check_integrity",  # Parameter
@@ -445,12 +948,32 @@ group2.add_argument("-c", "--check_integrity",  # Parameter
                     dest    = "check_integrity",
                     default = integrity_default)
 
+group2.add_argument("-ex", "--export",          # Parameter -ex/--export
+                    metavar = "<archive>",
+                    help    = export_text + " -- Default: " + "%(default)s",
+                    action  = "store",
+                    dest    = "export_archive",
+                    default = export_default)
+
+group2.add_argument("-im", "--import",          # Parameter -im/--import
+                    metavar = "<archive>",
+                    help    = import_text + " -- Default: " + "%(default)s",
+                    action  = "store",
+                    dest    = "import_archive",
+                    default = import_default)
+
 group2.add_argument("-l", "--lists",            # Parameter -l/--lists
                     help    = lists_text + " -- Default: " + "%(default)s",
                     action  = "store_true",
                     dest    = "lists",
                     default = lists_default)
 
+group2.add_argument("-pl", "--plan",            # Parameter -pl/--plan
+                    help    = plan_text + " -- Default: " + "%(default)s",
+                    action  = "store_true",
+                    dest    = "plan",
+                    default = plan_default)
+
 group2.add_argument("-r", "--regenerate_pickle_files",
                                                 # Parameter
                                                 # -r/--regenerate_pickle_files
@@ -459,6 +982,12 @@ group2.add_argument("-r", "--regenerate_pickle_files",
                     dest    = "regenerate_pickle_files",
                     default = regenerate_default)
 
+group2.add_argument("-vf", "--verify",          # Parameter -vf/--verify
+                    help    = verify_text + " -- Default: " + "%(default)s",
+                    action  = "store_true",
+                    dest    = "verify",
+                    default = verify_default)
+
 # ------------------------------------------------------------------
 # Getting parsed values
 
@@ -469,11 +998,35 @@ author_template  = args.author_template         # parameter -A
 license_template = args.license_template        # parameter -L
 direc            = args.direc                   # parameter -d
 download         = args.download_files          # parameter -f
+refresh          = args.full_refresh            # parameter -fr
+compress         = args.compress                # parameter -z
+sqlite           = args.sqlite                  # parameter -sq
 integrity        = args.check_integrity         # parameter -c
 key_template     = args.key_template            # parameter -k
 lists            = args.lists                   # parameter -l
 number           = int(args.number)             # parameter -n
+jobs             = max(1, int(args.jobs))       # parameter -j
+pdf_jobs         = max(1, int(args.pdf_jobs))   # parameter -jp
+extract_jobs     = max(0, args.extract_jobs) or hash_jobs
+                                                # parameter -jx (0: all cores)
+request_rate     = max(0, args.request_rate)    # parameter -rr
+retries          = max(0, args.retries)         # parameter -rt
+backoff          = max(0, args.backoff)         # parameter -bo
+byte_rate        = max(0, args.byte_rate)       # parameter -br
+source           = args.source.strip()          # parameter -src
+ttl              = max(0, args.catalog_ttl)     # parameter -ttl
+telemetry        = args.telemetry               # parameter -tm
+byte_budget      = max(0, args.byte_budget)     # parameter -nb
+time_budget      = max(0, args.time_budget)     # parameter -tb
+priority         = args.priority                # parameter -p
+downloader       = args.downloader              # parameter -dl
+if downloader != "http":                        # wget a/o wget2 as processor
+    wget         = downloader
 regenerate       = args.regenerate_pickle_files # parameter -r
+plan             = args.plan                    # parameter -pl
+verify           = args.verify                  # parameter -vf
+import_archive   = args.import_archive.strip()  # parameter -im
+export_archive   = args.export_archive.strip()  # parameter -ex
 statistics       = args.statistics              # parameter -stat
 name_template    = args.name_template           # parameter -k
 verbose          = args.verbose                 # parameter -v
@@ -498,6 +1051,27 @@ if not path.exists(direc):
         
 output_name        = direc + args.output_name   # parameter -d
 
+# ------------------------------------------------------------------
+# Source of the CTAN files (-src): base URL, local mirror folder a/o archive
+
+# 2.58   2026-10-18 new option -src
+
+if re.match("^https?://", source, re.IGNORECASE):
+    source_kind    = "url"                      # any base URL
+    source         = source.rstrip("/")
+elif path.isdir(source):
+    source_kind    = "folder"                   # local mirror folder
+elif path.isfile(source) and (tarfile.is_tarfile(source) or
+                              zipfile.is_zipfile(source)):
+    source_kind    = "archive"                  # tar a/o zip archive
+else:
+    print(f"[CTANLoad] Error: source '{source}' not found a/o not usable")
+    sys.exit("[CTANLoad] Error: programm terminated")
+
+source_archive     = None                       # opened archive (-src)
+source_members     = None                       # members of the archive
+source_lock        = Lock()                     # lock for the archive
+
 # ------------------------------------------------------------------
 # additional files, if you want to search topics a/a authors and their
 # corr. packages
@@ -505,6 +1079,51 @@ output_name        = direc + args.output_name   # parameter -d
 topicpackage_file   = output_name + ".lpt"      # name of a the xyz.lpt file
 authorpackage_file  = output_name + ".lap"      # name of a the xyz.lap file
 licensepackage_file = output_name + ".llp"      # name of a the xyz.llp file
+plan_file           = output_name + ".plan.json"
+                                                # name of the plan (-pl)
+telemetry_file      = output_name + ".telemetry.json"
+                                                # name of the telemetry report
+                                                # (-tm)
+prom_file           = output_name + ".prom"     # name of the Prometheus
+                                                # textfile (-tm)
+
+# ------------------------------------------------------------------
+# rate limits (token buckets) and adaptive concurrency (AIMD) for downloads
+
+# 2.57   2026-10-18 rate limits (options -rr, -br) and adaptive concurrency
+# 2.59   2026-10-18 conc_max: at least 4 (catalog files in parallel)
+# 2.76   2026-10-18 conc_limit starts at half of conc_max (additive increase
+#                   up to the worker threads of -j, -jp)
+
+rate_lock        = Lock()                       # lock for the token buckets
+request_bucket   = {"rate"  : request_rate,     # token bucket for requests
+                    "burst" : max(1, request_rate),
+                    "tokens": max(1, request_rate),
+                    "stamp" : time.monotonic()}
+byte_bucket      = {"rate"  : byte_rate,        # token bucket for bytes
+                    "burst" : max(chunk_size, byte_rate),
+                    "tokens": max(chunk_size, byte_rate),
+                    "stamp" : time.monotonic()}
+
+conc_cond        = Condition()                  # guards the following values
+conc_max         = max(4, jobs + pdf_jobs)      # upper limit for concurrent
+                                                # downloads (all workers; at
+                                                # least the 4 catalog files)
+conc_limit       = max(1.0, conc_max / 2)       # actual limit (AIMD): starts
+                                                # below conc_max; halved on
+                                                # timeout/429/5xx, increased on
+                                                # success
+conc_active      = 0                            # actual number of downloads
+
+# ------------------------------------------------------------------
+# budgets of the scheduler
+
+# 2.63   2026-10-18 byte and time budgets (options -nb, -tb)
+
+budget_start     = time.time()                  # begin of the time budget
+budget_exhausted = False                        # Flag: a budget is exhausted;
+                                                # the load is continued in the
+                                                # next session
 
 # ------------------------------------------------------------------
 # special regular expressions
@@ -514,8 +1133,9 @@ p2           = re.compile(name_template)        # regular expression based on
 p3           = re.compile("^[0-9]{10}-.+[.]pdf$")
                                                 # regular expression for local
                                                 # PDF file names
-p4           = re.compile("^.+[.]xml$")         # regular expression for local
-                                                # XML file names
+p4           = re.compile("^.+[.]xml([.]gz)?$") # regular expression for local
+                                                # XML file names (a/o
+                                                # compressed)
 p5           = re.compile(key_template)         # regular expression for topics
 p6           = re.compile(author_template)      # regular expression for author
                                                 # names
@@ -524,6 +1144,30 @@ p9           = re.compile(year_template)        # regular expression
 p10          = re.compile(year_template_default)# regular expression based on -y
 
 
+#===================================================================
+# Exceptions
+
+# ------------------------------------------------------------------
+class DownloadError(Exception):                 # Exception DownloadError: a
+                                                # download with the built-in
+                                                # HTTP client failed.
+    """
+    A download with the built-in HTTP client failed.
+
+    status: HTTP status code (0: network error a/o timeout)
+    retry_after: None a/o delay (sec) demanded by the server (Retry-After)
+    """
+
+    # 2.52   2026-10-18 new exception DownloadError
+    # 2.69   2026-10-18 in DownloadError: new attribute retry_after
+
+    def __init__(self, url, status, reason, retry_after=None):
+        self.status      = status               # HTTP status code
+        self.url         = url                  # requested URL
+        self.retry_after = retry_after          # Retry-After (sec)
+        Exception.__init__(self, f"{status} {reason} ('{url}')")
+
+
 #===================================================================
 # Auxiliary function
 
@@ -607,7 +1251,69 @@ def fold(s):                                    # auxiliary function fold():
 # Functions for main part
 
 # ------------------------------------------------------------------
-def analyze_XML_file(file):                     # Function analyze_XML_file(file)
+def acquire_slot():                             # Function acquire_slot: Waits
+                                                # for a free download slot.
+    """
+    Waits until the number of concurrent downloads is below the actual limit
+    (adaptive concurrency, AIMD) and occupies a slot.
+
+    Rewrites the global conc_active.
+
+    no parameter
+
+    global variables:
+    conc_active     actual number of downloads
+    conc_limit      actual limit of concurrent downloads
+    """
+
+    # 2.57   2026-10-18 new function acquire_slot
+
+    global conc_active                          # actual number of downloads
+
+    with conc_cond:
+        while conc_active >= int(conc_limit):
+            conc_cond.wait()
+        conc_active = conc_active + 1
+
+# ------------------------------------------------------------------
+def add_telemetry(url, status, size, duration, retries):
+                                                # Function add_telemetry:
+                                                # Records one download.
+    """
+    Records one download (option -tm) in the global list telemetry_records.
+
+    Structure of a record: (class, URL, HTTP status, bytes, duration,
+    retries); class is one of url_classes (catalog: catalog files, xml:
+    package XML files, pdf: documentation files).
+
+    parameters:
+    url      : requested URL
+    status   : HTTP status (0: network error a/o timeout)
+    size     : number of transferred bytes
+    duration : duration of the request (sec)
+    retries  : number of repeated requests
+
+    global variable:
+    telemetry_records   records of the downloads
+    """
+
+    # 2.68   2026-10-18 new function add_telemetry
+
+    if not telemetry:
+        return
+
+    urlpath = urlsplit(url).path                # class of the URL
+    if "/xml/2.0/pkg/" in urlpath:
+        kind = "xml"
+    elif "/xml/2.0/" in urlpath:
+        kind = "catalog"
+    else:
+        kind = "pdf"
+    with dload_lock:
+        telemetry_records.append((kind, url, status, size, duration, retries))
+
+# ------------------------------------------------------------------
+def analyze_XML_file(file, hrefs=None):         # Function analyze_XML_file(file)
                                                 # Analyzes a XML package file.
                                                 # for documentation (PDF) files
     """
@@ -616,7 +1322,9 @@ def analyze_XML_file(file):                     # Function analyze_XML_file(file
     Rewrites the global variables XML_toc and PDF_toc.
 
     parameter:
-    file: XML file to be parsed/analyzed
+    file:  XML file to be parsed/analyzed
+    hrefs: hrefs of the documentation elements (already parsed, see
+           XML_facts) a/o None (file is parsed)
 
     global variables:
     XML_toc            global Python dictionary for XML files
@@ -634,6 +1342,20 @@ def analyze_XML_file(file):                     # Function analyze_XML_file(file
     #                   (parsing a XML file)
     # 2.46   2025-02-04 messages in functions' __doc__ texts listed
     # 2.49   2025-02-11 more f-strings
+    # 2.51   2026-10-18 access to XML_toc locked (parallel downloads)
+    # 2.54   2026-10-18 in analyze_XML_file: PDF files are handed over to the
+    #                   PDF download stage (pipeline)
+    # 2.56   2026-10-18 in analyze_XML_file: file keys derived from href
+    #                   (get_file_key) instead of random numbers
+    # 2.60   2026-10-18 in analyze_XML_file: new XML_toc entries and PDF jobs
+    #                   recorded in the job queue
+    # 2.62   2026-10-18 in analyze_XML_file: compressed XML files (-z)
+    # 2.72   2026-10-18 in analyze_XML_file: new parameter hrefs (parsed in
+    #                   a worker process); a missing file is skipped
+    # 2.76   2026-10-18 in analyze_XML_file: a well-formed file is removed from
+    #                   not_well_formed (loaded once more)
+    # 2.76   2026-10-18 in analyze_XML_file: a PDF file is only queued, if
+    #                   the limit of downloaded files (-n) is not reached
 
     global XML_toc                              # global Python dictionary for
                                                 # XML files
@@ -645,63 +1367,122 @@ def analyze_XML_file(file):                     # Function analyze_XML_file(file
     if debugging:
         print("+++ >CTANLoad:analyze_XML_file")
 
+    # analyze_XML_file --> reserve_PDF_file
+    # analyze_XML_file --> open_XML_file
+    # analyze_XML_file --> get_file_key
+    # analyze_XML_file --> queue_toc
+    # analyze_XML_file --> queue_add
     # analyze_XML_file --> dload_document_file
+    # analyze_XML_file --> dload_PDF_worker (via pdf_queue)
 
     error = False
 
-    try:                                        # try to open and parse a
+    if hrefs == None:                           # documentation not yet known
+        try:                                    # try to open and parse a
                                                 # XML file
-        f              = open(file, encoding="utf-8", mode="r")
-                                                # open the XML file
-        onePackage     = ET.parse(f)            # parse the XML file
-        onePackageRoot = onePackage.getroot()   # get root
-    except FileNotFoundError:                   # file not found
-        if verbose:
-            print(f"--- Warning: local XML file '{file2}' not found")
-    except:                                     # parsing not successfull
-        if verbose:
-            print(f"---- Warning: local XML file for",
-                  f"package '{file}' empty or not well-formed")
-        error = True
-        not_well_formed.add(re.sub(".xml", empty, file))
+            f              = open_XML_file(file)# open the XML file (a/o the
+                                                # compressed file)
+            onePackage     = ET.parse(f)        # parse the XML file
+            onePackageRoot = onePackage.getroot()
+                                                # get root
+            hrefs          = [g.get("href", empty) for g in
+                              onePackageRoot.iter("documentation")]
+                                                # href attributes of all
+                                                # documentation childs
+            f.close()                           # close the analyzed XML file
+            not_well_formed.discard(re.sub(".xml", empty, file))
+                                                # well-formed (again)
+        except FileNotFoundError:               # file not found
+            if verbose:
+                print(f"--- Warning: local XML file '{file}' not found")
+            error = True
+        except:                                 # parsing not successfull
+            if verbose:
+                print(f"---- Warning: local XML file for",
+                      f"package '{file}' empty or not well-formed")
+            error = True
+            not_well_formed.add(re.sub(".xml", empty, file))
                                                 # append name of file to the
                                                 #
                                                 # not_well_formed set
 
     if not error:
-        ll           = list(onePackageRoot.iter("documentation"))
-                                                # all documentation elements ==
-                                                # all documentation childs
-
-        for g in ll:
+        for href in hrefs:
                                                 # loop: all documentation childs
-            href = g.get("href", empty)         # get href attribute
             if ".pdf" in href:                  # there is ".pdf" in the
                                                 # string ==> PDF file
                 fnames  = re.split("/", href)   # split this string at "/"
                 href2   = href.replace("ctan:/", ctanUrl2)
                                                 # construct the correct URL
-                if href in XML_toc:             # href allready used?
-                    (tmp, fkey, onename) = XML_toc[href]
+                with dload_lock:                # XML_toc is shared by parallel
+                                                # downloads
+                    if href in XML_toc:         # href allready used?
+                        (tmp, fkey, onename) = XML_toc[href]
                                                 # get the components
-                    onename = onename.replace("+", "-")
-                else:                           # href not allready used?
-                    onename       = fnames[len(fnames) - 1]
+                        onename = onename.replace("+", "-")
+                    else:                       # href not allready used?
+                        onename       = fnames[len(fnames) - 1]
                                                 # get the file name
-                    fkey          = str(random.randint(1000000000, 9999999999))
-                                                # construct a random file name
-                    onename = onename.replace("+", "-")
-                    XML_toc[href] = (file, fkey, onename)
+                        fkey          = get_file_key(href)
+                                                # construct a unique file name
+                        onename = onename.replace("+", "-")
+                        XML_toc[href] = (file, fkey, onename)
                                                 # store this new file name
+                        queue_toc(href, XML_toc[href])
+                                                # record it in the job queue
                 if download:
-                    if dload_document_file(href2, fkey, onename, file):
+                    if pdf_queue != None:       # pipeline: PDF download stage
+                        job = (href2, fkey, onename, file)
+                        if reserve_PDF_file(file):
+                            queue_add("pdf", [(href2, job)])
+                            pdf_queue.put(job)  # waits, if the queue is full
+                    elif dload_document_file(href2, fkey, onename, file):
                                                 # load the PDF document
                         PDF_toc[fkey + "-" + onename] = file
-        f.close()                               # close the analyzed XML file
 
     if debugging:
         print("+++ <CTANLoad:analyze_XML_file")
 
+# ------------------------------------------------------------------
+def analyze_XML_worker():                       # Function analyze_XML_worker:
+                                                # Worker for the analysis of XML
+                                                # package files.
+    """
+    Worker for the analysis of XML package files (pipeline stage 2).
+
+    Takes the next XML file from analyze_queue, until None is found.
+
+    no parameter
+
+    global variable:
+    analyze_queue   queue: XML files to be analyzed
+
+    possible messages:
+    + Warning: XML file '{0}' not analyzed
+    """
+
+    # 2.54   2026-10-18 new function analyze_XML_worker
+    # 2.60   2026-10-18 in analyze_XML_worker: finished packages recorded in
+    #                   the job queue
+
+    # analyze_XML_worker --> analyze_XML_file
+    # analyze_XML_worker --> queue_set
+
+    queue = analyze_queue                       # the queue of this run
+
+    while True:
+        file = queue.get()
+        if file == None:                        # end of the stage
+            return
+        try:
+            analyze_XML_file(file)              # analyze the XML file
+            f = file[0:-len(ext)]               # name of the package
+            queue_set("xml", f, "done", XML_state.get(f, None))
+        except:                                 # any unspecified error
+            if verbose:
+                print(f"--- Warning: XML file '{file}' not analyzed")
+                print("--- ", sys.exc_info()[0])
+
 # ------------------------------------------------------------------
 def call_check():                               # Function call_check: Processes
                                                 # all necessary steps for a
@@ -730,11 +1511,11 @@ def call_check():                               # Function call_check: Processes
                         packagesauthorpackage_file
     """
 
+    # 2.59   2026-10-18 catalog files via dload_catalogs (in parallel a/o
+    #                   from cache)
+
     # call_check --> get_PDF_files
-    # call_check --> dload_topics
-    # call_check --> dload_authors
-    # call_check --> dload_licenses
-    # call_check --> dload_packages
+    # call_check --> dload_catalogs
     # call_check --> generate_topicspackages
     # call_check --> generate_pickle1
     # call_check --> generate_lists
@@ -770,10 +1551,10 @@ def call_check():                               # Function call_check: Processes
 
     get_PDF_files(direc)                        # get a list with all the PDF
                                                 # files in direc
-    dload_topics()                              # load the file topics.xml
-    dload_authors()                             # load the file authors.xml
-    dload_licenses()                            # load the file licenses.xml
-    dload_packages()                            # load the file packages.xml
+    dload_catalogs()                            # loads the files topics.xml,
+                                                # authors.xml, licenses.xml,
+                                                # packages.xml (in parallel
+                                                # a/o from cache)
     generate_topicspackages()                   # Generate topicspackages, ...
     
     thr3 = Thread(target=generate_pickle1)      # dump authors, packages,
@@ -797,6 +1578,213 @@ def call_check():                               # Function call_check: Processes
     if debugging:
         print("+++ <CTANLoad:call_check")
 
+# ------------------------------------------------------------------
+def call_export():                              # Function call_export: Exports
+                                                # the local XML files into an
+                                                # archive.
+    """
+    Exports the local XML files (catalog and package files) into an archive
+    (option -ex) in the layout of a CTAN mirror: xml/2.0/authors, ...,
+    xml/2.0/pkg/<name>; compressed XML files (-z) are exported uncompressed.
+    The archive can be imported (-im) a/o used as source (-src).
+
+    The format follows the name extension of the archive: .zip, .tar,
+    .tar.gz a/o .tgz, .tar.bz2, .tar.xz.
+
+    no parameter
+
+    possible messages:
+    + Error: archive '{0}' not written
+    + Info: {0} XML files exported to '{1}'
+    """
+
+    # 2.70   2026-10-18 new function call_export
+
+    # call_export --> get_inventory
+    # call_export --> open_XML_file
+
+    if debugging:
+        print("+++ >CTANLoad:call_export")
+
+    inv   = get_inventory()                     # files in the OS folder
+    files = set()                               # XML files (a file and its
+    for f in inv:                               # compressed form only once)
+        if f.endswith(gz_ext):
+            f = f[0:-len(gz_ext)]
+        if p4.match(f):
+            files.add(f)
+
+    name  = export_archive.lower()              # format of the archive
+    if name.endswith(".zip"):
+        mode = None
+    elif name.endswith(".tar.gz") or name.endswith(".tgz"):
+        mode = "w:gz"
+    elif name.endswith(".tar.bz2"):
+        mode = "w:bz2"
+    elif name.endswith(".tar.xz"):
+        mode = "w:xz"
+    else:
+        mode = "w"
+
+    n = 0                                       # number of exported files
+    try:
+        if mode == None:
+            out = zipfile.ZipFile(export_archive, "w", zipfile.ZIP_DEFLATED)
+        else:
+            out = tarfile.open(export_archive, mode)
+        with out:
+            for f in sorted(files):
+                if f in exclusion:              # catalog file
+                    member = "xml/2.0/" + f[0:-len(ext)]
+                else:                           # package file
+                    member = "xml/2.0/pkg/" + f[0:-len(ext)]
+                with open_XML_file(f) as inp:
+                    data = inp.read().encode("utf-8")
+                stamp = (inv.get(f) or inv.get(f + gz_ext))[1]
+                if mode == None:
+                    info = zipfile.ZipInfo(member,
+                                           time.localtime(stamp)[0:6])
+                    info.compress_type = zipfile.ZIP_DEFLATED
+                    out.writestr(info, data)
+                else:
+                    info       = tarfile.TarInfo(member)
+                    info.size  = len(data)
+                    info.mtime = int(stamp)
+                    out.addfile(info, io.BytesIO(data))
+                n = n + 1
+    except (OSError, tarfile.TarError, zipfile.BadZipFile) as exc:
+        print(f"--- Error: archive '{export_archive}' not written")
+        print("--- Error:", exc)
+        sys.exit("[CTANLoad] Error: programm terminated")
+
+    if verbose:
+        print(f"--- Info: {n} XML files exported to '{export_archive}'")
+
+    if debugging:
+        print("+++ <CTANLoad:call_export")
+
+# ------------------------------------------------------------------
+def call_import():                              # Function call_import: Imports
+                                                # package XML files from an
+                                                # archive.
+    """
+    Imports the package XML files of an archive (option -im) in one streaming
+    pass: tar (also .tar.gz, .tgz, .tar.bz2, .tar.xz) a/o zip; members
+    xml/2.0/pkg/<name> (layout of a CTAN mirror, see -ex), <name>.xml a/o
+    <name>.xml.gz (in any folder). Only packages of the catalog 'packages'
+    are imported; the catalog files are loaded as usual (cache, -src a/o
+    CTAN).
+
+    Each XML file is stored in the OS folder (compressed with -z), recorded
+    in XML_state (hash; no validators, the next load compares the hash) and
+    analyzed (XML_toc); the derived dictionaries and the pickle files are
+    generated afterwards.
+
+    Rewrites the global XML_state, imported.
+
+    no parameter
+
+    global variables:
+    XML_state           python dictionary: validators of the XML files
+    imported            counter for imported XML files
+
+    possible messages:
+    + Error: archive '{0}' not found a/o not usable
+    + Error: programm terminated
+    + Info: {0} package XML files imported from '{1}'
+    + Info: XML file for package '{0}' imported
+    """
+
+    # 2.70   2026-10-18 new function call_import
+
+    # call_import --> get_PDF_files
+    # call_import --> load_XML_toc
+    # call_import --> load_XML_state
+    # call_import --> set_PDF_toc
+    # call_import --> dload_catalogs
+    # call_import --> store_XML_file
+    # call_import --> analyze_XML_file
+    # call_import --> generate_topicspackages
+    # call_import --> generate_pickle1
+    # call_import --> generate_pickle2
+    # call_import --> generate_pickle3
+
+    global XML_state                            # python dictionary: validators
+                                                # of the XML files
+    global imported                             # counter for imported XML
+                                                # files
+
+    if debugging:
+        print("+++ >CTANLoad:call_import")
+
+    get_PDF_files(direc)                        # Lists all PDF files in a
+                                                # specified OS folder.
+    load_XML_toc()                              # Loads pickle file 2
+                                                # (which contains XML_toc)
+    load_XML_state()                            # Loads pickle file 3
+                                                # (which contains XML_state)
+    set_PDF_toc()
+    dload_catalogs()                            # loads the files topics.xml,
+                                                # authors.xml, licenses.xml,
+                                                # packages.xml (in parallel
+                                                # a/o from cache)
+
+    def members():                              # (name, reader) for each
+        if zipfile.is_zipfile(import_archive):  # member of the archive
+            with zipfile.ZipFile(import_archive) as z:
+                for m in z.infolist():
+                    if not m.is_dir():
+                        yield (m.filename, lambda m=m: z.read(m))
+        else:                                   # tar: stream (no index)
+            with tarfile.open(import_archive, "r|*") as t:
+                for m in t:
+                    if m.isfile():
+                        yield (m.name, lambda m=m: t.extractfile(m).read())
+
+    try:
+        for (mname, read) in members():
+            base = mname.split("/")[-1]
+            if base.endswith(ext + gz_ext):     # <name>.xml.gz
+                (f, packed) = (base[0:-len(ext + gz_ext)], True)
+            elif base.endswith(ext):            # <name>.xml
+                (f, packed) = (base[0:-len(ext)], False)
+            elif ("/" + mname).endswith("/pkg/" + base):
+                (f, packed) = (base, False)     # xml/2.0/pkg/<name>
+            else:
+                continue
+            if (f not in packages) or (f + ext in exclusion):
+                continue                        # not a package file
+            data = read()
+            if packed:
+                data = gzip.decompress(data)
+            with open(f + ext, "wb") as out:
+                out.write(data)
+            store_XML_file(f + ext)             # compressed (-z) a/o not
+            XML_state[f] = (empty, empty, hashlib.sha256(data).hexdigest(),
+                            False)              # hash of the content
+            analyze_XML_file(f + ext)           # XML_toc
+            imported = imported + 1
+            if verbose:
+                print(f"----- Info: XML file for package '{f}' imported")
+    except (OSError, EOFError, tarfile.TarError, zipfile.BadZipFile,
+            zlib.error) as exc:
+        print(f"--- Error: archive '{import_archive}' not found a/o not",
+              "usable")
+        print("--- Error:", exc)
+        sys.exit("[CTANLoad] Error: programm terminated")
+
+    if verbose:
+        print(f"--- Info: {imported} package XML files imported from",
+              f"'{import_archive}'")
+
+    generate_topicspackages()                   # Generates topicspackages, ...
+    generate_pickle2()                          # dump XML_toc
+    generate_pickle1()                          # dump some lists
+    generate_pickle3()                          # dump XML_state
+
+    if debugging:
+        print("+++ <CTANLoad:call_import")
+
 # ------------------------------------------------------------------
 def call_load():                                # Function call_load: Processes
                                                 # all steps for a complete
@@ -829,27 +1817,38 @@ def call_load():                                # Function call_load: Processes
     no_np               number of packages selected per n<mes
     no_lp               number of packages selected per licenses
     no_ly               number of packages selected per years
-
-    possible error message:
-    + Warning: no correct XML file for any specified package found
     """
 
     # 2.46   2025-02-04 messages in functions' __doc__ texts listed
+    # 2.53   2026-10-18 in call_load: XML_state loaded and dumped (pickle file 3)
+    # 2.59   2026-10-18 catalog files via dload_catalogs (in parallel a/o
+    #                   from cache)
+    # 2.60   2026-10-18 in call_load: persistent job queue; an interrupted load
+    #                   is resumed
+    # 2.63   2026-10-18 in call_load: packages ordered by the priority policy
+    #                   (-p); job queue kept, if a budget is exhausted
+    # 2.64   2026-10-18 in call_load: selection of the packages moved to
+    #                   select_packages
+    # 2.69   2026-10-18 in call_load: failed packages of the last session
+    #                   first
+    # 2.76   2026-10-18 in call_load: failed packages and PDF jobs outside
+    #                   the selection dropped from the job queue
 
     # call_load --> get_PDF_files
-    # call_load --> dload_topics
-    # call_load --> dload_authors
-    # call_load --> dload_licenses
-    # call_load --> dload_packages
+    # call_load --> dload_catalogs
     # call_load --> load_XML_toc
+    # call_load --> load_XML_state
+    # call_load --> queue_open
     # call_load --> set_PDF_toc
+    # call_load --> select_packages
+    # call_load --> queue_prune
+    # call_load --> order_packages
+    # call_load --> queue_add
     # call_load --> dload_XML_files
     # call_load --> generate_pickle1
     # call_load --> generate_pickle2
-    # call_load --> get_xyz_lpt
-    # call_load --> get_xyz_lap
-    # call_load --> get_xyz_llp
-    # call_load --> get_year_set
+    # call_load --> generate_pickle3
+    # call_load --> queue_close
 
     global PDF_toc                              # global Python dictionary for
                                                 # PDF files
@@ -891,67 +1890,63 @@ def call_load():                                # Function call_load: Processes
                                                 # specified OS folder.
     load_XML_toc()                              # Loads pickle file 2
                                                 # (which contains XML_toc)
+    load_XML_state()                            # Loads pickle file 3
+                                                # (which contains XML_state)
+    if len(XML_toc) == 0:                       # XML_toc lost: all XML files
+        XML_state.clear()                       # have to be analyzed again
+    (done, pdfs, failed) = queue_open()         # job queue; takes over the
+                                                # results of an interrupted load
+                                                # and the failed jobs
     set_PDF_toc()
 
-    dload_topics()                              # loads the file topics.xml
-    dload_authors()                             # loads the file authors.xml
-    dload_licenses()                            # loads the file licenses.xml
-    dload_packages()                            # loads the file packages.xml
+    dload_catalogs()                            # loads the files topics.xml,
+                                                # authors.xml, licenses.xml,
+                                                # packages.xml (in parallel
+                                                # a/o from cache)
     generate_topicspackages()                   # Generates topicspackages, ...
 
-    all_packages = set()                        # initializes set
-    for f in packages:
-        all_packages.add(f)                     # constructs a set object
-                                                # (packages has not the right
-                                                # format)
+    tmp_pp = select_packages()                  # packages which match all
+                                                # templates
+    (failed, pdfs) = queue_prune(tmp_pp, failed, pdfs)
+                                                # jobs, which the selection
+                                                # does not reach, dropped from
+                                                # the job queue
+
+    tmp_p  = order_packages(tmp_pp - done)      # built an intersection
+                                                # (without packages finished by
+                                                # an interrupted load), ordered
+                                                # by the priority policy (-p)
+    tmp_p  = [f for f in tmp_p if f in failed] + \
+             [f for f in tmp_p if f not in failed]
+                                                # failed packages of the last
+                                                # session first
+    queue_add("xml", [(f, None) for f in tmp_p])
+                                                # record the packages in the
+                                                # job queue
+
+    dload_XML_files(tmp_p, pdfs)                # load and processe all required
+                                                # XML files (in series or in
+                                                # parallel)
         
-    tmp_tp = all_packages.copy()                # initializes tmp_tp (topics)
-    tmp_ap = all_packages.copy()                # initializes tmp_ap (authors)
-    tmp_np = all_packages.copy()                # initializes tmp_np (names)
-    tmp_lp = all_packages.copy()                # initializes tmp_lp (licenses)
-    tmp_ly = all_packages.copy()                # initializes tmp_ly (years)
+    thr1 = Thread(target=generate_pickle2)      # dump XML_toc via pickle file
+                                                # via thread
+    thr1.start()
+    thr1.join()
+    thr2 = Thread(target=generate_pickle1)      # dump some lists to pickle file
+    thr2.start()
+    thr2.join()
+    thr3 = Thread(target=generate_pickle3)      # dump XML_state via pickle file
+                                                # via thread
+    thr3.start()
+    thr3.join()
 
-    if (name_template != name_template_default):
-        tmp_np = get_package_set()              # analyze 'packages' for name
-                                                # name templates
-    if (key_template != key_template_default):
-        tmp_tp = get_xyz_lpt()                  # load xyz.lpt and analyze it
-                                                # for key templates
-    if (author_template != author_template_default):
-        tmp_ap = get_xyz_lap()                  # load xyz.lap and analyze it
-                                                # for author templates
-    if (license_template != license_template_default):
-        tmp_lp = get_xyz_llp()                  # load xyz.llp and analyze it
-                                                # for license templates
-    if (year_template != year_template_default):
-        tmp_ly = get_year_set()                 # look for packages with the
-                                                # correct year templates
-
-    tmp_pp = tmp_tp & tmp_ap & tmp_np & tmp_lp & tmp_ly
-                                                # built an set intersection
-    if len(tmp_pp) == 0:
-        if verbose:
-            print("--- Warning: no correct XML file for any specified",
-                  " package found")
-
-    tmp_p  = sorted(tmp_pp)                     # built an intersection
-
-    dload_XML_files(tmp_p)                      # load and processe all required
-                                                # XML files in series
-
-    no_tp = len(tmp_tp)
-    no_ap = len(tmp_ap)
-    no_np = len(tmp_np)
-    no_lp = len(tmp_lp)
-    no_ly = len(tmp_ly)
-        
-    thr1 = Thread(target=generate_pickle2)      # dump XML_toc via pickle file
-                                                # via thread
-    thr1.start()
-    thr1.join()
-    thr2 = Thread(target=generate_pickle1)      # dump some lists to pickle file
-    thr2.start()
-    thr2.join()
+    if budget_exhausted:                        # load incomplete: the job
+        if verbose:                             # queue is kept
+            print("--- Info: job queue kept; the load is continued in the",
+                  "next session")
+    else:
+        queue_close()                           # load complete: job queue no
+                                                # longer needed
     
     if debugging:
         print("+++ <CTANLoad:call_load")
@@ -982,11 +1977,11 @@ def call_plain():                               # Function call_plain:
                         packagesauthorpackage_file
     """
 
+    # 2.59   2026-10-18 catalog files via dload_catalogs (in parallel a/o
+    #                   from cache)
+
     # call_plain --> get_PDF_files
-    # call_plain --> dload_topics
-    # call_plain --> dload_authors
-    # call_plain --> dload_licenses
-    # call_plain --> dload_packages
+    # call_plain --> dload_catalogs
     # call_plain --> generate_topicspackages
     # call_plain --> generate_pickle1
     
@@ -1016,10 +2011,10 @@ def call_plain():                               # Function call_plain:
     
     get_PDF_files(direc)                        # List all PDF files in a
                                                 # specified OS folder.
-    dload_topics()                              # load the file topics.xml
-    dload_authors()                             # load the file authors.xml
-    dload_licenses()                            # load the file licenses.xml
-    dload_packages()                            # load the file packages.xml
+    dload_catalogs()                            # loads the files topics.xml,
+                                                # authors.xml, licenses.xml,
+                                                # packages.xml (in parallel
+                                                # a/o from cache)
     generate_topicspackages()                   # generate topicspackages, ...
     thr3 = Thread(target=generate_pickle1)      # dump authors, packages, topics,
                                                 # licenses, topicspackages,
@@ -1032,6 +2027,425 @@ def call_plain():                               # Function call_plain:
     if debugging:
         print("+++ <CTANLoad:call_plain")
 
+# ------------------------------------------------------------------
+def call_plan():                                # Function call_plan: Plans a
+                                                # load without loading (dry
+                                                # run).
+    """
+    Plans a load without loading (dry run, option -pl).
+
+    Compares the selected packages (see select_packages; without any template:
+    all packages) with the local XML files (get_XML_files), XML_toc and
+    XML_state:
+    new      selected package without local XML file
+    stale    selected package with local XML file, which would be downloaded
+             and analyzed again (no validators, -fr, PDF files incomplete)
+    current  selected package with local XML file, which is requested
+             conditionally (probably not modified)
+    removed  local XML file without package on CTAN
+
+    The number of transfers (XML and PDF files) and the number of bytes are
+    estimated on the basis of the local files (average sizes). Only the
+    catalog files are downloaded (a/o taken from the cache, -ttl); no
+    package XML file and no PDF file is loaded.
+
+    The plan is printed on terminal and written to xyz.plan.json.
+
+    Rewrites the global PDF_toc, XML_toc, XML_state, authors, licenses,
+    packages, topics, topicspackages, yearpackages.
+
+    no parameters
+
+    global variables:
+    PDF_toc             global Python dictionary for PDF files
+    XML_toc             global Python dictionary
+    XML_state           python dictionary: validators of the XML files
+    authors             global Python dictionary with authors
+    licenses            global Python dictionary with licenses
+    packages            global Python dictionary with packages
+    topics              global Python dictionary with topics
+    topicspackages      python dictionary: list of topics and their packages
+    yearpackages        python dictionary: list of years and their
+                        packagesauthorpackage_file
+
+    possible messages:
+    + Info: limit of downloaded files (-n {0}) exceeded
+    + Info: plan: new on CTAN:
+    + Info: plan: removed from CTAN:
+    + Info: plan: stale:
+    + Info: plan written to '{0}'
+    + Warning: plan not written to '{0}'
+    + Plan (dry run):
+    + PDF files (conditional request)
+    + PDF files (transfer)
+    + XML files (conditional request)
+    + XML files (transfer)
+    + bytes (transfer)
+    + packages (current)
+    + packages (new on CTAN)
+    + packages (removed from CTAN)
+    + packages (stale)
+    + selected packages
+    """
+
+    # 2.64   2026-10-18 new function call_plan
+    # 2.66   2026-10-18 in call_plan: inventory of the OS folder
+    # 2.76   2026-10-18 in call_plan: packages with missing PDF files a/o
+    #                   XML files which are not well-formed are stale
+    # 2.76   2026-10-18 in call_plan: the tests of the load are shared
+    #                   (get_XML_cond, get_PDF_cond)
+
+    # call_plan --> get_PDF_files
+    # call_plan --> load_XML_toc
+    # call_plan --> load_XML_state
+    # call_plan --> set_PDF_toc
+    # call_plan --> dload_catalogs
+    # call_plan --> generate_topicspackages
+    # call_plan --> select_packages
+    # call_plan --> get_inventory
+    # call_plan --> get_XML_files
+    # call_plan --> check_PDF_presence
+    # call_plan --> get_XML_cond
+    # call_plan --> get_PDF_cond
+
+    global PDF_toc                              # global Python dictionary for
+                                                # PDF files
+    global XML_toc                              # global Python dictionary
+    global XML_state                            # python dictionary: validators
+                                                # of the XML files
+    global authors                              # global Python dictionary with
+                                                # authors
+    global licenses                             # global Python dictionary with
+                                                # licenses
+    global packages                             # global Python dictionary with
+                                                # packages
+    global topics                               # global Python dictionary with
+                                                # topics
+    global topicspackages                       # python dictionary: list of
+                                                # topics and their packages
+    global yearpackages                         # python dictionary: list of
+                                                # years and their
+                                                # packagesauthorpackage_file
+
+    if debugging:
+        print("+++ >CTANLoad:call_plan")
+
+    get_PDF_files(direc)                        # Lists all PDF files in a
+                                                # specified OS folder.
+    load_XML_toc()                              # Loads pickle file 2
+                                                # (which contains XML_toc)
+    load_XML_state()                            # Loads pickle file 3
+                                                # (which contains XML_state)
+    if len(XML_toc) == 0:                       # XML_toc lost: all XML files
+        XML_state.clear()                       # have to be analyzed again
+    set_PDF_toc()
+
+    dload_catalogs()                            # loads the files topics.xml,
+                                                # authors.xml, licenses.xml,
+                                                # packages.xml (in parallel
+                                                # a/o from cache)
+    generate_topicspackages()                   # Generates topicspackages, ...
+    selected = select_packages()                # packages which match all
+                                                # templates
+
+    inv      = get_inventory()                  # files in the OS folder
+    local    = set()                            # packages with local XML file
+    xsizes   = []                               # sizes of the local XML files
+    for f in get_XML_files(direc):
+        local.add(re.sub("[.]xml$", empty, f))
+        xsizes.append((inv.get(f) or inv[f + gz_ext])[0])
+    psizes   = [inv[f][0] for f in PDF_toc]     # sizes of the local PDF files
+    pdfs     = {}                               # PDF files per XML file:
+    for href in XML_toc:                        # pdfs[XML file] = [href, ...]
+        pdfs.setdefault(XML_toc[href][0], []).append(href)
+    avg_xml  = sum(xsizes) / len(xsizes) if len(xsizes) > 0 else 0
+                                                # average size of a XML file
+    avg_pdf  = sum(psizes) / len(psizes) if len(psizes) > 0 else 0
+                                                # average size of a PDF file
+    avg_npdf = len(XML_toc) / len(local) if len(local) > 0 else 0
+                                                # average number of PDF files
+                                                # per package
+
+    new      = sorted(selected - local)         # new on CTAN (a/o never
+                                                # loaded)
+    removed  = sorted(local - set(packages))    # removed from CTAN
+    stale    = []                               # to be downloaded and analyzed
+    current  = []                               # to be requested conditionally
+    npdf     = 0                                # PDF files to be transferred
+    npdfc    = 0                                # PDF files (conditional)
+    nbytes   = len(new) * avg_xml               # estimated bytes
+    if download:                                # PDF files of the new packages:
+        npdf   = round(len(new) * avg_npdf)     # estimated
+        nbytes = nbytes + npdf * avg_pdf
+
+    check_PDF_presence()                        # packages with missing PDF
+                                                # files (-f)
+    for f in sorted(selected & local):          # packages with local XML file
+        if get_XML_cond(f) != None:             # conditional request
+            current.append(f)
+            continue
+        stale.append(f)
+        nbytes = nbytes + avg_xml
+        if not download:
+            continue
+        for href in pdfs.get(f + ext, []):
+            (xlfn, fkey, plfn) = XML_toc[href]
+            href2  = href.replace("ctan:/", ctanUrl2)
+                                                # PDF_state: by URL
+            pstate = PDF_state.get(href2, None)
+            lname  = fkey + "-" + plfn.replace("+", "-")
+                                                # local file name
+            if get_PDF_cond(href2, lname) != None:
+                npdfc  = npdfc + 1              # conditional request
+            else:
+                npdf   = npdf + 1
+                nbytes = nbytes + (pstate[3] if pstate != None else avg_pdf)
+
+    nxml     = len(new) + len(stale)            # XML files to be transferred
+    result   = {"date"      : actDate + " " + actTime,
+                "program"   : prg_name + " " + prg_version,
+                "source"    : source,
+                "download"  : download,
+                "refresh"   : refresh,
+                "selected"  : len(selected),
+                "new"       : new,
+                "stale"     : stale,
+                "current"   : len(current),
+                "removed"   : removed,
+                "transfers" : {"xml"             : nxml,
+                               "xml_conditional" : len(current),
+                               "pdf"             : npdf,
+                               "pdf_conditional" : npdfc},
+                "bytes"     : round(nbytes),
+                "limit"     : number,
+                "exceeded"  : nxml + npdf > number}
+                                                # plan (JSON)
+
+    l = left + 1                                # layout parameter
+    r = 7                                       # layout parameter
+    print("\n[CTANLoad] Plan (dry run):")
+    print("selected packages:".ljust(l), str(len(selected)).rjust(r))
+    print("packages (new on CTAN):".ljust(l), str(len(new)).rjust(r))
+    print("packages (stale):".ljust(l), str(len(stale)).rjust(r))
+    print("packages (current):".ljust(l), str(len(current)).rjust(r))
+    print("packages (removed from CTAN):".ljust(l), str(len(removed)).rjust(r))
+    print("XML files (transfer):".ljust(l), str(nxml).rjust(r))
+    print("XML files (conditional request):".ljust(l),
+          str(len(current)).rjust(r))
+    if download:
+        print("PDF files (transfer):".ljust(l), str(npdf).rjust(r),
+              "(estimated)")
+        print("PDF files (conditional request):".ljust(l),
+              str(npdfc).rjust(r))
+    print("bytes (transfer):".ljust(l), str(round(nbytes)).rjust(r),
+          "(estimated)")
+    if result["exceeded"]:
+        print(f"--- Info: limit of downloaded files (-n {number}) exceeded")
+    if verbose:
+        if len(new) > 0:
+            print("--- Info: plan: new on CTAN:", new)
+        if len(stale) > 0:
+            print("--- Info: plan: stale:", stale)
+        if len(removed) > 0:
+            print("--- Info: plan: removed from CTAN:", removed)
+
+    try:
+        with open(plan_file, "w", encoding="utf-8") as out:
+            json.dump(result, out, indent=2, ensure_ascii=False)
+        if verbose:
+            print(f"--- Info: plan written to '{plan_file}'")
+    except OSError:
+        print(f"--- Warning: plan not written to '{plan_file}'")
+
+    if debugging:
+        print("+++ <CTANLoad:call_plan")
+
+# ------------------------------------------------------------------
+def call_verify():                              # Function call_verify:
+                                                # Verifies the local XML and
+                                                # PDF files.
+    """
+    Verifies the local XML and PDF files (option -vf).
+
+    Each local file with a record in XML_state (SHA-256) a/o PDF_state
+    (SHA-256, size) is hashed again; the files are hashed in parallel by
+    hash_jobs workers (all cores) and read in blocks. Corrupt files (other
+    size a/o hash) are deleted and downloaded again (pipeline of
+    dload_XML_files, options -j, -jp, -n, -nb, -tb).
+
+    Rewrites the global PDF_toc, XML_toc, XML_state, PDF_state, PDF_store,
+    mismatches.
+
+    no parameters
+
+    global variables:
+    PDF_toc             global Python dictionary for PDF files
+    XML_toc             global Python dictionary
+    XML_state           python dictionary: validators of the XML files
+    PDF_state           python dictionary: validators and hashes of the PDF
+                        files
+    PDF_store           python dictionary: local PDF files by content
+    mismatches          counter for corrupt local files
+
+    possible messages:
+    + Info: verification: {0} local files verified, {1} corrupt
+    + Warning: local file '{0}' corrupt (size a/o hash); downloaded again
+    """
+
+    # 2.65   2026-10-18 new function call_verify
+    # 2.66   2026-10-18 in call_verify: inventory of the OS folder
+
+    # call_verify --> get_PDF_files
+    # call_verify --> load_XML_toc
+    # call_verify --> load_XML_state
+    # call_verify --> set_PDF_toc
+    # call_verify --> get_inventory
+    # call_verify --> verify_worker
+    # call_verify --> dload_XML_files
+    # call_verify --> generate_pickle2
+    # call_verify --> generate_pickle3
+
+    global PDF_toc                              # global Python dictionary for
+                                                # PDF files
+    global XML_toc                              # global Python dictionary
+    global XML_state                            # python dictionary: validators
+                                                # of the XML files
+    global PDF_state                            # python dictionary: validators
+                                                # and hashes of the PDF files
+    global PDF_store                            # python dictionary: local PDF
+                                                # files by content
+    global mismatches                           # counter for corrupt local
+                                                # files
+
+    if debugging:
+        print("+++ >CTANLoad:call_verify")
+
+    get_PDF_files(direc)                        # Lists all PDF files in a
+                                                # specified OS folder.
+    load_XML_toc()                              # Loads pickle file 2
+                                                # (which contains XML_toc)
+    load_XML_state()                            # Loads pickle file 3
+                                                # (which contains XML_state,
+                                                # PDF_state)
+    set_PDF_toc()
+
+    todo    = Queue(queue_size)                 # files to be hashed
+    bad     = []                                # corrupt files
+    workers = []
+    for i in range(hash_jobs):
+        thr = Thread(target=verify_worker, args=(todo, bad))
+        thr.start()
+        workers.append(thr)
+
+    inv     = get_inventory()                   # files in the OS folder
+    for f in sorted(XML_state):                 # XML files: hash of the
+        for xname in [f + ext, f + ext + gz_ext]:
+            if xname in inv:                    # (uncompressed) content
+                todo.put(("xml", f, direc + xname, XML_state[f][2], None))
+                break
+    for href in sorted(PDF_state):              # PDF files: hash and size
+        (etag, modified, sha, size, file) = PDF_state[href]
+        if path.basename(file) in inv:
+            todo.put(("pdf", href, file, sha, size))
+
+    for thr in workers:                         # end of the hashing
+        todo.put(None)
+    for thr in workers:
+        thr.join()
+
+    pdfs  = {}                                  # local PDF file --> XML file
+    for href in XML_toc:
+        (xlfn, fkey, plfn) = XML_toc[href]
+        pdfs[fkey + "-" + plfn] = xlfn
+
+    xjobs = []                                  # XML files to be downloaded
+    pjobs = []                                  # PDF files to be downloaded
+    for (kind, name, file, sha, size) in sorted(bad):
+        if verbose:
+            print(f"--- Warning: local file '{file}' corrupt (size a/o",
+                  "hash); downloaded again")
+        try:
+            os.remove(file)                     # corrupt file deleted
+        except OSError:
+            pass
+        inv.pop(path.basename(file), None)
+        if kind == "xml":                       # no validators: downloaded
+            del XML_state[name]                 # and analyzed again
+            xjobs.append(name)
+        else:                                   # no validators: downloaded
+            del PDF_state[name]                 # again
+            if PDF_store.get(sha, None) == file:
+                del PDF_store[sha]              # do not share the corrupt file
+            local = path.basename(file)
+            PDF_toc.pop(local, None)
+            (fkey, onename) = local.split("-", 1)
+            pjobs.append((name, fkey, onename, pdfs.get(local, empty)))
+    mismatches = len(bad)
+
+    if len(bad) > 0:
+        dload_XML_files(xjobs, pjobs)           # download the corrupt files
+                                                # again (pipeline)
+        thr1 = Thread(target=generate_pickle2)  # dump XML_toc via pickle file
+                                                # via thread
+        thr1.start()
+        thr1.join()
+        thr3 = Thread(target=generate_pickle3)  # dump XML_state via pickle file
+                                                # via thread
+        thr3.start()
+        thr3.join()
+
+    if verbose:
+        print(f"--- Info: verification: {verified} local files verified,",
+              f"{mismatches} corrupt")
+
+    if debugging:
+        print("+++ <CTANLoad:call_verify")
+
+# ------------------------------------------------------------------
+def check_budget():                             # Function check_budget: Checks
+                                                # the byte and time budgets.
+    """
+    Checks the byte budget (option -nb) and the time budget (option -tb) of
+    the downloads.
+
+    Returns True, if there is budget left.
+
+    Rewrites the global budget_exhausted.
+
+    no parameter
+
+    global variable:
+    budget_exhausted    Flag: a budget is exhausted
+
+    possible message:
+    + Info: budget exhausted ({0}); the rest is loaded in the next session
+    """
+
+    # 2.63   2026-10-18 new function check_budget
+
+    global budget_exhausted                     # Flag: a budget is exhausted
+
+    if debugging:
+        print("+++ -CTANLoad:check_budget")
+
+    if budget_exhausted:                        # once exhausted, always
+        return False                            # exhausted
+    reason = empty
+    if (byte_budget > 0) and (dbytes >= byte_budget):
+        reason = f"{dbytes} bytes"
+    elif (time_budget > 0) and (time.time() - budget_start >= time_budget):
+        reason = f"{time_budget} s"
+    if reason == empty:
+        return True
+
+    with dload_lock:
+        if not budget_exhausted:                # message only once
+            budget_exhausted = True
+            if verbose:
+                print(f"--- Info: budget exhausted ({reason}); the rest is",
+                      "loaded in the next session")
+    return False
+
 # ------------------------------------------------------------------
 def check_integrity(always=False):              # Function check_integrity():
                                                 # Checks integrity (tests for
@@ -1039,7 +2453,12 @@ def check_integrity(always=False):              # Function check_integrity():
     """
     Checks integrity (tests for inconsistencies).
 
-    Rewrites the global corrected, PDF_toc, no_error, ok, PDF_XML.
+    PDF files which are empty a/o not valid (see check_PDF_file) are deleted;
+    their packages are marked in XML_state, so that the next load (-f)
+    downloads them again.
+
+    Rewrites the global corrected, PDF_toc, no_error, ok, PDF_XML,
+    PDF_notloaded, XML_state.
 
     parameter:
     always : generation of pickle2 can be controlled
@@ -1050,12 +2469,16 @@ def check_integrity(always=False):              # Function check_integrity():
     no_error            Flag: no error                                 
     ok                  Flag: ok
     PDF_XML             Python set: inconsistencies with PDF file
+    PDF_notloaded       Python set: PDF not downloaded
+    XML_state           python dictionary: validators of the XML files
 
     possible (error) messages:
     + Warning: entry '{0}'
     + Warning: XML file '{0}' in OS deleted
     + Warning: entry '{0}' in dictionary deleted
     + Warning: entry '{0}' ({1}) in dictionary, but OS file is empty
+    + Warning: entry '{0}' ({1}) in dictionary, but OS file is not a valid PDF
+      file
     + Warning: entry '{0}' in dictionary, but OS file not found
     + Info: no error with integrity check
     """
@@ -1063,9 +2486,19 @@ def check_integrity(always=False):              # Function check_integrity():
     # check_integrity --> load_XML_tocdin dictionary, but OS file is empty
     # check_integrity --> generate_pickle2
     # check_integrity --> verify_PDF_filespossib
+    # check_integrity --> get_inventory
+    # check_integrity --> validate_PDF_files
+    # check_integrity --> load_XML_state
+    # check_integrity --> generate_pickle3
 
     # 2.46   2025-02-04 messages in functions' __doc__ texts listed
     # 2.49   2025-02-11 more f-strings
+    # 2.62   2026-10-18 in check_integrity: compressed XML files (-z)
+    # 2.66   2026-10-18 in check_integrity: inventory of the OS folder instead
+    #                   of single tests (existence, size)
+    # 2.67   2026-10-18 in check_integrity: structural validation of the PDF
+    #                   files; packages with deleted PDF files marked for the
+    #                   next load
 
     global corrected                            # number of corrections
     global PDF_toc                              # PDF_toc, structure:
@@ -1075,6 +2508,9 @@ def check_integrity(always=False):              # Function check_integrity():
     global ok                                   # Flag: ok
     global PDF_XML                              # Python set: inconsistencies
                                                 # with PDF file
+    global PDF_notloaded                        # Python set: PDF not downloaded
+    global XML_state                            # python dictionary: validators
+                                                # of the XML files
     
     if debugging:
         print("+++ >CTANLoad:check_integrity")
@@ -1086,6 +2522,13 @@ def check_integrity(always=False):              # Function check_integrity():
                                                 # XML_toc[href] =
                                                 # (file, fkey, onename)
     no_error = True
+    inv      = get_inventory()                  # files in the OS folder:
+                                                # inv[name] = (size, mtime)
+    invalid  = validate_PDF_files(
+                   set(t[1] + "-" + t[2] for t in XML_toc.values()
+                       if inv.get(t[1] + "-" + t[2], (0,))[0] != 0))
+                                                # PDF files which are not valid
+                                                # (worker pool)
     
     tmpdict = {}                                # for a copy of XML_toc
     for f in XML_toc:                           # make a copy of XML_toc
@@ -1097,18 +2540,25 @@ def check_integrity(always=False):              # Function check_integrity():
         tmp   = tmpdict[f]
         f_name= (tmp[0].split("."))[0]          # get the name of the XML file
                                                 # (without extension)
-        xlfn  = direc + tmp[0]                  #    local file name for current
+        xname = tmp[0] if (tmp[0] in inv) or not \
+                (tmp[0] + gz_ext in inv) else tmp[0] + gz_ext
+                                                #    name of the current XML
+                                                #      file (a/o compressed)
+        pname = tmp[1] + "-" + tmp[2]           #    name of the current PDF
+                                                #      file
+        xlfn  = direc + xname                   #    local file name for current
                                                 #      XML file
-        plfn  = direc + tmp[1] + "-" + tmp[2]   #    local file name for current
+        plfn  = direc + pname                   #    local file name for current
                                                 #      PDF file
-        xex   = os.path.isfile(xlfn)            #    test: XLM file exists?     
-        pex   = os.path.isfile(plfn)            #    test: PDF file exists?
+        xex   = xname in inv                    #    test: XLM file exists?     
+        pex   = pname in inv                    #    test: PDF file exists?
 
         if xex:                                 #    XLM file exists
-            if os.path.getsize(xlfn) == 0:      #        but file is empty
+            if inv[xname][0] == 0:              #        but file is empty
                 if verbose:
                     print(f"----- Warning: entry '{xlfn}' ")
                 os.remove(xlfn)                 #        OS file removed
+                del inv[xname]
                 if verbose:
                     print(f"----- Warning: XML file '{xlfn}' in OS deleted")
                 del XML_toc[f]                  #        entry deleted
@@ -1118,17 +2568,26 @@ def check_integrity(always=False):              # Function check_integrity():
                 corrected += 1                  #        number of corrections
                                                 #          increasedtuda-ci.xml
             else:                               #        XML file not empty
-                if os.path.isfile(plfn):        #            test: PDF file
+                if pex:                         #            test: PDF file
                                                 #            exists?
-                    if os.path.getsize(plfn) != 0:
+                    if (inv[pname][0] != 0) and not (pname in invalid):
                         PDF_toc[tmp[1] + "-" + tmp[2]] = tmp[0]
                                                 #            generate entry in
                                                 #              PDF_toc
                     else:
-                        if verbose:
-                            print(f"----- Warning: entry '{plfn}' ({tmp[0]}) in",
-                                  "dictionary, but OS file is empty")
+                        if inv[pname][0] == 0:
+                            if verbose:
+                                print(f"----- Warning: entry '{plfn}'",
+                                      f"({tmp[0]}) in dictionary, but OS",
+                                      "file is empty")
+                        else:                   #            HTML page a/o
+                            if verbose:         #            truncated
+                                print(f"----- Warning: entry '{plfn}'",
+                                      f"({tmp[0]}) in dictionary, but OS",
+                                      "file is not a valid PDF file")
+                            PDF_notloaded.add(tmp[2])
                         os.remove(plfn)         #            OS file removed
+                        del inv[pname]
                         if verbose:
                             print(f"----- Warning: PDF file '{plfn}'",
                                   "in OS deleted")
@@ -1166,6 +2625,16 @@ def check_integrity(always=False):              # Function check_integrity():
     thr5.start()
     thr5.join()
 
+    if (len(PDF_XML) > 0) and path.exists(direc + pkl_file3):
+        load_XML_state()                        # packages with deleted PDF
+        for f in PDF_XML:                       # files: to be analyzed and
+            if f in XML_state:                  # loaded once more (next load)
+                XML_state[f] = XML_state[f][0:3] + (False,)
+        thr3 = Thread(target=generate_pickle3)  # dump XML_state via pickle file
+                                                # via thread
+        thr3.start()
+        thr3.join()
+
 # ..................................................................
     if no_error and ok and (not always):        # there is no error
         if verbose:
@@ -1180,6 +2649,73 @@ def check_integrity(always=False):              # Function check_integrity():
     if debugging:
         print("+++ <CTANLoad:check_integrity")
 
+# ------------------------------------------------------------------
+def check_PDF_file(file):                       # Function check_PDF_file:
+                                                # Checks the structure of a
+                                                # local PDF file.
+    """
+    Checks the structure of a local PDF file: "%PDF-" in the first and "%%EOF"
+    in the last pdf_probe bytes; the file is memory-mapped, only these parts
+    are read. An HTML error page a/o a truncated download is not valid.
+
+    Returns True (valid) a/o False.
+
+    parameter:
+    file : name of the local PDF file
+    """
+
+    # 2.67   2026-10-18 new function check_PDF_file
+
+    if debugging:
+        print("+++ -CTANLoad:check_PDF_file")
+
+    try:
+        with open(file, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                size = len(m)
+                return (m.find(b"%PDF-", 0, min(size, pdf_probe)) >= 0) and \
+                       (m.rfind(b"%%EOF", max(0, size - pdf_probe)) >= 0)
+    except (OSError, ValueError):               # file not readable a/o empty
+        return False
+
+# ------------------------------------------------------------------
+def check_PDF_presence():                       # Function check_PDF_presence:
+                                                # Marks packages with missing
+                                                # PDF files (-f).
+    """
+    Compares XML_toc with the inventory of the OS folder (only with -f):
+    packages with a missing PDF file are marked in XML_state, so that their
+    XML file is not requested conditionally but loaded and analyzed once
+    more (the missing PDF files are loaded again).
+
+    Rewrites the global XML_state.
+
+    no parameter
+
+    global variable:
+    XML_state           python dictionary: validators of the XML files
+    """
+
+    # 2.76   2026-10-18 new function check_PDF_presence
+
+    # check_PDF_presence --> get_inventory
+
+    global XML_state                            # python dictionary: validators
+                                                # of the XML files
+
+    if debugging:
+        print("+++ -CTANLoad:check_PDF_presence")
+
+    if not download:                            # PDF files not wanted
+        return
+    inv = get_inventory()                       # files in the OS folder
+    for href in XML_toc:
+        (xlfn, fkey, plfn) = XML_toc[href]
+        if not (fkey + "-" + plfn.replace("+", "-") in inv):
+            f = re.sub(ext + "$", empty, xlfn)  # name of the package
+            if f in XML_state:                  # loaded once more
+                XML_state[f] = XML_state[f][0:3] + (False,)
+
 # ------------------------------------------------------------------
 def dload_authors():                            # Function dload_authors():
                                                 # Downloads XML file 'authors'
@@ -1220,6 +2756,11 @@ def dload_authors():                            # Function dload_authors():
     # 2.45.2 2025-02-04 standard XML file '{0}' not not well-formed
     # 2.46   2025-02-04 messages in functions' __doc__ texts listed
     # 2.49   2025-02-11 more f-strings
+    # 2.61   2026-10-18 in dload_authors: 'authors.xml' parsed on the fly
+    #                   while downloading (parse_catalog)
+
+    # dload_authors --> dload_file
+    # dload_authors --> parse_catalog
 
     global authors                              # global Python dictionary with
                                                 # authors
@@ -1229,45 +2770,41 @@ def dload_authors():                            # Function dload_authors():
 
     file        = "authors"                     # file name
     file2       = file + ext                    # file name (with extension)
-    parameter_P = "-P" + direc                  # parameter -P for wget
-    parameter_O = "-O" + file2                  # parameter -O for wget
-    call1       = "https://ctan.org/xml/2.0/"   # base URL for authors,
+    call1       = ctanXML                       # base URL for authors,
                                                 # packages, ...
-    callx       = [wget, parameter_P,  parameter_O, call1 + file]
-                                                # command for subprocess.run
+
+    def get_author(child):                      # one child in 'authors'
+        key   = empty                           # defaults
+        id    = empty
+        fname = empty
+        gname = empty
+        for attr in child.attrib:               # three attributes: id, givenname
+                                                #   familyname
+            if str(attr) == "id":
+                key = child.attrib['id']
+                                                # get attribute id
+            if str(attr) == "givenname":
+                gname = child.attrib['givenname']
+                                                # get attribute givenname
+            if str(attr) == "familyname":
+                fname = child.attrib['familyname']
+                                                # get attribute familyname
+        authors[key] = (gname, fname)
+
+    feed        = parse_catalog(get_author)     # streaming parser for
+                                                # 'authors.xml'
 
     try:                                        # download file 'authors'
         # wget -P ./ -O authors.xml https://ctan.org/xml/2.0/authors
-        process = subprocess.run(callx, check=True, timeout=timeoutDefault,
-                                 stderr=subprocess.PIPE, stdout=subprocess.PIPE,
-                                 universal_newlines=True)
+        dload_file(call1 + file, file2, sink=feed)
+                                                # download (built-in HTTP client
+                                                # or wget) and parse on the fly
 
         if verbose:
             print(f"--- Info: XML file '{file}' downloaded",
                   f"('{direc + file}.xml' on PC)")
         try:
-            authorsTree  = ET.parse(file2)      # parse the XML file
-                                                #   'authors.xml'
-            authorsRoot  = authorsTree.getroot()
-                                                # get the root
-
-            for child in authorsRoot:           # all children
-                key   = empty                   # defaults
-                id    = empty
-                fname = empty
-                gname = empty
-                for attr in child.attrib:       # three attributes: id, givenname
-                                                #   familyname
-                    if str(attr) == "id":
-                        key = child.attrib['id']
-                                                # get attribute id
-                    if str(attr) == "givenname":
-                        gname = child.attrib['givenname']
-                                                # get attribute givenname
-                    if str(attr) == "familyname":
-                        fname = child.attrib['familyname']
-                                                # get attribute familyname
-                authors[key] = (gname, fname)
+            feed(None)                          # the rest of 'authors.xml'
             if verbose:
                 print("----- Info: authors downloaded")
         except FileNotFoundError:               # file not found
@@ -1283,6 +2820,20 @@ def dload_authors():                            # Function dload_authors():
                       sys.exc_info()[1])
             sys.exit("--- Error: programm terminated")
                                                 # program terminated
+    except ET.ParseError:                       # parsing was not successfull
+        if verbose:
+            print(f"--- Error: standard XML file '{file2}' empty",
+                  "or not well-formed")
+            print("--- Error:", sys.exc_info()[0], "\n   ",
+                  sys.exc_info()[1])
+        sys.exit("--- Error: programm terminated")
+                                                # program terminated
+    except DownloadError as exc:                # HTTP status or network error
+        if verbose:
+            print(f"--- Error: XML file '{file}' not downloaded")
+            print("--- Error:", exc)
+        sys.exit("[CTANLoad] Error: programm terminated")
+                                                # program terminated
     except subprocess.CalledProcessError as exc:
                                                 # processor not found
         if verbose:
@@ -1314,6 +2865,79 @@ def dload_authors():                            # Function dload_authors():
     if debugging:
         print("+++ <CTANLoad:dload_authors")
 
+# ------------------------------------------------------------------
+def dload_catalog_worker(func, errors):         # Function dload_catalog_worker:
+                                                # Calls one catalog function in
+                                                # a thread.
+    """
+    Calls one catalog function (dload_authors, ...) in a thread; a program
+    termination (sys.exit) is handed over to the main thread.
+
+    parameters:
+    func   : dload_authors, dload_licenses, dload_packages a/o dload_topics
+    errors : Python list: collects SystemExit exceptions
+    """
+
+    # 2.59   2026-10-18 new function dload_catalog_worker
+
+    try:
+        func()
+    except SystemExit as exc:                   # sys.exit in a thread only
+        errors.append(exc)                      # ends the thread
+
+# ------------------------------------------------------------------
+def dload_catalogs():                           # Function dload_catalogs:
+                                                # Downloads the four catalog
+                                                # files (in parallel) a/o takes
+                                                # them from the cache.
+    """
+    Downloads the four catalog files (authors, topics, licenses, packages) in
+    parallel and generates the corr. dictionaries; if the cache (4th pickle
+    file) is younger than -ttl seconds, the dictionaries are taken from it.
+
+    Rewrites (via the called functions) the global authors, packages, topics,
+    licenses.
+
+    no parameter
+
+    possible messages:
+    + Error: programm terminated
+    """
+
+    # 2.59   2026-10-18 new function dload_catalogs
+
+    # dload_catalogs --> load_catalogs
+    # dload_catalogs --> dload_catalog_worker --> dload_topics
+    # dload_catalogs --> dload_catalog_worker --> dload_authors
+    # dload_catalogs --> dload_catalog_worker --> dload_licenses
+    # dload_catalogs --> dload_catalog_worker --> dload_packages
+    # dload_catalogs --> generate_pickle4
+
+    if debugging:
+        print("+++ >CTANLoad:dload_catalogs")
+
+    if load_catalogs():                         # cache is valid
+        if debugging:
+            print("+++ <CTANLoad:dload_catalogs")
+        return
+
+    errors  = []                                # terminations in the threads
+    threads = []
+    for func in [dload_topics, dload_authors, dload_licenses, dload_packages]:
+        thr = Thread(target=dload_catalog_worker, args=(func, errors))
+        thr.start()
+        threads.append(thr)
+    for thr in threads:
+        thr.join()
+    if len(errors) > 0:                         # at least one catalog file
+        sys.exit(errors[0].code)                # failed: program terminated
+
+    if ttl > 0:
+        generate_pickle4()                      # fill the cache
+
+    if debugging:
+        print("+++ <CTANLoad:dload_catalogs")
+
 # ------------------------------------------------------------------
 def dload_document_file(href, key, name, XML_file):
                                                 # Function dload_document_file
@@ -1323,8 +2947,12 @@ def dload_document_file(href, key, name, XML_file):
     """
     Downloads one information file (PDF) from CTAN.
 
-    Returns the status of the PDF download.
-    Rewrites the global pdfcounter, pdfctrerr.
+    A known PDF file is requested conditionally (ETag/Last-Modified, built-in
+    HTTP client); an unchanged PDF file is not downloaded again.
+
+    Returns the status of the PDF download; the error of a failed download
+    is left in request_info.failure (None: no exception).
+    Rewrites the global pdfcounter, pdfctrerr, pdfunchanged.
 
     Parameters:
     href     : URL of document (PDF file)
@@ -1339,11 +2967,16 @@ def dload_document_file(href, key, name, XML_file):
     PDF_notloaded       Python list: PDF not downloaded
     PDF_XML             Python set: list of XML files: inconsistencies with PDF
                         files for packages
+    PDF_state           python dictionary: validators and hashes of the PDF
+                        files
+    pdfunchanged        counter for unchanged PDF files
 
     possible (error) messages:
     + Info: PDF documentation file '{0}' downloaded
+    + Info: PDF documentation file '{0}' unchanged (not downloaded)
     + Info: unique local file name: '{0}'
     + Warning: PDF documentation file '{0}' not downloaded
+    + Warning: PDF documentation file '{0}' not valid (deleted)
     """
 
     # 2.28   2024-03-04 in dload_document_file: PDF_XML now in global list
@@ -1358,6 +2991,21 @@ def dload_document_file(href, key, name, XML_file):
     # 2.39   2024-03-17 in dload_document_file: error in URL building corrected
     # 2.46   2025-02-04 messages in functions' __doc__ texts listed
     # 2.49   2025-02-11 more f-strings
+    # 2.51   2026-10-18 pdfcounter locked (parallel downloads)
+    # 2.55   2026-10-18 in dload_document_file: resumable downloads
+    # 2.56   2026-10-18 in dload_document_file: conditional requests; hashes
+    #                   and shared storage of identical files (store_PDF_file)
+    # 2.67   2026-10-18 in dload_document_file: structural validation of the
+    #                   downloaded file (check_PDF_file)
+    # 2.76   2026-10-18 in dload_document_file: error of a failed download in
+    #                   request_info.failure (see queue_fail)
+    # 2.76   2026-10-18 in dload_document_file: test for a conditional request
+    #                   moved to get_PDF_cond (shared with call_plan)
+
+    # dload_document_file --> get_PDF_cond
+    # dload_document_file --> dload_file
+    # dload_document_file --> check_PDF_file
+    # dload_document_file --> store_PDF_file
 
     global pdfcounter                           # counter for downloaded
                                                 # PDF files
@@ -1367,6 +3015,8 @@ def dload_document_file(href, key, name, XML_file):
     global PDF_XML                              # Python set: list of XML files:
                                                 # inconsistencies with PDF files
                                                 # for packages
+    global pdfunchanged                         # counter for unchanged PDF
+                                                # files
     
     if debugging:
         print("+++ -CTANLoad:dload_document_file")
@@ -1374,35 +3024,66 @@ def dload_document_file(href, key, name, XML_file):
     # to be improved
 
     name        = name.replace("+", "-")                   
-    call2       = "https://ctan.org/xml/2.0/pkg/"
-                                                # base wget call for package files
-    parameter_P = "-P" + direc                  # parameter -P for wget
-    parameter_O = "-O" + key + "-" + name       # parameter -O for wget
-
-    call     = [wget, parameter_P, parameter_O, href]
-    noterror = False
+    noterror    = False
+    local       = key + "-" + name              # local file name
+    cond        = get_PDF_cond(href, local)     # validators for a conditional
+                                                # request (a/o None)
+    request_info.failure = None                 # error of a failed download
     
     try:                                        # download the PDF file and store
-        process = subprocess.run(call, universal_newlines=True,
-                                 stdout=subprocess.PIPE, stderr=subprocess.PIPE,
-                                 timeout=timeoutDefault)
-        if verbose:
-            print(f"------- Info: PDF documentation file '{name}' downloaded")
-            tmpxx = direc + key + "-" + name
-            print(f"------- Info: unique local file name: '{tmpxx}'")
-        pdfcounter = pdfcounter + 1             # number of downloaded PDF files
+        (status, etag, modified) = dload_file(href, local, check=False,
+                                              resume=True, cond=cond)
+                                                # download (built-in HTTP client
+                                                # [resumable] or wget)
+        if status == 304:                       # not modified: file is kept
+            with dload_lock:
+                pdfunchanged = pdfunchanged + 1
+            if verbose:
+                print(f"------- Info: PDF documentation file '{name}'",
+                      "unchanged (not downloaded)")
+        elif not check_PDF_file(local):         # HTML error page a/o truncated
+            os.remove(local)                    # file: not stored
+            with dload_lock:
+                PDF_notloaded.add(name)
+                PDF_XML.add(re.sub(".xml", empty, XML_file))
+            if verbose:
+                print(f"------- Warning: PDF documentation file '{name}'",
+                      "not valid (deleted)")
+            return noterror
+        else:
+            if verbose:
+                print(f"------- Info: PDF documentation file '{name}'",
+                      "downloaded")
+                tmpxx = direc + local
+                print(f"------- Info: unique local file name: '{tmpxx}'")
+            store_PDF_file(href, local, etag, modified)
+                                                # hash; identical files are
+                                                # shared
+            with dload_lock:
+                pdfcounter = pdfcounter + 1     # number of downloaded PDF files
                                                 # incremented
         noterror = True
     except FileNotFoundError as exc:            # file not found / file not
                                                 # downloaded
+        request_info.failure = exc
         PDF_notloaded.add(name)                 # append name of file to the
                                                 # PDF_notloaded list
         PDF_XML.add(re.sub(".xml", empty, XML_file))
         if verbose:
            print("------- Warning: PDF documentation",
                  f"file '{name}' not downloaded")
+    except DownloadError as exc:                # HTTP status or network error
+        request_info.failure = exc
+        PDF_notloaded.add(name)                 # append name of file to the
+                                                # PDF_notloaded list
+        PDF_XML.add(re.sub(".xml", empty, XML_file))
+        if verbose:
+            print("------- Warning: PDF documentation",
+                  f"file '{name}' not downloaded")
+            print("------- Warning:", exc)
     except subprocess.CalledProcessError as exc:
                                                 # processor not found
+        request_info.failure = exc
         PDF_notloaded.add(name)                 # append name of file to the
                                                 # PDF_notloaded list
         PDF_XML.add(re.sub(".xml", empty, XML_file))
@@ -1410,6 +3091,7 @@ def dload_document_file(href, key, name, XML_file):
             print("------- Warning: PDF documentation",
                   f"file '{name}' not downloaded")
     except subprocess.TimeoutExpired as exc:    # timeout
+        request_info.failure = exc
         PDF_notloaded.add(name)                 # append name of file to the
                                                 #   PDF_notloaded list
         PDF_XML.add(re.sub(".xml", empty, XML_file))
@@ -1417,6 +3099,7 @@ def dload_document_file(href, key, name, XML_file):
             print("------- Warning: PDF documentation",
                   f"file '{name}' not downloaded")
     except:                                     # any unspecified error
+        request_info.failure = sys.exc_info()[1]
         PDF_notloaded.add(name)                 # append name of file to the
                                                 # PDF_notloaded list
         PDF_XML.add(re.sub(".xml", empty, XML_file))
@@ -1426,6 +3109,130 @@ def dload_document_file(href, key, name, XML_file):
             
     return noterror
 
+# ------------------------------------------------------------------
+def dload_file(url, file, check=True, cond=None, resume=False, sink=None):
+                                                # Function dload_file(url, file):
+                                                # Downloads one file (built-in
+                                                # HTTP client or wget).
+    """
+    Downloads one file with the built-in HTTP client or with wget/wget2
+    (option -dl).
+
+    Returns a tuple (HTTP status, ETag, Last-Modified); wget always returns
+    (200, "", "").
+
+    url is always a ctan.org URL; it is mapped to the source of option -src
+    (base URL, local mirror folder a/o archive).
+
+    parameters:
+    url   : URL of the file
+    file  : name of the local file
+    check : wget only: a wget error is an error
+    cond  : built-in HTTP client only: None or tuple (ETag, Last-Modified) for
+            a conditional request
+    resume: built-in HTTP client only: an interrupted download is kept
+            (.part file with journal) and resumed in the next attempt
+    sink  : None or function which takes each block of the file (bytes); the
+            built-in HTTP client calls it while downloading, wget and a local
+            source afterwards; before a repetition sink.restart() is called
+            (if present)
+
+    A download with a transient error (network error, timeout, HTTP status
+    408, 429, 5xx; wget: network failure) is repeated up to -rt times after
+    a delay (exponential backoff with full jitter, base -bo, at most
+    backoff_max seconds; at least the Retry-After of the server).
+
+    Rewrites the global retried.
+
+    global variable:
+    retried         counter for repeated downloads
+
+    possible messages:
+    + Info: download of '{0}' repeated in {1} s ({2}/{3})
+
+    possible exceptions:
+    + DownloadError (built-in HTTP client)
+    + FileNotFoundError, subprocess.CalledProcessError,
+      subprocess.TimeoutExpired (wget)
+    + any exception of sink
+    """
+
+    # 2.52   2026-10-18 new function dload_file: all downloads in one place
+    # 2.53   2026-10-18 in dload_file: conditional requests; returns status and
+    #                   validators
+    # 2.55   2026-10-18 in dload_file: resumable downloads
+    # 2.57   2026-10-18 in dload_file: rate limits and adaptive concurrency
+    # 2.58   2026-10-18 in dload_file: source of the CTAN files (-src)
+    # 2.61   2026-10-18 in dload_file: blocks of the file handed over to a
+    #                   sink (streaming parse of the catalog files)
+    # 2.63   2026-10-18 in dload_file: downloaded bytes counted (-nb)
+    # 2.66   2026-10-18 in dload_file: inventory of the OS folder discarded
+    # 2.68   2026-10-18 in dload_file: each request recorded (-tm)
+    # 2.69   2026-10-18 in dload_file: repetitions with jittered exponential
+    #                   backoff (-rt, -bo); one attempt split off to
+    #                   dload_request
+    # 2.76   2026-10-18 in dload_file: classification of the errors moved to
+    #                   is_transient
+
+    # dload_file --> is_transient
+    # dload_file --> reset_inventory
+    # dload_file --> source_get
+    # dload_file --> dload_request
+
+    global retried                              # counter for repeated
+                                                # downloads
+
+    if debugging:
+        print("+++ -CTANLoad:dload_file")
+
+    reset_inventory()                           # the OS folder is changed
+                                                # (the workers do not use the
+                                                # inventory)
+    if (sink != None) and ((source_kind != "url") or (downloader != "http")):
+        result = dload_file(url, file, check, cond, resume)
+                                                # no streaming: the blocks of
+        with open(file, "rb") as inp:           # the local file
+            while True:
+                block = inp.read(chunk_size)
+                if not block:
+                    break
+                sink(block)
+        return result
+
+    if source_kind != "url":                    # local mirror folder a/o
+        return source_get(url, file, cond)      # archive: no network
+    if (source != ctanUrl) and url.startswith(ctanUrl + "/"):
+        url = source + url[len(ctanUrl):]       # other base URL
+
+    attempt = 0                                 # number of the actual
+                                                # repetition
+    while True:
+        try:
+            return dload_request(url, file, check, cond, resume, sink, attempt)
+        except (DownloadError, subprocess.TimeoutExpired,
+                subprocess.CalledProcessError) as exc:
+            transient = is_transient(exc)       # network error, timeout, 408,
+                                                # 429, 5xx
+            wait      = exc.retry_after if isinstance(exc, DownloadError) \
+                        else None               # Retry-After of the server
+            if (not transient) or (attempt >= retries):
+                raise                           # permanent error a/o no
+                                                # repetition left
+        delay = random.uniform(0, min(backoff_max, backoff * 2 ** attempt))
+                                                # exponential backoff with full
+                                                # jitter
+        if wait != None:                        # Retry-After of the server
+            delay = max(delay, min(backoff_max, wait))
+        attempt = attempt + 1
+        with dload_lock:
+            retried = retried + 1
+        if verbose:
+            print(f"------- Info: download of '{url}' repeated in",
+                  f"{round(delay, rndg)} s ({attempt}/{retries})")
+        time.sleep(delay)
+        if hasattr(sink, "restart"):            # the blocks are handed over
+            sink.restart()                      # once more
+
 # ------------------------------------------------------------------
 def dload_licenses():                           # Function dload_licenses:
                                                 # Downloads XML file
@@ -1466,6 +3273,11 @@ def dload_licenses():                           # Function dload_licenses:
     # 2.34.2 2024-03-13 exception handling revised
     # 2.46   2025-02-04 messages in functions' __doc__ texts listed
     # 2.49   2025-02-11 more f-strings
+    # 2.61   2026-10-18 in dload_licenses: 'licenses.xml' parsed on the fly
+    #                   while downloading (parse_catalog)
+
+    # dload_licenses --> dload_file
+    # dload_licenses --> parse_catalog
 
     global licenses                             # global Python dictionary with
                                                 # licenses
@@ -1475,42 +3287,39 @@ def dload_licenses():                           # Function dload_licenses:
 
     file        = "licenses"                    # file name
     file2       = file + ext                    # file name (with extension)
-    parameter_P = "-P" + direc                  # parameter -P for wget
-    parameter_O = "-O" + file2                  # parameter -O for wget
-    call1       = "https://ctan.org/xml/2.0/"   # base URL for authors,
+    call1       = ctanXML                       # base URL for authors,
                                                 # packages, ...
-    callx       = [wget, parameter_P,  parameter_O, call1 + file]
-                                                # command for subprocess.run
+
+    def get_license(child):                     # one child in 'licenses'
+        key   = empty                           # defaults
+        name  = empty
+        free  = empty
+        for attr in child.attrib:               # three attributes:
+                                                # key, name, free
+            if str(attr) == "key":
+                key = child.attrib['key']
+                                                # get attribute key
+            elif str(attr) == "name":
+                name = child.attrib['name']
+                                                # get attribute name
+            elif str(attr) == "free":
+                free = child.attrib['free']
+                                                # get attribute free
+        licenses[key] = (name, free)
+
+    feed        = parse_catalog(get_license)    # streaming parser for
+                                                # 'licenses.xml'
 
     try:                                        # Download file .../licenses
-        process = subprocess.run(callx, check=True, timeout=timeoutDefault,
-                                 stderr=subprocess.PIPE, stdout=subprocess.PIPE,
-                                 universal_newlines=True)
+        dload_file(call1 + file, file2, sink=feed)
+                                                # download (built-in HTTP client
+                                                # or wget) and parse on the fly
 
         if verbose:
             print(f"--- Info: XML file '{file}' downloaded",
                   f"('{direc + file}.xml' on PC)")
         try:
-            licensesTree   = ET.parse(file2)    # parse the XML file 'topics.xml'
-            licensesRoot   = licensesTree.getroot()
-                                                # get the root
-
-            for child in licensesRoot:          # all children in 'licenses'
-                key   = empty                   # defaults
-                name  = empty
-                free  = empty
-                for attr in child.attrib:       # three attributes:
-                                                # key, name, free
-                    if str(attr) == "key":
-                        key = child.attrib['key']
-                                                # get attribute key
-                    elif str(attr) == "name":
-                        name = child.attrib['name']
-                                                # get attribute name
-                    elif str(attr) == "free":
-                        free = child.attrib['free']
-                                                # get attribute free
-                licenses[key] = (name, free)
+            feed(None)                          # the rest of 'licenses.xml'
             licenses["noinfo"]      = ("noinfo", empty)
                                                 # correction; not in
                                                 # lincenses.xml
@@ -1535,6 +3344,20 @@ def dload_licenses():                           # Function dload_licenses:
                       sys.exc_info()[1])
             sys.exit("--- Error: programm terminated")
                                                 # program terminated
+    except ET.ParseError:                       # parsing was not successfull
+        if verbose:
+            print(f"--- Error: standard XML file '{file2}' empty",
+                  "or not well-formed")
+            print("--- Error:", sys.exc_info()[0], "\n   ",
+                  sys.exc_info()[1])
+        sys.exit("--- Error: programm terminated")
+                                                # program terminated
+    except DownloadError as exc:                # HTTP status or network error
+        if verbose:
+            print(f"--- Error: XML file '{file}' not downloaded")
+            print("--- Error:", exc)
+        sys.exit("[CTANLoad] Error: programm terminated")
+                                                # program terminated
     except subprocess.CalledProcessError as exc:
                                                 # processor not found
         if verbose:
@@ -1606,6 +3429,11 @@ def dload_packages():                           # Function dload_packages:
     # 2.45.2 2025-02-04 standard XML file '{0}' not not well-formed
     # 2.46   2025-02-04 messages in functions' __doc__ texts listed
     # 2.49   2025-02-11 more f-strings
+    # 2.61   2026-10-18 in dload_packages: 'packages.xml' parsed on the fly
+    #                   while downloading (parse_catalog)
+
+    # dload_packages --> dload_file
+    # dload_packages --> parse_catalog
 
     global packages                             # global Python dictionary
                                                 # with packages
@@ -1615,42 +3443,39 @@ def dload_packages():                           # Function dload_packages:
 
     file        = "packages"                    # file name
     file2       = file + ext                    # file name (with extension)
-    parameter_P = "-P" + direc                  # parameter -P for wget
-    parameter_O = "-O" + file2                  # parameter -O for wget
-    call1       = "https://ctan.org/xml/2.0/"   # base URL for authors,
+    call1       = ctanXML                       # base URL for authors,
                                                 # packages, ...
-    callx       = [wget, parameter_P,  parameter_O, call1 + file]
+
+    def get_package(child):                     # one child in 'packages'
+        key     = empty                         # defaults
+        name    = empty
+        caption = empty
+        for attr in child.attrib:               # three attributes:
+                                                # key, name, caption
+            if str(attr) == "key":
+                key = child.attrib['key']
+                                                # gets attribute key
+            if str(attr) == "name":
+                name = child.attrib['name']
+                                                # gets attribute name
+            if str(attr) == "caption":
+                caption = child.attrib['caption']
+                                                # gets attribute caption
+        packages[key] = (name, caption)
+
+    feed        = parse_catalog(get_package)    # streaming parser for
+                                                # 'packages.xml'
 
     try:                                        # Load file .../packages
-        process = subprocess.run(callx, check=True, timeout=timeoutDefault,
-                                 stderr=subprocess.PIPE,
-                                 stdout=subprocess.PIPE, universal_newlines=True)
+        dload_file(call1 + file, file2, sink=feed)
+                                                # download (built-in HTTP client
+                                                # or wget) and parse on the fly
 
         if verbose:
             print(f"--- Info: XML file '{file}' downloaded",
                   f"('{direc + file}.xml' on PC)")
-        try:                                    # parses 'packages' tree
-            packagesTree = ET.parse(file2)      # parses the XML file
-                                                # 'packages.xml'
-            packagesRoot = packagesTree.getroot()
-                                                # gets the root
-
-            for child in packagesRoot:          # all children in 'packages'
-                key     = empty                 # defaults
-                name    = empty
-                caption = empty
-                for attr in child.attrib:       # three attributes:
-                                                # key, name, caption
-                    if str(attr) == "key":
-                        key = child.attrib['key']
-                                                # gets attribute key
-                    if str(attr) == "name":
-                        name = child.attrib['name']
-                                                # gets attribute name
-                    if str(attr) == "caption":
-                        caption = child.attrib['caption']
-                                                # gets attribute caption
-                packages[key] = (name, caption)
+        try:
+            feed(None)                          # the rest of 'packages.xml'
             if verbose:
                 print("----- Info: packages downloaded")
         except FileNotFoundError:               # file not found
@@ -1666,6 +3491,20 @@ def dload_packages():                           # Function dload_packages:
                       sys.exc_info()[1])
             sys.exit("--- Error: programm terminated")
                                                 # program terminated
+    except ET.ParseError:                       # parsing was not successfull
+        if verbose:
+            print(f"--- Error: standard XML file '{file2}' empty",
+                  "or not well-formed")
+            print("--- Error:", sys.exc_info()[0], "\n   ",
+                  sys.exc_info()[1])
+        sys.exit("--- Error: programm terminated")
+                                                # program terminated
+    except DownloadError as exc:                # HTTP status or network error
+        if verbose:
+            print(f"--- Error: XML file '{file}' not downloaded")
+            print("--- Error:", exc)
+        sys.exit("[CTANLoad] Error: programm terminated")
+                                                # program terminated
     except subprocess.CalledProcessError as exc:
                                                 # processor not found
         if verbose:
@@ -1697,6 +3536,113 @@ def dload_packages():                           # Function dload_packages:
     if debugging:
         print("+++ <CTANLoad:dload_packages")
 
+# ------------------------------------------------------------------
+def dload_request(url, file, check, cond, resume, sink, attempt):
+                                                # Function dload_request: One
+                                                # attempt of a download.
+    """
+    One attempt of a download (built-in HTTP client or wget/wget2) under the
+    rate limits (-rr, -br) and the adaptive concurrency; see dload_file.
+
+    Returns a tuple (HTTP status, ETag, Last-Modified); wget always returns
+    (200, "", "").
+
+    Rewrites the global dbytes.
+
+    parameters:
+    url     : URL of the file (already mapped to the source -src)
+    file    : name of the local file
+    check   : wget only: a wget error is an error
+    cond    : None or tuple (ETag, Last-Modified) for a conditional request
+    resume  : Flag: resumable download
+    sink    : None or function which takes each block of the file (bytes)
+    attempt : number of the repetition (0: first attempt)
+
+    global variable:
+    dbytes          counter for downloaded bytes
+
+    possible exceptions:
+    + DownloadError (built-in HTTP client)
+    + FileNotFoundError, subprocess.CalledProcessError,
+      subprocess.TimeoutExpired (wget)
+    + any exception of sink
+    """
+
+    # 2.69   2026-10-18 new function dload_request, split off from dload_file
+    # 2.76   2026-10-18 in dload_request: wget writes to file.part, which
+    #                   replaces the file (hard links stay intact)
+
+    # dload_request --> limit_rate
+    # dload_request --> acquire_slot
+    # dload_request --> http_get
+    # dload_request --> release_slot
+    # dload_request --> add_telemetry
+
+    global dbytes                               # counter for downloaded bytes
+
+    if debugging:
+        print("+++ -CTANLoad:dload_request")
+
+    limit_rate(request_bucket, 1)               # requests per second (-rr)
+    acquire_slot()                              # concurrent downloads (AIMD)
+    congested = False                           # Flag: CTAN is overloaded
+    status    = 0                               # HTTP status (telemetry; 0:
+                                                # network error a/o timeout)
+    start     = time.monotonic()                # begin of the request
+    request_info.nbytes  = 0                    # transferred bytes (http_get)
+    request_info.retries = 0                    # repeated requests (http_get)
+    try:
+        if downloader == "http":                # built-in HTTP client
+            result = http_get(url, file, cond, resume, sink)
+            status = result[0]
+            return result
+        else:                                   # wget a/o wget2
+            part        = file + part_ext       # wget writes a new file: a
+                                                # hard-linked file (see
+                                                # store_PDF_file) is replaced,
+                                                # not rewritten in place
+            parameter_P = "-P" + direc          # parameter -P for wget
+            parameter_O = "-O" + part           # parameter -O for wget
+            callx       = [wget, parameter_P, parameter_O, url]
+                                                # command for subprocess.run
+            try:
+                process = subprocess.run(callx, check=check,
+                                         timeout=timeoutDefault,
+                                         stderr=subprocess.PIPE,
+                                         stdout=subprocess.PIPE,
+                                         universal_newlines=True)
+            except:                             # no incomplete .part file
+                try:
+                    os.remove(part)
+                except OSError:
+                    pass
+                raise
+            if path.exists(part):
+                os.replace(part, file)
+            if path.exists(file):               # bytes per second (-br):
+                size = os.path.getsize(file)    # afterwards for wget
+                limit_rate(byte_bucket, size)
+                with dload_lock:                # byte budget (-nb)
+                    dbytes = dbytes + size
+                request_info.nbytes = size
+            if process.returncode == 0:
+                status = 200
+            return (200, empty, empty)
+    except DownloadError as exc:                # timeout, 429 a/o 5xx: CTAN
+                                                # is overloaded
+        congested = (exc.status == 0) or (exc.status == 429) or \
+                    (exc.status >= 500)
+        status    = exc.status
+        raise
+    except subprocess.TimeoutExpired:
+        congested = True
+        raise
+    finally:
+        release_slot(congested)
+        add_telemetry(url, status, request_info.nbytes,
+                      time.monotonic() - start,
+                      attempt + request_info.retries)
+
 # ------------------------------------------------------------------
 def dload_topics():                             # Function dload_topics():
                                                 # Downloads XML file 'topics'
@@ -1737,6 +3683,11 @@ def dload_topics():                             # Function dload_topics():
     # 2.45.2 2025-02-04 standard XML file '{0}' not not well-formed
     # 2.46   2025-02-04 messages in functions' __doc__ texts listed
     # 2.49   2025-02-11 more f-strings
+    # 2.61   2026-10-18 in dload_topics: 'topics.xml' parsed on the fly
+    #                   while downloading (parse_catalog)
+
+    # dload_topics --> dload_file
+    # dload_topics --> parse_catalog
 
     global topics                               # global Python dictionary
                                                 # with topics
@@ -1746,36 +3697,35 @@ def dload_topics():                             # Function dload_topics():
 
     file        = "topics"                      # file name
     file2       = file + ext                    # file name (with extension)
-    parameter_P = "-P" + direc                  # parameter -P for wget
-    parameter_O = "-O" + file2                  # parameter -O for wget
-    call1       = "https://ctan.org/xml/2.0/"   # base URL for authors,
+    call1       = ctanXML                       # base URL for authors,
                                                 # packages, ...
-    callx       = [wget, parameter_P,  parameter_O, call1 + file]
+
+    def get_topic(child):                       # one child in 'topics'
+        key     = empty                         # defaults
+        name    = empty
+        details = empty
+        for attr in child.attrib:               # two attributes: name, details
+            if str(attr) == "name":
+                key = child.attrib['name']
+                                                # get attribute name
+            if str(attr) == "details":
+                details = child.attrib['details']
+                                                # get attribute details
+        topics[key] = details
+
+    feed        = parse_catalog(get_topic)      # streaming parser for
+                                                # 'topics.xml'
 
     try:                                        # Load file .../topics
-        process = subprocess.run(callx, check=True, timeout=timeoutDefault,
-                                 stderr=subprocess.PIPE,
-                                 stdout=subprocess.PIPE, universal_newlines=True)
+        dload_file(call1 + file, file2, sink=feed)
+                                                # download (built-in HTTP client
+                                                # or wget) and parse on the fly
 
         if verbose:
             print(f"--- Info: XML file '{file}' downloaded",
                   f"('{direc + file}.xml' on PC)")
         try:
-            topicsTree   = ET.parse(file2)      # parse the XML file 'topics.xml'
-            topicsRoot   = topicsTree.getroot() # get the root
-
-            for child in topicsRoot:            # all children in 'topics'
-                key     = empty                 # defaults
-                name    = empty
-                details = empty
-                for attr in child.attrib:       # two attributes: name, details
-                    if str(attr) == "name":
-                        key = child.attrib['name']
-                                                # get attribute name
-                    if str(attr) == "details":
-                        details = child.attrib['details']
-                                                # get attribute details
-                topics[key] = details
+            feed(None)                          # the rest of 'topics.xml'
             if verbose:
                 print("----- Info: topics downloaded")
         except FileNotFoundError:               # file not found
@@ -1792,6 +3742,20 @@ def dload_topics():                             # Function dload_topics():
             sys.exit("--- Error: programm terminated")
                                                 # program terminated
         topics["norsk"] = "Nynorsk"             # Emergency entry !!!!
+    except ET.ParseError:                       # parsing was not successfull
+        if verbose:
+            print(f"--- Error: standard XML file '{file2}' empty",
+                  "or not well-formed")
+            print("--- Error:", sys.exc_info()[0], "\n   ",
+                  sys.exc_info()[1])
+        sys.exit("--- Error: programm terminated")
+                                                # program terminated
+    except DownloadError as exc:                # HTTP status or network error
+        if verbose:
+            print(f"--- Error: XML file '{file}' not downloaded")
+            print("--- Error:", exc)
+        sys.exit("[CTANLoad] Error: programm terminated")
+                                                # program terminated
     except subprocess.CalledProcessError as exc:
                                                 # processor not found
         if verbose:
@@ -1824,16 +3788,239 @@ def dload_topics():                             # Function dload_topics():
         print("+++ <CTANLoad:dload_topics")
 
 # ------------------------------------------------------------------
-def dload_XML_files(p):                         # Function dload_XML_files:
+def dload_PDF_worker():                         # Function dload_PDF_worker:
+                                                # Worker for the download of PDF
+                                                # files.
+    """
+    Worker for the download of PDF files (pipeline stage 3).
+
+    Takes the next PDF file from pdf_queue, until None is found; if the budget
+    (-nb, -tb) is exhausted, the PDF file is left for the next session.
+
+    Each PDF file in pdf_queue has reserved a download against the limit -n
+    (see reserve_PDF_file); the reservation is released after the download.
+
+    Rewrites the global PDF_toc, PDF_XML, pdfpending.
+
+    no parameter
+
+    global variables:
+    PDF_toc         global Python dictionary for PDF files
+    PDF_XML         Python set: XML files with PDF files not loaded
+    pdfpending      counter for queued a/o running PDF downloads
+    pdf_queue       queue: PDF files to be downloaded
+    """
+
+    # 2.54   2026-10-18 new function dload_PDF_worker
+    # 2.60   2026-10-18 in dload_PDF_worker: finished a/o failed PDF files
+    #                   recorded in the job queue
+    # 2.63   2026-10-18 in dload_PDF_worker: byte and time budgets
+    # 2.76   2026-10-18 in dload_PDF_worker: reservation against -n released
+    # 2.76   2026-10-18 in dload_PDF_worker: failed PDF files recorded by
+    #                   queue_fail (only transient errors kept)
+
+    # dload_PDF_worker --> check_budget
+    # dload_PDF_worker --> dload_document_file
+    # dload_PDF_worker --> queue_set
+    # dload_PDF_worker --> queue_fail
+
+    global PDF_toc                              # global Python dictionary for
+                                                # PDF files
+    global PDF_XML                              # Python set: list of XML files:
+                                                # inconsistencies with PDF files
+    global pdfpending                           # counter for queued a/o running
+                                                # PDF downloads
+
+    queue = pdf_queue                           # the queue of this run
+
+    while True:
+        job = queue.get()
+        if job == None:                         # end of the stage
+            return
+        (href2, fkey, onename, file) = job
+        if not check_budget():                  # budget exhausted: PDF file
+            with dload_lock:                    # left for the next session
+                PDF_XML.add(re.sub(".xml", empty, file))
+                pdfpending = pdfpending - 1
+            continue
+        if dload_document_file(href2, fkey, onename, file):
+                                                # load the PDF document
+            with dload_lock:
+                PDF_toc[fkey + "-" + onename] = file
+                pdfpending = pdfpending - 1     # counted in pdfcounter
+            queue_set("pdf", href2, "done", PDF_state.get(href2, None))
+        else:
+            with dload_lock:
+                pdfpending = pdfpending - 1
+            queue_fail("pdf", href2, request_info.failure)
+
+# ------------------------------------------------------------------
+def dload_XML_file(f):                          # Function dload_XML_file(f):
+                                                # Downloads and analyzes one
+                                                # XML package file.
+    """
+    Downloads and analyzes one XML package file.
+
+    A known package is requested conditionally (ETag/Last-Modified, built-in
+    HTTP client); an unchanged XML file (status 304 or same SHA-256) is not
+    analyzed again. A package is not known, if its local XML file is not
+    well-formed a/o (with -f) one of its PDF files is missing.
+
+    Rewrites the global XML_state, counter, unchanged.
+
+    parameter:
+    f: name of the package
+
+    global variables:
+    XML_state       python dictionary: validators of the XML files
+    counter         counter for downloadd XML and PDF files
+    unchanged       counter for unchanged XML files
+
+    possible messages:
+    + Info: XML file for package '{0}' downloaded ('{1}.xml' on PC) 
+    + Info: XML file for package '{0}' unchanged (not downloaded)
+    + Info: XML file for package '{0}' unchanged (not analyzed)
+    + Warning:
+    + Warning: processor '{0}' not found
+    + Warning: XML file '{0}' not downloaded
+    """
+
+    # 2.51   2026-10-18 new function dload_XML_file, split off from
+    #                   dload_XML_files (one package per call; used by the
+    #                   parallel download workers)
+    # 2.53   2026-10-18 in dload_XML_file: conditional requests; unchanged XML
+    #                   files are not analyzed again
+    # 2.54   2026-10-18 in dload_XML_file: XML files are handed over to the
+    #                   analysis stage (pipeline)
+    # 2.60   2026-10-18 in dload_XML_file: finished a/o failed packages
+    #                   recorded in the job queue
+    # 2.62   2026-10-18 in dload_XML_file: XML file stored compressed (-z)
+    # 2.76   2026-10-18 in dload_XML_file: a local XML file which is not
+    #                   well-formed is loaded unconditionally
+    # 2.76   2026-10-18 in dload_XML_file: test for a conditional request
+    #                   moved to get_XML_cond (shared with call_plan)
+    # 2.76   2026-10-18 in dload_XML_file: failed packages recorded by
+    #                   queue_fail (only transient errors kept)
+
+    # dload_XML_file --> get_XML_cond
+    # dload_XML_file --> dload_file
+    # dload_XML_file --> get_file_hash
+    # dload_XML_file --> store_XML_file
+    # dload_XML_file --> analyze_XML_file
+    # dload_XML_file --> analyze_XML_worker (via analyze_queue)
+    # dload_XML_file --> queue_set
+    # dload_XML_file --> queue_fail
+
+    global XML_state                            # python dictionary: validators
+                                                # of the XML files
+    global counter                              # counter for downloadd XML and
+                                                # PDF files
+    global unchanged                            # counter for unchanged XML
+                                                # files
+
+    if debugging:
+        print("+++ >CTANLoad:dload_XML_file")
+
+    call2       = ctanXML + "pkg/"
+                                                # base URL for package files
+
+    state = XML_state.get(f, None)              # validators of the last run
+    cond  = get_XML_cond(f)                     # validators for a conditional
+                                                # request (a/o None)
+    known = (cond != None)                      # Flag: the last analysis may
+                                                # be reused
+
+    try:                                        # try to download the XML
+                                                # file (packages)
+        (status, etag, modified) = dload_file(call2 + f, f + ext, cond=cond)
+                                                # download (built-in HTTP client
+                                                # or wget)
+
+        if status == 304:                       # not modified: nothing written,
+                                                # nothing to analyze
+            with dload_lock:
+                counter   = counter - 1         # not a download
+                unchanged = unchanged + 1
+            store_XML_file(f + ext)             # compressed (-z) a/o not
+            queue_set("xml", f, "done", state)
+            if verbose:
+                print(f"----- Info: XML file for package",
+                      f"'{f}' unchanged (not downloaded)")
+        else:
+            sha = get_file_hash(f + ext)        # hash of the new XML file
+            store_XML_file(f + ext)             # compressed (-z) a/o not
+            if known and (sha == state[2]):     # same content as before
+                with dload_lock:
+                    unchanged = unchanged + 1
+                    XML_state[f] = (etag, modified, sha, state[3])
+                queue_set("xml", f, "done", XML_state[f])
+                if verbose:
+                    print(f"----- Info: XML file for package",
+                          f"'{f}' unchanged (not analyzed)")
+            else:
+                if verbose:
+                    print(f"----- Info: XML file for package",
+                          f"'{f}' downloaded ('{direc + f}.xml' on PC)") 
+                with dload_lock:
+                    XML_state[f] = (etag, modified, sha, download)
+                                                # PDF files with errors: see
+                                                # dload_XML_files
+                if analyze_queue != None:       # pipeline: analysis stage
+                    analyze_queue.put(f + ext)  # waits, if the queue is full
+                else:
+                    analyze_XML_file(f + ext)   # if download is set: analyze
+                                                # the associated XML file
+                    queue_set("xml", f, "done", XML_state[f])
+    except FileNotFoundError as exc:            # file not found /
+                                                # file not downloaded
+        queue_fail("xml", f, exc)
+        if verbose:
+            print(f"--- Warning: XML file '{f}' not downloaded")
+            print(f"--- Warning: processor '{wget}' not found")
+    except DownloadError as exc:                # HTTP status or network error
+        queue_fail("xml", f, exc)
+        if verbose:
+            print(f"--- Warning: XML file '{f}' not downloaded")
+            print("--- Warning:", exc)
+    except subprocess.CalledProcessError as exc:
+                                                # processor not found
+        queue_fail("xml", f, exc)
+        if verbose:
+            print(f"--- Warning: XML file '{f}' not downloaded")
+            print("--- Warning:", exc)
+    except subprocess.TimeoutExpired as exc:
+                                                # timeout
+        queue_fail("xml", f, exc)
+        if verbose:
+            print(f"--- Warning: XML file '{f}' not downloaded")
+            print("--- Warning:", exc)
+    except:                                     # any unspecified error
+        queue_fail("xml", f, sys.exc_info()[1])
+        if verbose:
+            tmp_a = "    any unspecified error"
+            print(f"--- Warning: XML file '{f}' not",
+                  f"downloaded\n{tmp_a}")
+            print("--- ", sys.exc_info()[0])
+
+    if debugging:
+        print("+++ <CTANLoad:dload_XML_file")
+
+# ------------------------------------------------------------------
+def dload_XML_files(p, pdfs=None):              # Function dload_XML_files:
                                                 # Downloads XML package files.
     """
     Downloads XML package files.
 
+    Pipeline with three stages, connected by queues of limited length:
+    XML download (-j workers) --> analysis of XML files (analyze_jobs workers)
+    --> PDF download (-jp workers, only with -f).
+
     Rewrites the global topicspackages, number, counter, pdfcounter,
-    yearpackages.
+    yearpackages, XML_state, analyze_queue, pdf_queue.
 
-    parameter:
+    parameters:
     p: packages a/o selected_packages
+    pdfs: open PDF jobs of an interrupted load (see queue_open)
 
     global variables:
     topicspackages  python dictionary: list of topics and their packages
@@ -1842,13 +4029,12 @@ def dload_XML_files(p):                         # Function dload_XML_files:
     pdfcounter      counter for downloaded PDF files
     yearpackages    python dictionary: list of years and their
                     packagesauthorpackage_file
+    XML_state       python dictionary: validators of the XML files
+    analyze_queue   queue: XML files to be analyzed
+    pdf_queue       queue: PDF files to be downloaded
 
     possible messages:
-    + Info: XML file for package '{0}' downloaded ('{1}.xml' on PC) 
-    + Warning:
     + Warning: maximum number ({0}) of downloaded XML+PDF files exceeded
-    + Warning: processor '{0}' not found
-    + Warning: XML file '{0}' not downloaded
     """
 
     # 2.30   2024-03-04 Function dload_XML_files revised
@@ -1863,8 +4049,21 @@ def dload_XML_files(p):                         # Function dload_XML_files:
     #                   (downloading a XML file)
     # 2.46   2025-02-04 messages in functions' __doc__ texts listed
     # 2.49   2025-02-11 more f-strings
-
-    # dload_XML_file --> analyze_XML_file
+    # 2.51   2026-10-18 downloads in a pool of -j worker threads
+    # 2.54   2026-10-18 in dload_XML_files: pipeline stages XML download -->
+    #                   analysis --> PDF download
+    # 2.60   2026-10-18 in dload_XML_files: open PDF jobs of an interrupted
+    #                   load handed over to the PDF download stage
+    # 2.76   2026-10-18 in dload_XML_files: packages with missing PDF files
+    #                   loaded once more (-f); no validators for XML files
+    #                   which are not well-formed
+    # 2.76   2026-10-18 in dload_XML_files: open PDF jobs reserved against -n
+
+    # dload_XML_files --> check_PDF_presence
+    # dload_XML_files --> reserve_PDF_file
+    # dload_XML_files --> dload_XML_worker
+    # dload_XML_files --> analyze_XML_worker
+    # dload_XML_files --> dload_PDF_worker
 
     global topicspackages                       # python dictionary: list of
                                                 # topics and their packages
@@ -1876,57 +4075,69 @@ def dload_XML_files(p):                         # Function dload_XML_files:
     global yearpackages                         # python dictionary: list of
                                                 # years and their
                                                 # packagesauthorpackage_file
+    global XML_state                            # python dictionary: validators
+                                                # of the XML files
+    global analyze_queue                        # queue: XML files to be
+                                                # analyzed
+    global pdf_queue                            # queue: PDF files to be
+                                                # downloaded
 
     if debugging:
         print("+++ >CTANLoad:dload_XML_files")
 
-    call2       = "https://ctan.org/xml/2.0/pkg/"
-                                                # base URL for package files
-    parameter_P = "-P" + direc                  # parameter -P for wget
-
-    for f in p:                                 # all packages found in 'packages'
-        if p2.match(f) and (counter + pdfcounter < number):
-                                                # file name matches name_template
-            counter     = counter + 1           # ioncrement counter
-            parameter_O = "-O" + f + ext        # parameter -O for wget
-
-            callx = [wget, parameter_O, parameter_P, call2 + f]
-                                                # wget  -O xyz.xml -P
-                                                # .\direc https://ctan.org/xml/2.0/pkg/xyz
-            
-            try:                                # try to download the XML
-                                                # file (packages)
-                process = subprocess.run(callx, check=True,
-                                         timeout=timeoutDefault,
-                                         stderr=subprocess.PIPE,
-                                         universal_newlines=True)
-
-                if verbose:
-                    print(f"----- Info: XML file for package",
-                          f"'{f}' downloaded ('{direc + f}.xml' on PC)") 
-                analyze_XML_file(f + ext)       # if download is set: analyze
-                                                # the associated XML file
-            except FileNotFoundError as exc:    # file not found /
-                                                # file not downloaded
-                if verbose:
-                    print(f"--- Warning: XML file '{file}' not downloaded")
-                    print(f"--- Warning: processor '{wget}' not found")
-            except subprocess.CalledProcessError as exc:
-                                                # processor not found
-                if verbose:
-                    print(f"--- Warning: XML file '{file}' not downloaded")
-                    print("--- Warning:", exc)
-            except subprocess.TimeoutExpired as exc:
-                                                # timeout
-                if verbose:
-                    print(f"--- Warning: XML file '{file}' not downloaded")
-                    print("--- Warning:", exc)
-            except:                             # any unspecified error
-                if verbose:
-                    tmp_a = "    any unspecified error"
-                    print(f"--- Warning: XML file '{file}' not",
-                          f"downloaded\n{tmp_a}")
-                    print("--- ", sys.exc_info()[0])
+    check_PDF_presence()                        # packages with missing PDF
+                                                # files (-f)
+
+    analyze_queue = Queue(queue_size)           # stage 2: analysis
+    analyzers     = []
+    for i in range(analyze_jobs):
+        thr = Thread(target=analyze_XML_worker)
+        thr.start()
+        analyzers.append(thr)
+
+    if download:                                # stage 3: PDF download
+        pdf_queue = Queue(queue_size)
+        loaders   = []
+        for i in range(pdf_jobs):
+            thr = Thread(target=dload_PDF_worker)
+            thr.start()
+            loaders.append(thr)
+        for job in (pdfs or []):                # open PDF jobs of an
+            if reserve_PDF_file(job[3]):        # interrupted load
+                pdf_queue.put(job)
+
+    todo = iter(p)                              # packages still to be processed
+                                                # (shared by all workers)
+    if jobs <= 1:                               # stage 1: downloads in series
+        dload_XML_worker(todo)
+    else:                                       # stage 1: downloads in parallel
+        workers = []
+        for i in range(jobs):
+            thr = Thread(target=dload_XML_worker, args=(todo,))
+            thr.start()
+            workers.append(thr)
+        for thr in workers:
+            thr.join()
+
+    for thr in analyzers:                       # end of stage 2
+        analyze_queue.put(None)
+    for thr in analyzers:
+        thr.join()
+    analyze_queue = None
+
+    if download:                                # end of stage 3
+        for thr in loaders:
+            pdf_queue.put(None)
+        for thr in loaders:
+            thr.join()
+        pdf_queue = None
+
+    for f in PDF_XML:                           # PDF files with errors: to be
+        if f in XML_state:                      # loaded once more
+            XML_state[f] = XML_state[f][0:3] + (False,)
+    for f in not_well_formed:                   # XML files not well-formed:
+        XML_state.pop(f, None)                  # no validators (loaded
+                                                # unconditionally next time)
 
     if counter + pdfcounter >= number:          # limit for downloaded files
         if verbose:
@@ -1936,6 +4147,231 @@ def dload_XML_files(p):                         # Function dload_XML_files:
     if debugging:
         print("+++ <CTANLoad:dload_XML_files")
 
+# ------------------------------------------------------------------
+def dload_XML_worker(todo):                     # Function dload_XML_worker:
+                                                # Worker for the download of XML
+                                                # package files.
+    """
+    Worker for the download of XML package files.
+
+    Takes the next package from todo, as long as the maximum number of
+    downloaded files (incl. queued a/o running PDF downloads) is not reached
+    and there is budget left (-nb, -tb).
+
+    Rewrites the global counter.
+
+    parameter:
+    todo: iterator over the packages (shared by all workers)
+
+    global variable:
+    counter         counter for downloadd XML and PDF files
+    """
+
+    # 2.51   2026-10-18 new function dload_XML_worker
+    # 2.63   2026-10-18 in dload_XML_worker: byte and time budgets
+    # 2.76   2026-10-18 in dload_XML_worker: queued a/o running PDF downloads
+    #                   count against -n
+
+    # dload_XML_worker --> check_budget
+    # dload_XML_worker --> dload_XML_file
+
+    global counter                              # counter for downloadd XML and
+                                                # PDF files
+
+    while True:
+        if not check_budget():                  # byte a/o time budget
+            return                              # exhausted
+        with dload_lock:                        # the next package and the
+                                                # counters are shared
+            f = next(todo, None)
+            while (f != None) and not p2.match(f):
+                f = next(todo, None)            # file name matches
+                                                # name_template
+            if (f == None) or \
+               (counter + pdfcounter + pdfpending >= number):
+                return                          # nothing more to do (queued
+                                                # PDF files count, too)
+            counter = counter + 1               # increment counter (reserved
+                                                # before the download)
+        dload_XML_file(f)                       # download + analyze
+
+# ------------------------------------------------------------------
+def extract_worker(shard):                      # Function extract_worker:
+                                                # Parses a shard of XML files
+                                                # (in a worker process).
+    """
+    Parses a shard of package XML files (in a worker process of
+    generate_topicspackages a/o in series): hash and facts of each file.
+
+    Returns a list of (SHA-256, facts) in the order of the shard.
+
+    parameter:
+    shard: list of (XML file name, local file name)
+    """
+
+    # 2.72   2026-10-18 new function extract_worker
+
+    # extract_worker --> get_file_hash
+    # extract_worker --> get_XML_facts
+
+    if debugging:
+        print("+++ -CTANLoad:extract_worker")
+
+    return [(get_file_hash(direc + name), get_XML_facts(fext))
+            for (fext, name) in shard]
+
+# ------------------------------------------------------------------
+def find_XML_file(file):                        # Function find_XML_file: Finds
+                                                # a local XML file (a/o its
+                                                # compressed form).
+    """
+    Finds a local XML file: file itself a/o the compressed file file.gz.
+
+    Returns the name of the existing file or None.
+
+    parameter:
+    file : name of the XML file (abc.xml)
+    """
+
+    # 2.62   2026-10-18 new function find_XML_file
+
+    if debugging:
+        print("+++ -CTANLoad:find_XML_file")
+
+    if path.exists(file):                       # uncompressed
+        return file
+    if path.exists(file + gz_ext):              # compressed (option -z)
+        return file + gz_ext
+    return None
+
+# ------------------------------------------------------------------
+def generate_catalog_db(part):                  # Function generate_catalog_db:
+                                                # Writes the SQLite catalog
+                                                # (option -sq).
+    """
+    Writes one part of the SQLite catalog CTAN.db (option -sq):
+
+    "catalog": tables authors, packages, topics, licenses (key --> values),
+               topicspackages, packagetopics, authorpackages,
+               licensepackages, yearpackages (key, package; indexed on both
+               columns)
+    "toc":     table documentation (XML_toc: href, xmlfile, fkey, onename)
+
+    Each part is replaced in one transaction (WAL mode): readers (CTANOut
+    -sq, several processes) see either the old or the new rows. The rows
+    are inserted in the order of the dictionaries (ORDER BY rowid restores
+    it).
+
+    parameter:
+    part : "catalog" (1st pickle file) a/o "toc" (2nd pickle file)
+
+    possible (error) messages:
+    + Info: SQLite catalog '{0}' written ({1})
+    + Warning: SQLite catalog '{0}' cannot be written
+    """
+
+    # 2.74   2026-10-18 new function generate_catalog_db
+    
+    if debugging:
+        print("+++ >CTANLoad:generate_catalog_db")
+
+    db_name = direc + catalog_file              # path of the SQLite catalog
+    if part == "catalog":
+        tables = [("authors", "key TEXT PRIMARY KEY, givenname TEXT, " +
+                   "familyname TEXT", [(k,) + tuple(authors[k])
+                                       for k in authors]),
+                  ("packages", "key TEXT PRIMARY KEY, name TEXT, " +
+                   "caption TEXT", [(k,) + tuple(packages[k])
+                                    for k in packages]),
+                  ("topics", "key TEXT PRIMARY KEY, details TEXT",
+                   [(k, topics[k]) for k in topics]),
+                  ("licenses", "key TEXT PRIMARY KEY, name TEXT, free TEXT",
+                   [(k,) + tuple(licenses[k]) for k in licenses])]
+        for (name, data) in (("topicspackages", topicspackages),
+                             ("packagetopics", packagetopics),
+                             ("authorpackages", authorpackages),
+                             ("licensepackages", licensepackages),
+                             ("yearpackages", yearpackages)):
+            tables.append((name, "key TEXT, package TEXT",
+                           [(k, g) for k in data for g in data[k]]))
+    else:
+        tables = [("documentation", "href TEXT PRIMARY KEY, xmlfile TEXT, " +
+                   "fkey TEXT, onename TEXT",
+                   [(h,) + tuple(XML_toc[h]) for h in XML_toc])]
+
+    try:
+        db = sqlite3.connect(db_name, timeout=timeoutDefault)
+        db.execute("PRAGMA journal_mode=WAL")   # concurrent readers
+        with db:                                # one transaction
+            db.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT " +
+                       "PRIMARY KEY, value TEXT)")
+            for (name, columns, rows) in tables:
+                db.execute(f"CREATE TABLE IF NOT EXISTS {name} ({columns})")
+                if not "PRIMARY KEY" in columns:
+                    db.execute(f"CREATE INDEX IF NOT EXISTS {name}_key " +
+                               f"ON {name} (key)")
+                    db.execute(f"CREATE INDEX IF NOT EXISTS {name}_package " +
+                               f"ON {name} (package)")
+                db.execute(f"DELETE FROM {name}")
+                if rows:
+                    marks = ", ".join(["?"] * len(rows[0]))
+                    db.executemany(f"INSERT INTO {name} VALUES ({marks})",
+                                   rows)
+            db.execute("INSERT OR REPLACE INTO meta VALUES (?, ?)",
+                       (part, f"{prg_name} {prg_version} " +
+                              time.strftime("%Y-%m-%d %X")))
+        db.close()
+        if verbose:
+            print(f"--- Info: SQLite catalog '{db_name}' written ({part})")
+    except sqlite3.Error:                       # not successfull
+        if verbose:
+            print(f"--- Warning: SQLite catalog '{db_name}' cannot be written")
+    
+    if debugging:
+        print("+++ <CTANLoad:generate_catalog_db")
+
+# ------------------------------------------------------------------
+def generate_index():                           # Function generate_index:
+                                                # Writes the index file
+                                                # (key --> packages).
+    """
+    Writes the index file CTAN.idx: topicspackages, authorpackages,
+    licensepackages as JSON lines (one line ["<name>", {key: [packages]}] per
+    dictionary). A reader needs one read of the file and parses only the
+    line it needs (see load_index).
+
+    The file is written as CTAN.idx.part and renamed at the end.
+
+    no parameter
+
+    possible (error) messages:
+    + Info: index file '{0}' written
+    + Warning: index file '{0}' cannot be written
+    """
+
+    # 2.73   2026-10-18 new function generate_index
+    
+    if debugging:
+        print("+++ >CTANLoad:generate_index")
+
+    index_name = direc + idx_file               # path of the index file
+    try:
+        with open(index_name + part_ext, "w", encoding="utf-8") as out:
+            for (name, data) in (("topicspackages", topicspackages),
+                                 ("authorpackages", authorpackages),
+                                 ("licensepackages", licensepackages)):
+                out.write(json.dumps([name, data], ensure_ascii=False,
+                                     separators=(",", ":")) + "\n")
+        os.replace(index_name + part_ext, index_name)
+        if verbose:
+            print(f"--- Info: index file '{index_name}' written")
+    except OSError:
+        if verbose:
+            print(f"--- Warning: index file '{index_name}' cannot be written")
+    
+    if debugging:
+        print("+++ <CTANLoad:generate_index")
+
 # ------------------------------------------------------------------
 def generate_lists():                           # Function generate_lists:
                                                 # Generates some special files
@@ -2103,11 +4539,37 @@ def generate_lists():                           # Function generate_lists:
         print("+++ <CTANLoad:generate_lists")
    
 # ------------------------------------------------------------------
-def generate_pickle1():                         # Function generate_pickle1:
-                                                # pickle dump: actual authors,
-                                                # packages, licenses, topics,
-                                                # topicspackages, packagetopics,
-                                                # authorpackages,
+def generate_part_journal(url, file, etag, modified):
+                                                # Function generate_part_journal:
+                                                # Writes the journal of a .part
+                                                # file.
+    """
+    Writes the journal of a partially downloaded file (file.jnl).
+
+    parameters:
+    url      : URL of the file
+    file     : name of the local file (without .part)
+    etag     : ETag of the response
+    modified : Last-Modified of the response
+    """
+
+    # 2.55   2026-10-18 new function generate_part_journal
+
+    if debugging:
+        print("+++ -CTANLoad:generate_part_journal")
+
+    try:
+        with open(file + journal_ext, "bw") as jnl:
+            pickle.dump((url, etag, modified), jnl)
+    except OSError:                             # not successfull: download
+        pass                                    # is not resumable
+
+# ------------------------------------------------------------------
+def generate_pickle1():                         # Function generate_pickle1:
+                                                # pickle dump: actual authors,
+                                                # packages, licenses, topics,
+                                                # topicspackages, packagetopics,
+                                                # authorpackages,
                                                 # licensepackages, yearpackages
     """
     pickle dump: 
@@ -2116,6 +4578,10 @@ def generate_pickle1():                         # Function generate_pickle1:
 
     no parameter
 
+    The index file CTAN.idx and the sectioned catalog CTAN.sec are written,
+    too (generate_index, generate_sections), and with -sq the SQLite catalog
+    CTAN.db (generate_catalog_db).
+
     possible (error) messages:
     + Info: pickle file '{0}' written
     + Warning: pickle file '{0}' cannot be loaded a/o written
@@ -2123,6 +4589,13 @@ def generate_pickle1():                         # Function generate_pickle1:
 
     # 2.46   2025-02-04 messages in functions' __doc__ texts listed
     # 2.49   2025-02-11 more f-strings
+    # 2.73   2026-10-18 in generate_pickle1: index file written
+    # 2.74   2026-10-18 in generate_pickle1: SQLite catalog written (-sq)
+    # 2.75   2026-10-18 in generate_pickle1: sectioned catalog written
+
+    # generate_pickle1 --> generate_index
+    # generate_pickle1 --> generate_sections
+    # generate_pickle1 --> generate_catalog_db
     
     if debugging:
         print("+++ >CTANLoad:generate_pickle1")
@@ -2170,6 +4643,10 @@ def generate_pickle1():                         # Function generate_pickle1:
         if verbose:
             print(f"--- Warning: pickle file '{pickle_name1}' cannot",
                   "be loaded a/o written")
+    generate_index()                            # write CTAN.idx
+    generate_sections()                         # write CTAN.sec
+    if sqlite:                                  # option -sq
+        generate_catalog_db("catalog")          # write CTAN.db
     
     if debugging:
         print("+++ <CTANLoad:generate_pickle1")
@@ -2193,6 +4670,9 @@ def generate_pickle2():                         # Function generate_pickle2:
 
     # 2.46   2025-02-04 messages in functions' __doc__ texts listed
     # 2.49   2025-02-11 more f-strings
+    # 2.74   2026-10-18 in generate_pickle2: SQLite catalog written (-sq)
+
+    # generate_pickle2 --> generate_catalog_db
     
     if debugging:
         print("+++ >CTANLoad:generate_pickle2")
@@ -2209,10 +4689,335 @@ def generate_pickle2():                         # Function generate_pickle2:
         if verbose:
             print(f"--- Warning: pickle file '{pickle_name2}' cannot",
                   "be loaded a/o written")
+    if sqlite:                                  # option -sq
+        generate_catalog_db("toc")              # write CTAN.db
     
     if debugging:
         print("+++ <CTANLoad:generate_pickle2")
 
+# ------------------------------------------------------------------
+def generate_pickle3():                         # Function generate_pickle3:
+                                                # pickle dump: actual XML_state
+                                                # (validators of the XML files)
+    """
+    pickle dump:
+    needs actual XML_state, PDF_state:
+    XML_state     : validators (ETag, Last-Modified, hash) of the XML files
+    PDF_state     : validators and hashes of the PDF files
+
+    no parameter
+
+    possible (error) messages:
+    + Info: pickle file '{0}' written
+    + Warning: pickle file '{0}' cannot be loaded a/o written
+    """
+
+    # 2.53   2026-10-18 new function generate_pickle3
+    # 2.56   2026-10-18 in generate_pickle3: PDF_state added
+    
+    if debugging:
+        print("+++ >CTANLoad:generate_pickle3")
+
+    pickle_name3  = direc + pkl_file3
+    try:
+        pickle_file3  = open(pickle_name3, "bw")# open the 3rd .pkl file
+        pickle_data3  = (XML_state, PDF_state)  # prepare the data
+        pickle.dump(pickle_data3, pickle_file3) # dump the data
+        pickle_file3.close()                    # close the file
+        if verbose:
+            print(f"--- Info: pickle file '{pickle_name3}' written")
+    except:                                     # not successfull
+        if verbose:
+            print(f"--- Warning: pickle file '{pickle_name3}' cannot",
+                  "be loaded a/o written")
+    
+    if debugging:
+        print("+++ <CTANLoad:generate_pickle3")
+
+# ------------------------------------------------------------------
+def generate_pickle4():                         # Function generate_pickle4:
+                                                # pickle dump: cache for the
+                                                # catalog files
+    """
+    pickle dump (cache for the catalog files):
+    time of download, source (-src), authors, packages, topics, licenses
+
+    no parameter
+
+    possible (error) messages:
+    + Info: pickle file '{0}' written
+    + Warning: pickle file '{0}' cannot be loaded a/o written
+    """
+
+    # 2.59   2026-10-18 new function generate_pickle4
+    
+    if debugging:
+        print("+++ >CTANLoad:generate_pickle4")
+
+    pickle_name4  = direc + pkl_file4
+    try:
+        pickle_file4  = open(pickle_name4, "bw")# open the 4th .pkl file
+        pickle_data4  = (time.time(), source, authors, packages, topics,
+                         licenses)              # prepare the data
+        pickle.dump(pickle_data4, pickle_file4) # dump the data
+        pickle_file4.close()                    # close the file
+        if verbose:
+            print(f"--- Info: pickle file '{pickle_name4}' written")
+    except:                                     # not successfull
+        if verbose:
+            print(f"--- Warning: pickle file '{pickle_name4}' cannot",
+                  "be loaded a/o written")
+    
+    if debugging:
+        print("+++ <CTANLoad:generate_pickle4")
+
+# ------------------------------------------------------------------
+def generate_pickle5():                         # Function generate_pickle5:
+                                                # pickle dump: facts of the
+                                                # XML files
+    """
+    pickle dump:
+    needs actual XML_facts:
+    XML_facts     : file name, size, mtime, hash, and facts (topics, authors,
+                    licenses, year) of the XML files
+
+    no parameter
+
+    possible (error) messages:
+    + Info: pickle file '{0}' written
+    + Warning: pickle file '{0}' cannot be loaded a/o written
+    """
+
+    # 2.71   2026-10-18 new function generate_pickle5
+    
+    if debugging:
+        print("+++ >CTANLoad:generate_pickle5")
+
+    pickle_name5  = direc + pkl_file5
+    try:
+        pickle_file5  = open(pickle_name5, "bw")# open the 5th .pkl file
+        pickle.dump(XML_facts, pickle_file5)    # dump the data
+        pickle_file5.close()                    # close the file
+        if verbose:
+            print(f"--- Info: pickle file '{pickle_name5}' written")
+    except:                                     # not successfull
+        if verbose:
+            print(f"--- Warning: pickle file '{pickle_name5}' cannot",
+                  "be loaded a/o written")
+    
+    if debugging:
+        print("+++ <CTANLoad:generate_pickle5")
+
+# ------------------------------------------------------------------
+def generate_sections():                        # Function generate_sections:
+                                                # Writes the sectioned catalog
+                                                # (one section per dictionary).
+    """
+    Writes the sectioned catalog CTAN.sec: the dictionaries of the 1st pickle
+    file, each pickled on its own. The file begins with a pickled directory
+    {name: (offset, length)}; the offsets count from the end of the
+    directory. A reader (CTANOut) loads the directory and unpickles a
+    dictionary only when it is accessed for the first time.
+
+    The file is written as CTAN.sec.part and renamed at the end.
+
+    no parameter
+
+    possible (error) messages:
+    + Info: sectioned catalog '{0}' written
+    + Warning: sectioned catalog '{0}' cannot be written
+    """
+
+    # 2.75   2026-10-18 new function generate_sections
+    
+    if debugging:
+        print("+++ >CTANLoad:generate_sections")
+
+    sec_name  = direc + sec_file                # path of the sectioned catalog
+    directory = {}                              # name --> (offset, length)
+    sections  = []                              # pickled dictionaries
+    offset    = 0
+    for (name, data) in (("authors", authors), ("packages", packages),
+                         ("topics", topics), ("licenses", licenses),
+                         ("topicspackages", topicspackages),
+                         ("packagetopics", packagetopics),
+                         ("authorpackages", authorpackages),
+                         ("licensepackages", licensepackages),
+                         ("yearpackages", yearpackages)):
+        tmp = pickle.dumps(data)
+        directory[name] = (offset, len(tmp))
+        sections.append(tmp)
+        offset += len(tmp)
+    try:
+        with open(sec_name + part_ext, "wb") as out:
+            pickle.dump(directory, out)
+            for tmp in sections:
+                out.write(tmp)
+        os.replace(sec_name + part_ext, sec_name)
+        if verbose:
+            print(f"--- Info: sectioned catalog '{sec_name}' written")
+    except OSError:
+        if verbose:
+            print(f"--- Warning: sectioned catalog '{sec_name}' cannot be",
+                  "written")
+    
+    if debugging:
+        print("+++ <CTANLoad:generate_sections")
+
+# ------------------------------------------------------------------
+def generate_telemetry():                       # Function generate_telemetry:
+                                                # Writes the telemetry report
+                                                # and the Prometheus textfile.
+    """
+    Aggregates the records of the downloads (option -tm) per class (catalog,
+    xml, pdf): number of requests per HTTP status, bytes, retries, latency
+    and size histograms, percentiles and throughput.
+
+    Writes a JSON report (xyz.telemetry.json) and a Prometheus textfile
+    (xyz.prom; written under a temporary name and renamed, as expected by the
+    textfile collector of the node exporter).
+
+    no parameter
+
+    global variables:
+    telemetry_records   records of the downloads
+
+    possible (error) messages:
+    + Info: Prometheus textfile written to '{0}'
+    + Info: telemetry report written to '{0}'
+    + Warning: Prometheus textfile not written to '{0}'
+    + Warning: telemetry report not written to '{0}'
+    """
+
+    # 2.68   2026-10-18 new function generate_telemetry
+
+    if debugging:
+        print("+++ >CTANLoad:generate_telemetry")
+
+    def percentile(values, q):                  # nearest rank of sorted values
+        if len(values) == 0:
+            return 0
+        return values[min(len(values) - 1, int(q * len(values)))]
+
+    elapsed = time.time() - budget_start        # duration of the session
+    classes = {}                                # aggregated values per class
+    for kind in url_classes:
+        records   = [r for r in telemetry_records if r[0] == kind]
+        durations = sorted(r[4] for r in records)
+        sizes     = [r[3] for r in records]
+        status    = {}                          # requests per HTTP status
+        for r in records:
+            status[str(r[2])] = status.get(str(r[2]), 0) + 1
+        nbytes    = sum(sizes)
+        busy      = sum(durations)              # sum of the request durations
+        classes[kind] = {
+            "requests"   : len(records),
+            "status"     : status,
+            "bytes"      : nbytes,
+            "retries"    : sum(r[5] for r in records),
+            "duration"   : {"sum" : round(busy, 4),
+                            "min" : round(percentile(durations, 0), 4),
+                            "p50" : round(percentile(durations, 0.5), 4),
+                            "p90" : round(percentile(durations, 0.9), 4),
+                            "p99" : round(percentile(durations, 0.99), 4),
+                            "max" : round(percentile(durations, 1), 4)},
+            "latency_histogram" : {str(b): len([d for d in durations
+                                                if d <= b])
+                                   for b in latency_buckets},
+            "size_histogram"    : {str(b): len([n for n in sizes if n <= b])
+                                   for b in size_buckets},
+            "throughput" : round(nbytes / busy) if busy > 0 else 0}
+        classes[kind]["latency_histogram"]["+Inf"] = len(durations)
+        classes[kind]["size_histogram"]["+Inf"]    = len(sizes)
+
+    total   = sum(r[3] for r in telemetry_records)
+    result  = {"date"       : time.strftime("%Y-%m-%d %X"),
+               "program"    : prg_name + " " + prg_version,
+               "source"     : source,
+               "downloader" : downloader,
+               "jobs"       : jobs,
+               "pdf_jobs"   : pdf_jobs,
+               "elapsed"    : round(elapsed, 4),
+               "requests"   : len(telemetry_records),
+               "bytes"      : total,
+               "throughput" : round(total / elapsed) if elapsed > 0 else 0,
+               "classes"    : classes,
+               "records"    : [{"class": r[0], "url": r[1], "status": r[2],
+                                "bytes": r[3], "duration": round(r[4], 4),
+                                "retries": r[5]}
+                               for r in telemetry_records]}
+    try:
+        with open(telemetry_file, "w", encoding="utf-8") as out:
+            json.dump(result, out, indent=2, ensure_ascii=False)
+        if verbose:
+            print(f"--- Info: telemetry report written to '{telemetry_file}'")
+    except OSError:
+        print("--- Warning: telemetry report not written to",
+              f"'{telemetry_file}'")
+
+    lines = []                                  # lines of the textfile
+    lines.append("# HELP ctanload_requests_total Downloads by class and "
+                 "HTTP status (0: network error a/o timeout).")
+    lines.append("# TYPE ctanload_requests_total counter")
+    for kind in url_classes:
+        for (code, n) in sorted(classes[kind]["status"].items()):
+            lines.append(f'ctanload_requests_total{{class="{kind}",'
+                         f'status="{code}"}} {n}')
+    for (name, key, text) in [("bytes", "bytes", "Transferred bytes"),
+                              ("retries", "retries", "Repeated requests")]:
+        lines.append(f"# HELP ctanload_{name}_total {text} by class.")
+        lines.append(f"# TYPE ctanload_{name}_total counter")
+        for kind in url_classes:
+            lines.append(f'ctanload_{name}_total{{class="{kind}"}} '
+                         f'{classes[kind][key]}')
+    for (name, key, text) in [("request_duration_seconds",
+                               "latency_histogram", "Duration of the requests"),
+                              ("response_size_bytes",
+                               "size_histogram", "Size of the responses")]:
+        lines.append(f"# HELP ctanload_{name} {text} by class.")
+        lines.append(f"# TYPE ctanload_{name} histogram")
+        for kind in url_classes:
+            for (bound, n) in classes[kind][key].items():
+                lines.append(f'ctanload_{name}_bucket{{class="{kind}",'
+                             f'le="{bound}"}} {n}')
+            if key == "latency_histogram":
+                amount = classes[kind]["duration"]["sum"]
+            else:
+                amount = classes[kind]["bytes"]
+            lines.append(f'ctanload_{name}_sum{{class="{kind}"}} {amount}')
+            lines.append(f'ctanload_{name}_count{{class="{kind}"}} '
+                         f'{classes[kind]["requests"]}')
+    lines.append("# HELP ctanload_throughput_bytes_per_second Bytes per "
+                 "second of request duration by class.")
+    lines.append("# TYPE ctanload_throughput_bytes_per_second gauge")
+    for kind in url_classes:
+        lines.append(f'ctanload_throughput_bytes_per_second{{class="{kind}"}} '
+                     f'{classes[kind]["throughput"]}')
+    lines.append("# HELP ctanload_session_seconds Duration of the session.")
+    lines.append("# TYPE ctanload_session_seconds gauge")
+    lines.append(f"ctanload_session_seconds {result['elapsed']}")
+    lines.append("# HELP ctanload_session_throughput_bytes_per_second Bytes "
+                 "per second of the session (all downloads).")
+    lines.append("# TYPE ctanload_session_throughput_bytes_per_second gauge")
+    lines.append(f"ctanload_session_throughput_bytes_per_second "
+                 f"{result['throughput']}")
+    lines.append("# HELP ctanload_last_run_timestamp_seconds End of the "
+                 "session (Unix time).")
+    lines.append("# TYPE ctanload_last_run_timestamp_seconds gauge")
+    lines.append(f"ctanload_last_run_timestamp_seconds {round(time.time())}")
+    try:
+        with open(prom_file + part_ext, "w", encoding="utf-8") as out:
+            out.write("\n".join(lines) + "\n")
+        os.replace(prom_file + part_ext, prom_file)
+                                                # atomic for the collector
+        if verbose:
+            print(f"--- Info: Prometheus textfile written to '{prom_file}'")
+    except OSError:
+        print(f"--- Warning: Prometheus textfile not written to '{prom_file}'")
+
+    if debugging:
+        print("+++ <CTANLoad:generate_telemetry")
+
 # ------------------------------------------------------------------
 def generate_topicspackages():                  # Function
                                                 # generate_topicspackages:
@@ -2224,6 +5029,13 @@ def generate_topicspackages():                  # Function
     Generates/rewrites topicspackages, packagetopics, authorpackages,
     licensepackages, and yearpackages.
 
+    The facts of each package XML file (topics, authors, licenses, year) are
+    taken from XML_facts (5th pickle file); only new a/o changed XML files
+    (other name, size a/o mtime, and other hash) are parsed again
+    (get_XML_facts), in shards of extract_chunk files by extract_jobs worker
+    processes (option -jx). The dictionaries are built in the order of
+    packages. XML_facts is dumped, if it has been changed.
+
     no parameters
 
     global variables:
@@ -2235,15 +5047,30 @@ def generate_topicspackages():                  # Function
                         packagesauthorpackage_file
     file_not_found      Python set: XML file not found
     not_well_formed     Python set: XML file not well-formed/empty
+    XML_facts           python dictionary: facts of the XML files
 
     possible (error) messages:
     + Warning: local XML file for package '{0}' empty or not well-formed
     + Warning: local XML file for package '<file>' not found
     + Info: packagetopics, topicspackages, authorpackage," yearpackages collected
+    + Info: {0} package XML files parsed ({1} taken from '{2}')
+    + Warning: worker processes not usable; XML files parsed in series
     """
 
     # 2.46   2025-02-04 messages in functions' __doc__ texts listed
     # 2.49   2025-02-11 more f-strings
+    # 2.62   2026-10-18 in generate_topicspackages: compressed XML files (-z)
+    # 2.71   2026-10-18 in generate_topicspackages: facts of unchanged XML
+    #                   files taken from XML_facts (5th pickle file); parsing
+    #                   moved to get_XML_facts
+    # 2.72   2026-10-18 in generate_topicspackages: XML files parsed in worker
+    #                   processes (option -jx)
+
+    # generate_topicspackages --> load_XML_facts
+    # generate_topicspackages --> get_inventory
+    # generate_topicspackages --> get_file_hash
+    # generate_topicspackages --> extract_worker (in worker processes)
+    # generate_topicspackages --> generate_pickle5
 
     global topicspackages                       # python dictionary: list of
                                                 # topics and their packages
@@ -2263,126 +5090,119 @@ def generate_topicspackages():                  # Function
     if debugging:
         print("+++ >CTANLoad:generate_topicspackages")
 
-    yearpackages = {}
-
-    for f in packages:                          # all package XML files are
-                                                # loaded (+ analyzed) in series
-        tmpyears = []                           # initialize tmpyears
-        maxyears = '1970'                       # initialize maxyears
-        try:                                    # try to open and parse file
-            fext = f + ext                      # file name (with extension)
-            ff = open(fext, encoding="utf-8", mode="r")
-                                                # open file
+    if XML_facts == None:                       # 5th pickle file not yet
+        load_XML_facts()                        # loaded
 
-            try:
-                onePackage     = ET.parse(fext) # parse one XML file
-                onePackageRoot = onePackage.getroot()
-                                                # get root
-                kk             = list(onePackageRoot.iter("keyval"))
-                                                # all keyval elements in the
-                                                # XML file
-                aa             = list(onePackageRoot.iter("authorref"))
-                                                # all authorref elements in the
-                                                # XML file
-                ll             = list(onePackageRoot.iter("license"))
-                                                # all license elements in the
-                                                # XML file
-                mm             = list(onePackageRoot.iter("version"))
-                                                # all version elements in the
-                                                # XML file
-                nn             = list(onePackageRoot.iter("copyright"))
-                                                # all copyright elements in the
-                                                # XML file
-
-                for i in kk:                    # in keyval: one attribute: value
-                    key = i.get("value", empty) #   get attribute value
-                    if key in topicspackages:
-                        topicspackages[key].append(f)
-                    else:
-                        topicspackages[key] = [f]
-
-                    if f in packagetopics:
-                        packagetopics[f].append(key)
-                    else:
-                        packagetopics[f] = [key]
-
-                for j in aa:                    # in authorref: 4 attributes:
-                                                # givenname, familyname, key, id
-                    key1 = j.get("givenname", empty)
-                                                #   get attribute givenname
-                    key2 = j.get("familyname", empty)
-                                                #   get attribute familyname
-                    key3 = j.get("key", empty)  #   get attribute key
-                    key4 = j.get("id", empty)   #   get attribute id
-                    if key4 != empty:
-                        key3 = key4
-                    if key3 in authorpackages:
-                        authorpackages[key3].append(f)
-                    else:
-                        authorpackages[key3] = [f]
-
-                for k in ll:                    # in license: 2 attributes:
-                                                # type, free
-                    key5 = k.get("type", empty) #   get attribute type
-                    key6 = k.get("free", empty) #   get attribute free
-                    if key5 in licensepackages:
-                        licensepackages[key5].append(f)
-                    else:
-                        licensepackages[key5] = [f]
-
-                for m in mm:                    # in version: 2 attributes:
-                                                # date, number
-                    key7 = m.get("date", empty) #   get attribute date
-                    key8 = m.get("number", empty)
-                                                #   get attribute number
-                    tmp7 = re.split("[-]", key7)
-                for x in tmp7:
-                    if p10.match(x):            #   check: year matches
-                                                #   "^[12][09][01289][0-9]$"
-                        if x in tmpyears:
-                            tmpyears.append(x)
-                        else:
-                            tmpyears = [x]
-
-                for n in nn:                    # in copyright: 2 attributes:
-                                                # owner, year
-                    key9  = n.get("owner", empty)
-                                                #   get attribute owner
-                    key10 = n.get("year", empty)
-                                                #   get attribute year
-                    tmp10 = re.split("[, -]", key10)
-                for x in tmp10:
-                    if p10.match(x):            #   check: year matches
-                                                #   "^[12][09][01289][0-9]$"
-                        if x in tmpyears:
-                            tmpyears.append(x)
-                        else:
-                            tmpyears = [x]
-                            
-                if len(tmpyears) >= 1:
-                    maxyears = max(tmpyears)
-                
-                if maxyears in yearpackages:
-                    yearpackages[maxyears].append(f)
-                else:
-                    yearpackages[maxyears] = [f]
-               
-            except:                             # parsing was not successfull
-                if verbose:
-                    print(f"----- Warning: local XML file for",
-                          f"package '{f}' empty or not well-formed")
-                ff.close()
-                not_well_formed.add(f)          # append file name to the
-                                                # not_well_formed list
-        except FileNotFoundError:               # file not downloaded
+    yearpackages = {}
+    inv          = get_inventory()              # files in the OS folder
+    taken        = 0                            # number of XML files with
+                                                # facts from XML_facts
+    changed      = False                        # Flag: XML_facts changed
+    present      = []                           # packages with a local XML
+                                                # file
+    todo         = []                           # XML files to be parsed
+
+    for f in packages:                          # all package XML files
+        fext = f + ext                          # file name (with extension)
+        if fext in inv:                         # uncompressed
+            name = fext
+        elif fext + gz_ext in inv:              # compressed (option -z)
+            name = fext + gz_ext
+        else:                                   # file not downloaded
             if verbose and integrity:
                 print(f"----- Warning: local XML file for",
                       f"package '{f}' not found")
             file_not_found.add(f)               # append file name to the
                                                 # file_not_found list
+            continue
+
+        present.append(f)
+        (size, mtime) = inv[name]
+        entry         = XML_facts.get(f, None)  # facts of the last run
+        if (entry != None) and (entry[0:3] == (name, size, mtime)):
+            taken = taken + 1                   # unchanged XML file
+        elif (entry != None) and (entry[3] == get_file_hash(direc + name)):
+            XML_facts[f] = (name, size, mtime) + entry[3:]
+            taken        = taken + 1            # touched XML file, same
+            changed      = True                 # content: facts kept
+        else:                                   # new content: parse it
+            todo.append((f, fext, name, size, mtime))
+
+    shards  = [[(fext, name) for (f, fext, name, size, mtime) in
+                todo[i:i + extract_chunk]]
+               for i in range(0, len(todo), extract_chunk)]
+    results = []                                # (hash, facts) in the order
+                                                # of todo
+    if (extract_jobs > 1) and (len(shards) > 1):
+        try:                                    # shards parsed in worker
+                                                # processes
+            with ProcessPoolExecutor(max_workers = min(extract_jobs,
+                                                       len(shards))) as pool:
+                for r in pool.map(extract_worker, shards):
+                    results.extend(r)           # results in the order of the
+                                                # shards
+        except Exception:                       # no worker processes
+            if verbose:
+                print("--- Warning: worker processes not usable;",
+                      "XML files parsed in series")
+            results = []
+    if len(results) != len(todo):               # shards parsed in series
+        results = []
+        for shard in shards:
+            results.extend(extract_worker(shard))
+
+    for i in range(len(todo)):                  # new facts
+        (f, fext, name, size, mtime) = todo[i]
+        XML_facts[f] = (name, size, mtime) + results[i]
+        changed      = True
+    parsed = len(todo)                          # number of parsed XML files
+
+    for f in present:                           # dictionaries in the order of
+                                                # packages
+        facts = XML_facts[f][4]
+        if facts == None:                       # parsing was not successfull
+            if verbose:
+                print(f"----- Warning: local XML file for",
+                      f"package '{f}' empty or not well-formed")
+            not_well_formed.add(f)              # append file name to the
+            continue                            # not_well_formed list
+
+        (keys, authorkeys, licensekeys, maxyears, hrefs) = facts
+        for key in keys:                        # topics
+            if key in topicspackages:
+                topicspackages[key].append(f)
+            else:
+                topicspackages[key] = [f]
+
+            if f in packagetopics:
+                packagetopics[f].append(key)
+            else:
+                packagetopics[f] = [key]
+
+        for key3 in authorkeys:                 # authors
+            if key3 in authorpackages:
+                authorpackages[key3].append(f)
+            else:
+                authorpackages[key3] = [f]
+
+        for key5 in licensekeys:                # licenses
+            if key5 in licensepackages:
+                licensepackages[key5].append(f)
+            else:
+                licensepackages[key5] = [f]
+
+        if maxyears in yearpackages:            # year
+            yearpackages[maxyears].append(f)
+        else:
+            yearpackages[maxyears] = [f]
+
+    if changed:
+        generate_pickle5()                      # dump XML_facts
     if verbose:
         print("--- Info: packagetopics, topicspackages, authorpackage,",
               "yearpackages collected")
+        print(f"--- Info: {parsed} package XML files parsed",
+              f"({taken} taken from '{direc + pkl_file5}')")
     
     if debugging:
         print("+++ <CTANLoad:generate_topicspackages")
@@ -2392,7 +5212,8 @@ def get_xyz_lpt():                              # Function get_xyz_lpt: Loads an
                                                 # analyzes xyz.lpt for topic
                                                 # templates.
     """
-    Loads and analyzes xyz.lpt for topic templates.
+    Loads and analyzes topicspackages (index file CTAN.idx a/o xyz.lpt) for
+    topic templates.
 
     Returns a list of selected packages.
     Rewrites the global number, counter, pdfcounter.
@@ -2411,6 +5232,10 @@ def get_xyz_lpt():                              # Function get_xyz_lpt: Loads an
 
     # 2.46   2025-02-04 messages in functions' __doc__ texts listed
     # 2.49   2025-02-11 more f-strings
+    # 2.73   2026-10-18 in get_xyz_lpt: topicspackages taken from the index
+    #                   file (load_index) instead of eval
+
+    # get_xyz_lpt --> load_index
 
     global number                               # maximum number of files to be
                                                 # loaded
@@ -2422,21 +5247,11 @@ def get_xyz_lpt():                              # Function get_xyz_lpt: Loads an
     if debugging:
         print("+++ -CTANLoad:get_xyz_lpt")
 
-    try:
-        f = open(topicpackage_file, encoding="utf-8", mode="r")
-                                                # open file
-        for line in f:
-            top, pack=eval(line.strip())
-            if p5.match(top):                   # collect packages with
+    for (top, pack) in load_index("topicspackages", topicpackage_file):
+        if p5.match(top):                       # collect packages with
                                                 # specified key_template
-                for g in pack:
-                    selected_packages_lpt.add(g)
-        f.close()                               # close file
-    except IOError:
-        if verbose:                             # there is an error
-            print(f"[CTANLoad] Error: local file '{topicpackage_file}' cannot",
-                  "be loaded; please call ctanload -l ... before")
-        sys.exit()                              # program terminates
+            for g in pack:
+                selected_packages_lpt.add(g)
     if len(selected_packages_lpt) == 0:         # no matching packages found
         if verbose:
             tmp_t = "topic"
@@ -2449,7 +5264,8 @@ def get_xyz_llp():                              # Function get_xyz_llp: Loads
                                                 # and analyzes xyz.llp for
                                                 # liocense templates.
     """
-    Loads and analyzes xyz.llp for license templates.
+    Loads and analyzes licensepackages (index file CTAN.idx a/o xyz.llp) for
+    license templates.
 
     Returns a list of selected packages.
     Rewrites the global number, counter, pdfcounter.
@@ -2468,6 +5284,10 @@ def get_xyz_llp():                              # Function get_xyz_llp: Loads
 
     # 2.46   2025-02-04 messages in functions' __doc__ texts listed
     # 2.49   2025-02-11 more f-strings
+    # 2.73   2026-10-18 in get_xyz_llp: licensepackages taken from the index
+    #                   file (load_index) instead of eval
+
+    # get_xyz_llp --> load_index
 
     global number                               # maximum number of files to be
                                                 # loaded
@@ -2479,28 +5299,18 @@ def get_xyz_llp():                              # Function get_xyz_llp: Loads
     if debugging:
         print("+++ -CTANLoad:get_xyz_llp")
 
-    try:
-        f = open(licensepackage_file, encoding="utf-8", mode="r")
-                                                # open file
-        for line in f:
-            lic, pack = eval(line.strip())
-            lic2      = licenses[lic][0]
-            lic3      = licenses[lic][1]
-            if lic3 == "true":
-                lic3 = "free"
-            else:
-                lic3 = "not free"
-            if p7.match(lic2) or p7.match(lic) or p7.match(lic3):
+    for (lic, pack) in load_index("licensepackages", licensepackage_file):
+        lic2      = licenses[lic][0]
+        lic3      = licenses[lic][1]
+        if lic3 == "true":
+            lic3 = "free"
+        else:
+            lic3 = "not free"
+        if p7.match(lic2) or p7.match(lic) or p7.match(lic3):
                                                 # collect packages with
                                                 # specified licenses
-                for g in pack:
-                    selected_packages_llp.add(g)
-        f.close()                               # close file
-    except IOError:
-        if verbose:                             # there is an error
-            print(f"[CTANLoad] Error: local file '{licensepackage_file}' cannot",
-                  "be loaded; please call ctanload -l ... before")
-        sys.exit()                              # program terminates
+            for g in pack:
+                selected_packages_llp.add(g)
     if len(selected_packages_llp) == 0:         # no matching packages found
         if verbose:
             tmp_l = "license"
@@ -2513,7 +5323,8 @@ def get_xyz_lap():                              # Function get_xyz_lap: Loads an
                                                 # analyzes xyz.lap for author
                                                 # templates.
     """
-    Loads and analyzes xyz.lap for author templates.
+    Loads and analyzes authorpackages (index file CTAN.idx a/o xyz.lap) for
+    author templates.
 
     Returns a list of selected packages.
     Rewrites the global number, counter, pdfcounter.
@@ -2532,6 +5343,10 @@ def get_xyz_lap():                              # Function get_xyz_lap: Loads an
 
     # 2.46   2025-02-04 messages in functions' __doc__ texts listed
     # 2.49   2025-02-11 more f-strings
+    # 2.73   2026-10-18 in get_xyz_lap: authorpackages taken from the index
+    #                   file (load_index) instead of eval
+
+    # get_xyz_lap --> load_index
 
     global number                               # maximum number of files to
                                                 # be loaded
@@ -2543,25 +5358,17 @@ def get_xyz_lap():                              # Function get_xyz_lap: Loads an
     if debugging:
         print("+++ -CTANLoad:get_xyz_lap")
 
-    try:
-        f = open(authorpackage_file, encoding="utf-8", mode="r")
-                                                # open file
-        for line in f:
-            auth, pack=eval(line.strip())       # get the items author and package
-            if authors[auth][1] != empty:       # extract author's familyname
-                auth2 = authors[auth][1]
-            else:
-                auth2 = authors[auth][0]
-            if p6.match(auth2):                 # collect packages with specified
-                                                # authors
-                for g in pack:
-                    selected_packages_lap.add(g)
-        f.close()                               # close file
-    except IOError:
-        if verbose:                             # there is an error
-            print(f"[CTANLoad] Error: local file '{authorpackage_file}' cannot",
-                  "be loaded; please call ctanload -l ... before")
-        sys.exit()                              # program terminates
+    for (auth, pack) in load_index("authorpackages", authorpackage_file):
+                                                # get the items author and
+                                                # package
+        if authors[auth][1] != empty:           # extract author's familyname
+            auth2 = authors[auth][1]
+        else:
+            auth2 = authors[auth][0]
+        if p6.match(auth2):                     # collect packages with
+                                                # specified authors
+            for g in pack:
+                selected_packages_lap.add(g)
     if len(selected_packages_lap) == 0:         # no matching packages found
         if verbose:
             tmp_a = "author"
@@ -2648,6 +5455,132 @@ def get_year_set():                             # Function get_package_set:
                   f"{tmp_y} template '{year_template}'")
     return tmp
 
+# ------------------------------------------------------------------
+def get_file_hash(file):                        # Function get_file_hash:
+                                                # Calculates the SHA-256 hash
+                                                # of a local file.
+    """
+    Calculates the SHA-256 hash of a local file (in blocks); a compressed XML
+    file (abc.xml.gz) is hashed by its uncompressed content.
+
+    Returns the hash (hex string) a/o "" (file not readable).
+
+    parameter:
+    file : name of the local file
+    """
+
+    # 2.53   2026-10-18 new function get_file_hash
+    # 2.65   2026-10-18 in get_file_hash: compressed XML files (-z) hashed by
+    #                   their content
+
+    if debugging:
+        print("+++ -CTANLoad:get_file_hash")
+
+    sha = hashlib.sha256()
+    try:
+        with (gzip.open(file, "rb") if file.endswith(gz_ext) else
+              open(file, "rb")) as f:
+            while True:
+                block = f.read(chunk_size)
+                if not block:
+                    break
+                sha.update(block)
+    except (OSError, EOFError, zlib.error):     # file not readable (a/o
+        return empty                            # compressed file corrupt)
+    return sha.hexdigest()
+
+# ------------------------------------------------------------------
+def get_file_key(href):                         # Function get_file_key:
+                                                # Constructs the key (10 digits)
+                                                # of a local PDF file name.
+    """
+    Constructs the key (10 digits) of a local PDF file name; the key is derived
+    from href (SHA-256), so a rebuilt XML_toc gets the same file names.
+
+    Returns the key (string).
+
+    parameter:
+    href : CTAN address of the PDF file
+    """
+
+    # 2.56   2026-10-18 new function get_file_key (instead of random numbers)
+
+    if debugging:
+        print("+++ -CTANLoad:get_file_key")
+
+    sha = hashlib.sha256(href.encode("utf-8")).hexdigest()
+    return str(1000000000 + int(sha, 16) % 9000000000)
+
+# ------------------------------------------------------------------
+def get_inventory():                            # Function get_inventory:
+                                                # Scans the OS folder once.
+    """
+    Scans the OS folder (option -d) once with os.scandir: name, size and
+    modification time of each file; the inventory is shared by all phases
+    until the OS folder is changed (see reset_inventory).
+
+    Returns the global inventory.
+    Rewrites the global inventory.
+
+    no parameters
+
+    global variable:
+    inventory           python dictionary: files in the OS folder
+    """
+
+    # 2.66   2026-10-18 new function get_inventory
+
+    global inventory                            # python dictionary: files in
+                                                # the OS folder
+
+    if debugging:
+        print("+++ -CTANLoad:get_inventory")
+
+    tmp = inventory                             # (reset_inventory may run in
+    if tmp != None:                             # another thread)
+        return tmp
+
+    tmp = {}
+    with os.scandir(direc) as entries:          # one pass over the OS folder
+        for entry in entries:
+            try:
+                if entry.is_file():             # file type from the directory
+                    st = entry.stat()           # entry; stat only once
+                    tmp[entry.name] = (st.st_size, st.st_mtime)
+            except OSError:                     # file just deleted
+                pass
+    inventory = tmp
+    return tmp
+
+# ------------------------------------------------------------------
+def get_PDF_cond(href, local):                  # Function get_PDF_cond:
+                                                # Validators for a conditional
+                                                # request of a PDF file.
+    """
+    Decides, whether a PDF file is requested conditionally: it has validators
+    of the last run (PDF_state), is still present in the OS folder and -fr is
+    not set.
+
+    Returns (etag, modified) for a conditional request a/o None (the file is
+    transferred). Used by dload_document_file and call_plan, so that the
+    plan and the load take the same decision.
+
+    parameters:
+    href : URL of the PDF file (key of PDF_state)
+    local: name of the local PDF file
+    """
+
+    # 2.76   2026-10-18 new function get_PDF_cond, split off from
+    #                   dload_document_file
+
+    if debugging:
+        print("+++ -CTANLoad:get_PDF_cond")
+
+    state = PDF_state.get(href, None)           # validators of the last run
+    if (not refresh) and (state != None) and path.exists(local):
+        return (state[0], state[1])
+    return None
+
 # ------------------------------------------------------------------
 def get_PDF_files(d):                           # Function get_PDF_files(d):
                                                 # Lists all PDF files in a
@@ -2660,13 +5593,18 @@ def get_PDF_files(d):                           # Function get_PDF_files(d):
     Rewrites the global PDF_toc.
     """
 
+    # 2.66   2026-10-18 in get_PDF_files: inventory of the OS folder
+
+    # get_PDF_files --> get_inventory
+
     global PDF_toc                              # global Python dictionary for
                                                 # PDF files
     
     if debugging:
         print("+++ >CTANLoad:get_PDF_files")
 
-    tmp  = os.listdir(d)                        # get OS folder list
+    tmp  = get_inventory() if d == direc else os.listdir(d)
+                                                # get OS folder list
     tmp2 = {}
     for f in tmp:                               # all PDF files in current OS
                                                 # folder
@@ -2679,36 +5617,765 @@ def get_PDF_files(d):                           # Function get_PDF_files(d):
         print("+++ <CTANLoad:get_PDF_files")
 
 # ------------------------------------------------------------------
-def get_XML_files(d):                           # Function get_XML_files: Lists
-                                                # all XML files in the current
-                                                # OS folder.
+def get_XML_cond(f):                            # Function get_XML_cond:
+                                                # Validators for a conditional
+                                                # request of a XML file.
     """
-    Lists all XML files in the current OS folder d.
+    Decides, whether the last analysis of a package may be reused: the XML
+    file has validators of the last run (XML_state), the local XML file is
+    present and well-formed, -fr is not set and (with -f) all PDF files of
+    the package are present (see check_PDF_presence).
 
-    Returns a list of XML files.
+    Returns (etag, modified) for a conditional request a/o None (the XML file
+    is downloaded and analyzed). Used by dload_XML_file and call_plan, so
+    that the plan and the load take the same decision.
 
     parameter:
-    d : name of the OS folder
-
-    no parameters
+    f: name of the package
     """
-    
+
+    # 2.76   2026-10-18 new function get_XML_cond, split off from
+    #                   dload_XML_file
+
+    # get_XML_cond --> find_XML_file
+
     if debugging:
-        print("+++ -CTANLoad:get_XML_files")
+        print("+++ -CTANLoad:get_XML_cond")
 
-    tmp  = os.listdir(d)                        # get OS folder list
-    tmp2 = []
-    
-    for f in tmp:
-        if p4.match(f) and not f in exclusion:  #   check: file name matches
-                                                #   "^.+[.]xml$"
-            tmp2.append(f)
-    return tmp2
+    state = XML_state.get(f, None)              # validators of the last run
+    if (not refresh) and (state != None) and \
+       (find_XML_file(f + ext) != None) and \
+       (f not in not_well_formed) and \
+       (state[3] or not download):
+        return (state[0], state[1])
+    return None
 
 # ------------------------------------------------------------------
-def load_XML_toc():                             # Function load_XML_toc():
-                                                # Loads pickle file 2 (which
-                                                # contains XML_toc).
+def get_XML_facts(file):                        # Function get_XML_facts:
+                                                # Parses one package XML file
+                                                # and extracts its facts.
+    """
+    Parses one package XML file and extracts its facts: values of the keyval
+    elements (topics), keys (a/o ids) of the authorref elements (authors),
+    types of the license elements (licenses), the latest year in version
+    (date) and copyright (year), and hrefs of the documentation elements.
+
+    Returns (topics, authors, licenses, year, hrefs) a/o None (file not
+    well-formed a/o empty).
+
+    parameter:
+    file : name of the XML file (with extension)
+    """
+
+    # 2.71   2026-10-18 new function get_XML_facts (parsing taken from
+    #                   generate_topicspackages)
+    # 2.72   2026-10-18 in get_XML_facts: hrefs of the documentation elements
+    #                   (for analyze_XML_file)
+
+    # get_XML_facts --> open_XML_file
+
+    if debugging:
+        print("+++ -CTANLoad:get_XML_facts")
+
+    tmpyears = []                               # initialize tmpyears
+    maxyears = '1970'                           # initialize maxyears
+    tmp7     = []                               # initialize the years of
+    tmp10    = []                               # version and copyright
+    try:
+        ff = open_XML_file(file)                # open file (a/o the compressed
+    except OSError:                             # file)
+        return None
+    try:
+        onePackage     = ET.parse(ff)           # parse one XML file
+        onePackageRoot = onePackage.getroot()   # get root
+    except:                                     # parsing was not successfull
+        ff.close()
+        return None
+    ff.close()                                  # close the XML file
+
+    keys        = [i.get("value", empty) for i in onePackageRoot.iter("keyval")]
+                                                # in keyval: attribute value
+    authorkeys  = []
+    for j in onePackageRoot.iter("authorref"):  # in authorref: 4 attributes:
+                                                # givenname, familyname, key, id
+        key3 = j.get("key", empty)              #   get attribute key
+        key4 = j.get("id", empty)               #   get attribute id
+        if key4 != empty:
+            key3 = key4
+        authorkeys.append(key3)
+    licensekeys = [k.get("type", empty) for k in onePackageRoot.iter("license")]
+                                                # in license: attribute type
+    hrefs       = [g.get("href", empty) for g in
+                   onePackageRoot.iter("documentation")]
+                                                # in documentation: attribute
+                                                # href
+
+    for m in onePackageRoot.iter("version"):    # in version: 2 attributes:
+                                                # date, number
+        key7 = m.get("date", empty)             #   get attribute date
+        tmp7 = re.split("[-]", key7)
+    for x in tmp7:
+        if p10.match(x):                        #   check: year matches
+                                                #   "^[12][09][01289][0-9]$"
+            if x in tmpyears:
+                tmpyears.append(x)
+            else:
+                tmpyears = [x]
+
+    for n in onePackageRoot.iter("copyright"):  # in copyright: 2 attributes:
+                                                # owner, year
+        key10 = n.get("year", empty)            #   get attribute year
+        tmp10 = re.split("[, -]", key10)
+    for x in tmp10:
+        if p10.match(x):                        #   check: year matches
+                                                #   "^[12][09][01289][0-9]$"
+            if x in tmpyears:
+                tmpyears.append(x)
+            else:
+                tmpyears = [x]
+
+    if len(tmpyears) >= 1:
+        maxyears = max(tmpyears)
+    return (keys, authorkeys, licensekeys, maxyears, hrefs)
+
+# ------------------------------------------------------------------
+def get_XML_files(d):                           # Function get_XML_files: Lists
+                                                # all XML files in the current
+                                                # OS folder.
+    """
+    Lists all XML files in the current OS folder d; a compressed XML file
+    (abc.xml.gz) is listed as abc.xml.
+
+    Returns a sorted list of XML files.
+
+    parameter:
+    d : name of the OS folder
+
+    no parameters
+    """
+
+    # 2.62   2026-10-18 in get_XML_files: compressed XML files (-z)
+    # 2.66   2026-10-18 in get_XML_files: inventory of the OS folder
+    # 2.76   2026-10-18 in get_XML_files: sorted list (fixed order)
+
+    # get_XML_files --> get_inventory
+    
+    if debugging:
+        print("+++ -CTANLoad:get_XML_files")
+
+    tmp  = get_inventory() if d == direc else os.listdir(d)
+                                                # get OS folder list
+    tmp2 = set()                                # (a file and its compressed
+                                                # form only once)
+    
+    for f in tmp:
+        if f.endswith(gz_ext):                  #   compressed XML file: name
+            f = f[0:-len(gz_ext)]               #   of the XML file
+        if p4.match(f) and not f in exclusion:  #   check: file name matches
+                                                #   "^.+[.]xml$"
+            tmp2.add(f)
+    return sorted(tmp2)                         # fixed order
+
+# ------------------------------------------------------------------
+def http_connection(scheme, host):              # Function http_connection:
+                                                # Gets an open HTTP connection
+                                                # for scheme and host.
+    """
+    Gets an open HTTP connection for scheme and host; each thread keeps its
+    own connections (keep-alive).
+
+    Returns a tuple (connection, flag: connection is reused).
+
+    parameters:
+    scheme : "http" a/o "https"
+    host   : host name (with port)
+
+    global variable:
+    http_pool           per thread: open HTTP connections
+    """
+
+    # 2.52   2026-10-18 new function http_connection
+
+    if not hasattr(http_pool, "connections"):
+        http_pool.connections = {}              # first call in this thread
+    key = (scheme, host)
+    if key in http_pool.connections:            # connection already open
+        return (http_pool.connections[key], True)
+    if scheme == "https":
+        conn = http.client.HTTPSConnection(host, timeout=timeoutDefault)
+    else:
+        conn = http.client.HTTPConnection(host, timeout=timeoutDefault)
+    http_pool.connections[key] = conn
+    return (conn, False)
+
+# ------------------------------------------------------------------
+def http_drop(scheme, host):                    # Function http_drop: Closes
+                                                # and forgets a HTTP connection.
+    """
+    Closes and forgets the HTTP connection for scheme and host (in the current
+    thread).
+
+    parameters:
+    scheme : "http" a/o "https"
+    host   : host name (with port)
+    """
+
+    # 2.52   2026-10-18 new function http_drop
+
+    conn = http_pool.connections.pop((scheme, host), None)
+    if conn != None:
+        conn.close()
+
+# ------------------------------------------------------------------
+def http_get(url, file, cond=None, resume=False, sink=None):
+                                                # Function http_get: Downloads
+                                                # one file with the built-in
+                                                # HTTP client.
+    """
+    Downloads one file with the built-in HTTP client; follows redirections.
+    Without resume the file may be transferred compressed (gzip); it is
+    stored uncompressed. It is written to file.part and renamed only when it
+    is complete.
+
+    Returns a tuple (HTTP status, ETag, Last-Modified); with status 304 (not
+    modified) the local file is not written.
+
+    With resume=True the file is first written to file.part (with a journal
+    file.jnl); an interrupted download is resumed in the next attempt (Range,
+    If-Range); a partial response, which does not start at the end of the
+    .part file, is not appended: the file is requested once more from its
+    first byte. A body shorter than announced (Content-Length, Content-Range)
+    a/o a gzip transfer without its end raises DownloadError (status 0,
+    "incomplete").
+
+    Rewrites the global pdfresumed, dbytes; counts the transferred bytes and
+    the repeated requests of this thread in request_info (telemetry).
+
+    parameters:
+    url    : URL of the file
+    file   : name of the local file
+    cond   : None or tuple (ETag, Last-Modified) for a conditional request
+    resume : Flag: resumable download
+    sink   : None or function which takes each block of the file (bytes)
+
+    global variables:
+    pdfresumed      counter for resumed PDF downloads
+    dbytes          counter for downloaded bytes
+
+    possible exceptions:
+    + DownloadError
+    + any exception of sink
+    """
+
+    # 2.52   2026-10-18 new function http_get
+    # 2.53   2026-10-18 in http_get: conditional requests (If-None-Match,
+    #                   If-Modified-Since)
+    # 2.55   2026-10-18 in http_get: resumable downloads (.part file, journal,
+    #                   Range, If-Range)
+    # 2.57   2026-10-18 in http_get: rate limit for bytes per second
+    # 2.61   2026-10-18 in http_get: blocks handed over to a sink
+    # 2.62   2026-10-18 in http_get: compressed transfer (gzip), not for
+    #                   resumable downloads
+    # 2.63   2026-10-18 in http_get: downloaded bytes counted (-nb)
+    # 2.68   2026-10-18 in http_get: transferred bytes and repeated requests
+    #                   counted per thread (-tm)
+    # 2.69   2026-10-18 in http_get: Retry-After handed over (DownloadError)
+    # 2.76   2026-10-18 in http_get: incomplete bodies (Content-Length,
+    #                   Content-Range, end of the gzip stream) detected
+    # 2.76   2026-10-18 in http_get: without resume the file is written to
+    #                   file.part and renamed when it is complete
+    # 2.76   2026-10-18 in http_get: a partial response (206) is only appended,
+    #                   if its range starts at the end of the .part file
+
+    # http_get --> http_connection
+    # http_get --> http_drop
+    # http_get --> load_part_journal
+    # http_get --> generate_part_journal
+    # http_get --> limit_rate
+
+    global pdfresumed                           # counter for resumed PDF
+                                                # downloads
+    global dbytes                               # counter for downloaded bytes
+
+    if debugging:
+        print("+++ -CTANLoad:http_get")
+
+    headers = http_headers.copy()               # headers of this request
+    if cond != None:
+        (etag, modified) = cond
+        if etag != empty:
+            headers["If-None-Match"] = etag
+        if modified != empty:
+            headers["If-Modified-Since"] = modified
+
+    if not resume:                              # compressed transfer (not
+        headers["Accept-Encoding"] = "gzip"     # with Range requests)
+
+    url0   = url                                # requested URL (journal)
+    part   = file + part_ext                    # partially downloaded file
+    offset = 0                                  # size of the .part file
+    if resume:
+        (offset, validator) = load_part_journal(url0, file)
+        if offset > 0:                          # resume the download
+            headers["Range"]    = f"bytes={offset}-"
+            headers["If-Range"] = validator
+
+    def discard():                              # without resume: no
+        if not resume:                          # incomplete .part file
+            try:
+                os.remove(part)
+            except OSError:
+                pass
+
+    for i in range(max_redirects + 1):
+        parts = urlsplit(url)
+        path  = parts.path or "/"
+        if parts.query != empty:
+            path += "?" + parts.query
+        (conn, reused) = http_connection(parts.scheme, parts.netloc)
+        try:
+            try:
+                conn.request("GET", path, headers=headers)
+                resp = conn.getresponse()
+            except (http.client.HTTPException, ConnectionError):
+                if not reused:                  # new connection: real error
+                    raise
+                http_drop(parts.scheme, parts.netloc)
+                                                # server has closed the kept
+                                                # connection: one new attempt
+                request_info.retries += 1
+                (conn, reused) = http_connection(parts.scheme, parts.netloc)
+                conn.request("GET", path, headers=headers)
+                resp = conn.getresponse()
+
+            if resp.status in [301, 302, 303, 307, 308]:
+                location = resp.getheader("Location", empty)
+                resp.read()                     # empty the connection
+                if resp.will_close:
+                    http_drop(parts.scheme, parts.netloc)
+                url = urljoin(url, location)    # follow the redirection
+                continue
+            if resp.status == 304:              # not modified: file is kept
+                resp.read()
+                if resp.will_close:
+                    http_drop(parts.scheme, parts.netloc)
+                return (304, empty, empty)
+            if (resp.status == 416) and (offset > 0):
+                resp.read()                     # range not satisfiable:
+                if resp.will_close:             # .part file is useless
+                    http_drop(parts.scheme, parts.netloc)
+                offset = 0
+                del headers["Range"]
+                del headers["If-Range"]
+                request_info.retries += 1
+                continue                        # once more without Range
+            crange = re.match(r"bytes (\d+)-(\d+)/",
+                              resp.getheader("Content-Range", empty).strip())
+                                                # Content-Range: bytes a-b/n
+            if (resp.status == 206) and (offset > 0) and \
+               ((crange == None) or (int(crange.group(1)) != offset)):
+                resp.read()                     # other range than requested:
+                if resp.will_close:             # not appended to the .part
+                    http_drop(parts.scheme, parts.netloc)
+                offset = 0                      # file
+                del headers["Range"]
+                del headers["If-Range"]
+                request_info.retries += 1
+                continue                        # once more from byte 0
+            if not ((resp.status == 200) or
+                    ((resp.status == 206) and (offset > 0))):
+                resp.read()                     # not successful
+                if resp.will_close:
+                    http_drop(parts.scheme, parts.netloc)
+                delay = resp.getheader("Retry-After", empty).strip()
+                                                # with 429 a/o 503: delay in
+                                                # seconds (an HTTP date is
+                                                # ignored)
+                raise DownloadError(url, resp.status, resp.reason,
+                                    int(delay) if delay.isdigit() else None)
+
+            etag     = resp.getheader("ETag", empty)
+            modified = resp.getheader("Last-Modified", empty)
+            unzip    = None                     # decompressor (gzip transfer)
+            if resp.getheader("Content-Encoding", empty).lower() == "gzip":
+                unzip = zlib.decompressobj(16 + zlib.MAX_WBITS)
+            length   = resp.getheader("Content-Length", empty).strip()
+            expected = None                     # announced length of the body
+            if length.isdigit():
+                expected = int(length)
+            elif crange:
+                expected = int(crange.group(2)) - int(crange.group(1)) + 1
+            received = 0                        # received bytes of the body
+            if not resume:
+                target = part                   # renamed after the check of
+                mode   = "wb"                   # the length
+            elif resp.status == 206:            # the rest of the .part file
+                target = part
+                mode   = "ab"
+                with dload_lock:
+                    pdfresumed = pdfresumed + 1
+            else:                               # a new .part file
+                target = part
+                mode   = "wb"
+                generate_part_journal(url0, file, etag, modified)
+            with open(target, mode) as out:     # store the file
+                while True:
+                    block = resp.read(chunk_size)
+                    if not block:
+                        break
+                    received += len(block)
+                    limit_rate(byte_bucket, len(block))
+                                                # bytes per second (-br)
+                    with dload_lock:            # byte budget (-nb)
+                        dbytes = dbytes + len(block)
+                    request_info.nbytes += len(block)
+                                                # telemetry (-tm)
+                    if unzip != None:           # compressed transfer
+                        block = unzip.decompress(block)
+                    out.write(block)
+                    if sink != None:            # streaming parse
+                        sink(block)
+                if unzip != None:               # the rest of the compressed
+                    block = unzip.flush()       # transfer
+                    out.write(block)
+                    if sink != None:
+                        sink(block)
+            if ((expected != None) and (received < expected)) or \
+               ((unzip != None) and not unzip.eof):
+                                                # connection closed within the
+                                                # body: .part file and journal
+                                                # are kept (resume)
+                http_drop(parts.scheme, parts.netloc)
+                raise DownloadError(url, 0, "incomplete")
+            if resp.will_close:
+                http_drop(parts.scheme, parts.netloc)
+            os.replace(part, file)              # download complete
+            if resume:
+                try:
+                    os.remove(file + journal_ext)
+                except OSError:
+                    pass
+            return (200, etag, modified)
+        except DownloadError:
+            discard()
+            raise
+        except (http.client.HTTPException, OSError, zlib.error) as exc:
+                                                # network error, timeout a/o
+                                                # corrupt compressed transfer
+            http_drop(parts.scheme, parts.netloc)
+            discard()
+            raise DownloadError(url, 0, repr(exc)) from exc
+        except:                                 # error of the sink: response
+            http_drop(parts.scheme, parts.netloc)
+            discard()
+            raise                               # not read completely
+    raise DownloadError(url, 0, "too many redirections")
+
+# ------------------------------------------------------------------
+def is_transient(exc):                          # Function is_transient:
+                                                # Classifies a download error.
+    """
+    Classifies a download error: transient errors (network error, timeout,
+    HTTP status 408, 429, 5xx; wget: network failure a/o timeout) may
+    disappear with a repetition; all other errors (e.g. 404, wget not found,
+    no exception at all) are permanent.
+
+    Returns True (transient) a/o False (permanent).
+
+    parameter:
+    exc: exception of the download a/o None
+    """
+
+    # 2.76   2026-10-18 new function is_transient, split off from dload_file
+
+    if debugging:
+        print("+++ -CTANLoad:is_transient")
+
+    if isinstance(exc, DownloadError):          # network error, timeout, 408,
+        return (exc.status in [0, 408, 429]) or \
+               (exc.status >= 500)              # 429 a/o 5xx
+    if isinstance(exc, subprocess.CalledProcessError):
+        return (exc.returncode == 4)            # wget: network failure
+    if isinstance(exc, subprocess.TimeoutExpired):
+        return True                             # wget: timeout
+    return False
+
+# ------------------------------------------------------------------
+def limit_rate(bucket, amount):                 # Function limit_rate: Token
+                                                # bucket for requests a/o bytes.
+    """
+    Token bucket: takes amount tokens from bucket; waits, if the bucket is
+    empty (requests per second, bytes per second).
+
+    parameters:
+    bucket : request_bucket a/o byte_bucket
+    amount : number of tokens (requests a/o bytes)
+    """
+
+    # 2.57   2026-10-18 new function limit_rate
+
+    if bucket["rate"] <= 0:                     # no limit
+        return
+
+    with rate_lock:
+        now              = time.monotonic()
+        bucket["tokens"] = min(bucket["burst"], bucket["tokens"] +
+                               (now - bucket["stamp"]) * bucket["rate"])
+                                                # refill the bucket
+        bucket["stamp"]  = now
+        bucket["tokens"] = bucket["tokens"] - amount
+        wait             = max(0, -bucket["tokens"] / bucket["rate"])
+    if wait > 0:                                # bucket is empty: wait
+        time.sleep(wait)
+
+# ------------------------------------------------------------------
+def load_catalogs():                            # Function load_catalogs: Loads
+                                                # the catalog dictionaries from
+                                                # the cache (4th pickle file).
+    """
+    Loads authors, packages, topics, licenses from the cache (4th pickle file),
+    if the cache is younger than -ttl seconds and belongs to the same source
+    (-src).
+
+    Returns True (cache used) a/o False.
+
+    Rewrites the global authors, packages, topics, licenses.
+
+    no parameter
+
+    global variables:
+    authors             global Python dictionary with authors
+    packages            global Python dictionary with packages
+    topics              global Python dictionary with topics
+    licenses            global Python dictionary with licenses
+
+    possible messages:
+    + Info: catalog files taken from cache '{0}' (age: {1} s)
+    """
+
+    # 2.59   2026-10-18 new function load_catalogs
+
+    global authors                              # global Python dictionary with
+                                                # authors
+    global packages                             # global Python dictionary with
+                                                # packages
+    global topics                               # global Python dictionary with
+                                                # topics
+    global licenses                             # global Python dictionary with
+                                                # licenses
+
+    if debugging:
+        print("+++ -CTANLoad:load_catalogs")
+
+    if ttl <= 0:                                # no cache
+        return False
+    try:
+        pickleFile4 = open(direc + pkl_file4, "br")
+                                                # open the pickle file
+        (stamp, src, a, p, t, l) = pickle.load(pickleFile4)
+                                                # unpickle the data
+        pickleFile4.close()
+    except Exception:                           # no (usable) cache
+        return False
+
+    age = time.time() - stamp
+    if (src != source) or (age < 0) or (age > ttl):
+        return False                            # cache is too old
+    authors  = a
+    packages = p
+    topics   = t
+    licenses = l
+    if verbose:
+        print(f"--- Info: catalog files taken from cache '{direc + pkl_file4}'",
+              f"(age: {int(age)} s)")
+    return True
+
+# ------------------------------------------------------------------
+def load_index(section, file):                  # Function load_index: Loads
+                                                # one dictionary of the index
+                                                # file (key --> packages).
+    """
+    Gets one dictionary (key --> packages). The dictionary in memory (see
+    generate_topicspackages) is preferred; otherwise the dictionary of the
+    index file CTAN.idx (see generate_index) is loaded; if there is no usable
+    index file, the list file xyz.lpt/xyz.lap/xyz.llp (generated by -l) is
+    read instead (ast.literal_eval per line).
+
+    Returns a list of (key, list of packages).
+
+    parameters:
+    section : name of the dictionary ("topicspackages", "authorpackages",
+              "licensepackages")
+    file    : name of the list file
+
+    possible (error) messages:
+    + Error: local file '{0}' cannot be loaded; please call ctanload -l  before
+    """
+
+    # 2.73   2026-10-18 new function load_index (instead of eval in
+    #                   get_xyz_lpt, get_xyz_lap, get_xyz_llp)
+    # 2.76   2026-10-18 in load_index: dictionary in memory preferred (no
+    #                   termination without index and list file)
+    
+    if debugging:
+        print("+++ -CTANLoad:load_index")
+
+    memory = {"topicspackages" : topicspackages,
+              "authorpackages" : authorpackages,
+              "licensepackages": licensepackages}[section]
+    if len(memory) > 0:                         # already in memory: no file
+        return list(memory.items())             # is read
+
+    prefix = json.dumps([section])[0:-1] + ","  # begin of the line
+    try:
+        with open(direc + idx_file, encoding="utf-8") as f:
+            for line in f:
+                if line.startswith(prefix):     # only this line is parsed
+                    return list(json.loads(line)[1].items())
+    except (OSError, ValueError):               # no usable index file
+        pass
+
+    try:
+        with open(file, encoding="utf-8", mode="r") as f:
+            return [ast.literal_eval(line.strip()) for line in f
+                    if line.strip() != empty]
+    except (OSError, ValueError, SyntaxError):
+        if verbose:                             # there is an error
+            print(f"[CTANLoad] Error: local file '{file}' cannot",
+                  "be loaded; please call ctanload -l ... before")
+        sys.exit()                              # program terminates
+
+# ------------------------------------------------------------------
+def load_part_journal(url, file):               # Function load_part_journal:
+                                                # Loads the journal of a .part
+                                                # file.
+    """
+    Loads the journal of a partially downloaded file (file.jnl) and checks it.
+
+    Returns a tuple (size of file.part, validator for If-Range); (0, "") if
+    the download cannot be resumed.
+
+    parameters:
+    url   : URL of the file
+    file  : name of the local file (without .part)
+    """
+
+    # 2.55   2026-10-18 new function load_part_journal
+
+    if debugging:
+        print("+++ -CTANLoad:load_part_journal")
+
+    try:
+        with open(file + journal_ext, "br") as jnl:
+            (jurl, etag, modified) = pickle.load(jnl)
+        size = os.path.getsize(file + part_ext)
+    except Exception:                           # no journal a/o no .part file
+        return (0, empty)
+
+    if etag.startswith("W/"):                   # weak ETag: not usable for
+        etag = empty                            # If-Range
+    validator = etag or modified
+    if (jurl != url) or (validator == empty):   # journal does not fit
+        return (0, empty)
+    return (size, validator)
+
+# ------------------------------------------------------------------
+def load_XML_facts():                           # Function load_XML_facts():
+                                                # Loads pickle file 5 (which
+                                                # contains XML_facts).
+    """
+    Loads pickle file 5 (which contains XML_facts).
+
+    Rewrites the global XML_facts.
+
+    no parameter
+
+    global variables:
+    XML_facts           python dictionary: facts of the XML files
+    """
+
+    # 2.71   2026-10-18 new function load_XML_facts
+    # 2.72   2026-10-18 in load_XML_facts: facts of version 2.71 (without
+    #                   hrefs) dropped
+
+    global XML_facts                            # python dictionary: facts of
+                                                # the XML files
+    
+    if debugging:
+        print("+++ >CTANLoad:load_XML_facts")
+
+    XML_facts = {}
+    try:
+        pickleFile5 = open(direc + pkl_file5, "br")
+                                                # open the pickle file
+        data        = pickle.load(pickleFile5)  # unpickle the data
+        pickleFile5.close()
+        for f in data:
+            facts = data[f][4]
+            if (facts == None) or (len(facts) == 5):
+                XML_facts[f] = data[f]          # facts of version 2.72
+    except (IOError, EOFError, pickle.UnpicklingError):
+        pass                                    # not successfull: do nothing
+    
+    if debugging:
+        print("+++ <CTANLoad:load_XML_facts")
+
+# ------------------------------------------------------------------
+def load_XML_state():                           # Function load_XML_state():
+                                                # Loads pickle file 3 (which
+                                                # contains XML_state).
+    """
+    Loads pickle file 3 (which contains XML_state and PDF_state) and builds
+    PDF_store.
+
+    Rewrites the global XML_state, PDF_state, PDF_store.
+
+    no parameter
+
+    global variables:
+    XML_state           python dictionary: validators of the XML files
+    PDF_state           python dictionary: validators and hashes of the PDF
+                        files
+    PDF_store           python dictionary: local PDF files by content
+    """
+
+    # 2.53   2026-10-18 new function load_XML_state
+    # 2.56   2026-10-18 in load_XML_state: PDF_state added; PDF_store built
+
+    global XML_state                            # python dictionary: validators
+                                                # of the XML files
+    global PDF_state                            # python dictionary: validators
+                                                # and hashes of the PDF files
+    global PDF_store                            # python dictionary: local PDF
+                                                # files by content
+    
+    if debugging:
+        print("+++ >CTANLoad:load_XML_state")
+
+    try:
+        pickleFile3 = open(direc + pkl_file3, "br")
+                                                # open the pickle file
+        data        = pickle.load(pickleFile3)  # unpickle the data
+        pickleFile3.close()
+        if isinstance(data, dict):              # pickle file 3 of version 2.53
+            XML_state = data
+        else:
+            (XML_state, PDF_state) = data
+    except IOError:                             # not successfull
+        pass                                    # do nothing
+
+    for href in PDF_state:                      # local PDF files by content
+        (etag, modified, sha, size, file) = PDF_state[href]
+        if path.exists(file):
+            PDF_store[sha] = file
+    
+    if debugging:
+        print("+++ <CTANLoad:load_XML_state")
+
+# ------------------------------------------------------------------
+def load_XML_toc():                             # Function load_XML_toc():
+                                                # Loads pickle file 2 (which
+                                                # contains XML_toc).
     """
     Loads pickle file 2 (which contains XML_toc).
 
@@ -2737,6 +6404,132 @@ def load_XML_toc():                             # Function load_XML_toc():
     if debugging:
         print("+++ <CTANLoad:load_XML_toc")
 
+# ------------------------------------------------------------------
+def open_XML_file(file):                        # Function open_XML_file: Opens
+                                                # a local XML file (a/o its
+                                                # compressed form).
+    """
+    Opens a local XML file for reading: file itself a/o the compressed file
+    file.gz.
+
+    Returns the opened file (text, UTF-8).
+
+    parameter:
+    file : name of the XML file (abc.xml)
+
+    possible exception:
+    + FileNotFoundError
+    """
+
+    # 2.62   2026-10-18 new function open_XML_file
+
+    # open_XML_file --> find_XML_file
+
+    if debugging:
+        print("+++ -CTANLoad:open_XML_file")
+
+    name = find_XML_file(file) or file          # name of the existing file
+    if name.endswith(gz_ext):                   # compressed
+        return gzip.open(name, encoding="utf-8", mode="rt")
+    return open(name, encoding="utf-8", mode="r")
+
+# ------------------------------------------------------------------
+def order_packages(p):                          # Function order_packages:
+                                                # Orders the packages to be
+                                                # loaded (option -p).
+    """
+    Orders the packages to be loaded according to the priority policy
+    (option -p):
+
+    name     sorted by name
+    recent   most recently changed first (years in yearpackages); packages
+             without a year at the end
+    missing  packages without a local XML file a/o without validators first
+             (missing before stale), then the others
+
+    Within the same priority the packages are sorted by name.
+
+    Returns the ordered list.
+
+    parameter:
+    p: set of the packages to be loaded
+
+    global variables:
+    yearpackages        python dictionary: list of years and their packages
+    XML_state           python dictionary: validators of the XML files
+    """
+
+    # 2.63   2026-10-18 new function order_packages
+
+    # order_packages --> find_XML_file
+
+    if debugging:
+        print("+++ -CTANLoad:order_packages")
+
+    tmp = sorted(p)                             # policy name
+    if priority == "recent":                    # most recently changed first
+        years = {}
+        for y in yearpackages:
+            for f in yearpackages[y]:
+                years[f] = max(y, years.get(f, y))
+        tmp.sort(key=lambda f: years.get(f, empty), reverse=True)
+    elif priority == "missing":                 # missing before stale
+        tmp.sort(key=lambda f: (f in XML_state) and
+                               (find_XML_file(f + ext) != None))
+    return tmp
+
+# ------------------------------------------------------------------
+def parse_catalog(handle):                      # Function parse_catalog:
+                                                # Streaming parser for a
+                                                # catalog file.
+    """
+    Streaming parser for a catalog file (authors, topics, licenses, packages).
+
+    Returns a function feed(block): feed takes the next block of the catalog
+    file (bytes) and calls handle(child) for each complete child of the root;
+    the child is dropped afterwards (flat memory). feed(None) marks the end
+    of the file. feed.restart() discards the parsed part (repeated download);
+    handle must tolerate children which are handed over once more.
+
+    parameter:
+    handle : function which takes over one child of the root
+
+    possible exception:
+    + ET.ParseError (catalog file empty or not well-formed)
+    """
+
+    # 2.61   2026-10-18 new function parse_catalog
+    # 2.69   2026-10-18 in parse_catalog: feed.restart for repeated downloads
+
+    if debugging:
+        print("+++ -CTANLoad:parse_catalog")
+
+    state = {"parser": ET.XMLPullParser(events=("start", "end"))}
+                                                # incremental XML parser
+    stack = []                                  # open elements
+
+    def feed(block):
+        parser = state["parser"]
+        if block == None:                       # end of the catalog file
+            parser.close()
+        else:
+            parser.feed(block)
+        for (event, elem) in parser.read_events():
+            if event == "start":
+                stack.append(elem)
+            else:
+                stack.pop()
+                if len(stack) == 1:             # complete child of the root
+                    handle(elem)
+                    stack[0].clear()            # drop the child
+
+    def restart():                              # a new parser for the
+        state["parser"] = ET.XMLPullParser(events=("start", "end"))
+        stack.clear()                           # repeated download
+
+    feed.restart = restart
+    return feed
+
 # ------------------------------------------------------------------
 def main():                                     # Function main(): Main Function
                                                 # (calls the other functions).
@@ -2757,6 +6550,10 @@ def main():                                     # Function main(): Main Function
     template            template for package names
     author_template     template for author names
     regenerate          Flag: pickle files are to regenerated
+    plan                Flag: a load is only planned (dry run)
+    verify              Flag: the local files are to be verified
+    import_archive      archive to be imported
+    export_archive      archive to be exported
 
     possible (error) messages:
     + Info: Program call (with more details)
@@ -2774,12 +6571,22 @@ def main():                                     # Function main(): Main Function
     # main --> call_plain
     # main --> call_check
     # main --> call_load
+    # main --> call_plan
+    # main --> call_verify
+    # main --> call_import
+    # main --> call_export
+    # main --> generate_telemetry
     # main --> make_statistics
     # main --> regenerate_pickle_files
     # main --> check_integrity
     # main --> test_clipboard
 
     # 2.46   2025-02-04 messages in functions' __doc__ texts listed
+    # 2.64   2026-10-18 in main: new mode dryrun (option -pl)
+    # 2.65   2026-10-18 in main: new mode verification (option -vf)
+    # 2.68   2026-10-18 in main: telemetry report (option -tm)
+    # 2.70   2026-10-18 in main: new modes importing and exporting (options
+    #                   -im, -ex)
 
     global PDF_toc                              # global Python dictionary for
                                                 # PDF files
@@ -2817,14 +6624,29 @@ def main():                                     # Function main(): Main Function
     r_bool    = regenerate != regenerate_default
                                                 # Flag: -r is set
       
-    load      = n_bool or k_bool or a_bool or l_bool or y_bool
+    dryrun    = plan != plan_default            # dryrun (Flag: -pl is set)
+    load      = (not dryrun) and \
+                (n_bool or k_bool or a_bool or l_bool or y_bool)
                                                 # load 
-    check     = (not load) and ((lists != lists_default) or i_bool)
+    verification = (not dryrun) and (not load) and \
+                   (verify != verify_default)   # verification (Flag: -vf
+                                                # is set)
+    importing = (not dryrun) and (not load) and (not verification) and \
+                (import_archive != import_default)
+                                                # importing (-im is set)
+    exporting = (not dryrun) and (not load) and (not verification) and \
+                (not importing) and (export_archive != export_default)
+                                                # exporting (-ex is set)
+    check     = (not dryrun) and (not load) and (not verification) and \
+                (not importing) and (not exporting) and \
+                ((lists != lists_default) or i_bool)
                                                 # check
-    newpickle = (not load) and (not check) and r_bool
-                                                # newpickle
-    plain     = (not load) and (not check) and (not newpickle)
-                                                # plain
+    newpickle = (not dryrun) and (not load) and (not verification) and \
+                (not importing) and (not exporting) and \
+                (not check) and r_bool          # newpickle
+    plain     = (not dryrun) and (not load) and (not verification) and \
+                (not importing) and (not exporting) and \
+                (not check) and (not newpickle) # plain
     
     if verbose:
         print("\n" + "[CTANLoad] Info: Program call:", call)
@@ -2843,6 +6665,57 @@ def main():                                     # Function main(): Main Function
             if verbose:
                 print(reset_text.format("-r", False, "'-n' or '-t' or '-f'"))
 
+    if dryrun:                                  # dryrun mode
+        if (lists != lists_default):            #     -l reset
+            lists = False
+            if verbose:
+                print(reset_text.format("-l", False, "'-pl'"))
+        if (integrity != integrity_default):    #     -c reset
+            integrity = False
+            if verbose:
+                print(reset_text.format("-c", False, "'-pl'"))
+        if (regenerate != regenerate_default):  #     -r reset
+            regenerate = False
+            if verbose:
+                print(reset_text.format("-r", False, "'-pl'"))
+
+    if verification:                            # verification mode
+        if (lists != lists_default):            #     -l reset
+            lists = False
+            if verbose:
+                print(reset_text.format("-l", False, "'-vf'"))
+        if (integrity != integrity_default):    #     -c reset
+            integrity = False
+            if verbose:
+                print(reset_text.format("-c", False, "'-vf'"))
+        if (regenerate != regenerate_default):  #     -r reset
+            regenerate = False
+            if verbose:
+                print(reset_text.format("-r", False, "'-vf'"))
+        if download == download_default:        #     -f reset (corrupt PDF
+            download = True                     #     files are downloaded
+            if verbose:                         #     again)
+                print(reset_text.format("-f", True, "'-vf'"))
+
+    if importing or exporting:                  # importing/exporting mode
+        option = "'-im'" if importing else "'-ex'"
+        if (lists != lists_default):            #     -l reset
+            lists = False
+            if verbose:
+                print(reset_text.format("-l", False, option))
+        if (integrity != integrity_default):    #     -c reset
+            integrity = False
+            if verbose:
+                print(reset_text.format("-c", False, option))
+        if (regenerate != regenerate_default):  #     -r reset
+            regenerate = False
+            if verbose:
+                print(reset_text.format("-r", False, option))
+        if (download != download_default):      #     -f reset (no PDF files)
+            download = False
+            if verbose:
+                print(reset_text.format("-f", False, option))
+
     if check:                                   # check mode
         if (regenerate != regenerate_default):  #     -r reset
             regenerate = False
@@ -2865,14 +6738,81 @@ def main():                                     # Function main(): Main Function
               " CTANLoad.py")    
         if (download != download_default):
             print("  {0:5} {1:55}".format('-f', '(' + download_text + ')'))
+        if (refresh != refresh_default):
+            print("  {0:5} {1:55}".\
+                  format('-fr', '(' + (refresh_text + ')')[0:50] + ellipse))
+        if (compress != compress_default):
+            print("  {0:5} {1:55}".\
+                  format('-z', '(' + (compress_text + ')')[0:50] + ellipse))
+        if (sqlite != sqlite_default):
+            print("  {0:5} {1:55}".\
+                  format('-sq', '(' + (sqlite_text + ')')[0:50] + ellipse))
         if (number != number_default):
             print("  {0:5} {2:55} {1}".\
                   format('-n', number, '(' + number_text + ')'))
+        if (byte_budget != byte_budget_default):
+            print("  {0:5} {2:55} {1}".\
+                  format('-nb', byte_budget,
+                         '(' + (byte_budget_text + ')')[0:50] + ellipse))
+        if (time_budget != time_budget_default):
+            print("  {0:5} {2:55} {1}".\
+                  format('-tb', time_budget,
+                         '(' + (time_budget_text + ')')[0:50] + ellipse))
+        if (priority != priority_default):
+            print("  {0:5} {2:55} {1}".\
+                  format('-p', priority,
+                         '(' + (priority_text + ')')[0:50] + ellipse))
+        if (jobs != jobs_default):
+            print("  {0:5} {2:55} {1}".\
+                  format('-j', jobs,
+                         '(' + (jobs_text + ')')[0:50] + ellipse))
+        if (pdf_jobs != pdf_jobs_default):
+            print("  {0:5} {2:55} {1}".\
+                  format('-jp', pdf_jobs,
+                         '(' + (pdf_jobs_text + ')')[0:50] + ellipse))
+        if (extract_jobs != extract_jobs_default):
+            print("  {0:5} {2:55} {1}".\
+                  format('-jx', extract_jobs,
+                         '(' + (extract_jobs_text + ')')[0:50] + ellipse))
+        if (request_rate != request_rate_default):
+            print("  {0:5} {2:55} {1}".\
+                  format('-rr', request_rate,
+                         '(' + (request_rate_text + ')')[0:50] + ellipse))
+        if (retries != retries_default):
+            print("  {0:5} {2:55} {1}".\
+                  format('-rt', retries,
+                         '(' + (retries_text + ')')[0:50] + ellipse))
+        if (backoff != backoff_default):
+            print("  {0:5} {2:55} {1}".\
+                  format('-bo', backoff,
+                         '(' + (backoff_text + ')')[0:50] + ellipse))
+        if (byte_rate != byte_rate_default):
+            print("  {0:5} {2:55} {1}".\
+                  format('-br', byte_rate,
+                         '(' + (byte_rate_text + ')')[0:50] + ellipse))
+        if (downloader != downloader_default):
+            print("  {0:5} {2:55} {1}".\
+                  format('-dl', downloader,
+                         '(' + (downloader_text + ')')[0:50] + ellipse))
         if (lists != lists_default):
             print("  {0:5} {1:55}".\
                   format('-l', '(' + (lists_text + ')')[0:50] + ellipse))
         if (regenerate != regenerate_default):
             print("  {0:5} {1:55}".format('-r', '(' + regenerate_text + ')'))
+        if (plan != plan_default):
+            print("  {0:5} {1:55}".\
+                  format('-pl', '(' + (plan_text + ')')[0:50] + ellipse))
+        if (verify != verify_default):
+            print("  {0:5} {1:55}".\
+                  format('-vf', '(' + (verify_text + ')')[0:50] + ellipse))
+        if (import_archive != import_default):
+            print("  {0:5} {2:55} {1}".\
+                  format('-im', fold(import_archive),
+                         '(' + (import_text + ')')[0:50] + ellipse))
+        if (export_archive != export_default):
+            print("  {0:5} {2:55} {1}".\
+                  format('-ex', fold(export_archive),
+                         '(' + (export_text + ')')[0:50] + ellipse))
         if (statistics != statistics_default):
             print("  {0:5} {1:55}".format('-stat', '(' + statistics_text + ')'))
         if (integrity != integrity_default):
@@ -2885,6 +6825,17 @@ def main():                                     # Function main(): Main Function
         if (direc != direc_default):
             print("  {0:5} {2:55} {1}".format('-d', direc,
                                               '(' + direc_text + ')'))
+        if (ttl != ttl_default):
+            print("  {0:5} {2:55} {1}".\
+                  format('-ttl', ttl,
+                         '(' + (ttl_text + ')')[0:50] + ellipse))
+        if (telemetry != telemetry_default):
+            print("  {0:5} {1:55}".\
+                  format('-tm', '(' + (telemetry_text + ')')[0:50] + ellipse))
+        if (source != source_default):
+            print("  {0:5} {2:55} {1}".\
+                  format('-src', fold(source),
+                         '(' + (source_text + ')')[0:50] + ellipse))
 
         if (name_template != name_template_default):
             print("  {0:5} {2:55} {1}".format('-t', fold(name_template),
@@ -2910,6 +6861,14 @@ def main():                                     # Function main(): Main Function
     if plain:                                   # Process all steps for a plain
                                                 # call.
         call_plain()
+    elif dryrun:                                # Plan a load without loading.
+        call_plan()
+    elif verification:                          # Verify the local files.
+        call_verify()
+    elif importing:                             # Import package XML files
+        call_import()                           # from an archive.
+    elif exporting:                             # Export the local XML files
+        call_export()                           # into an archive.
     elif load:                                  # Process all steps for a
                                                 # complete ctanload call
                                                 # (withoutb integrity check).
@@ -2924,8 +6883,11 @@ def main():                                     # Function main(): Main Function
     else:
         pass                                    # do nothing
 
+    if telemetry:                               # Write the telemetry report
+        generate_telemetry()                    # and the Prometheus textfile.
+
     if verbose:
-        if (len(file_not_found) >= 1) and (not load):
+        if (len(file_not_found) >= 1) and (not load) and (not dryrun):
             print("--- Info: summary: package not found:", file_not_found)
         if len(not_well_formed) >= 1:
             print("--- Info: summary: file not well-formed or empty:",
@@ -2975,9 +6937,19 @@ def make_statistics():                          # Function make_statistics():
     + no. of packages (based on names)
     + no. of packages (based on years)
     + number of corrected entries 
+    + number of corrupt local files
+    + number of downloaded bytes
     + number of downloaded PDF files
     + number of downloaded XML files
+    + number of imported XML files
     + number of not downloaded PDF files
+    + number of repeated downloads
+    + number of resumed PDF downloads
+    + number of shared PDF files
+    + number of slowdowns (overload)
+    + number of unchanged PDF files
+    + number of unchanged XML files
+    + number of verified local files
     + total number of authors on CTAN
     + total number of licenses on CTAN
     + total number of local PDF files
@@ -2988,6 +6960,19 @@ def make_statistics():                          # Function make_statistics():
 
     # 2.43   2024-04-12 smaller changes in make_statistics
     # 2.46   2025-02-04 messages in functions' __doc__ texts listed
+    # 2.53   2026-10-18 in make_statistics: number of unchanged XML files
+    # 2.55   2026-10-18 in make_statistics: number of resumed PDF downloads
+    # 2.56   2026-10-18 in make_statistics: number of unchanged and shared PDF
+    #                   files
+    # 2.57   2026-10-18 in make_statistics: number of slowdowns
+    # 2.63   2026-10-18 in make_statistics: number of downloaded bytes
+    # 2.65   2026-10-18 in make_statistics: number of verified and corrupt
+    #                   local files
+    # 2.66   2026-10-18 in make_statistics: inventory of the OS folder
+    # 2.69   2026-10-18 in make_statistics: number of repeated downloads
+    # 2.70   2026-10-18 in make_statistics: number of imported XML files
+
+    # make_statistics --> get_inventory
 
     global counter                              # counter for downloadd XML and
                                                 # PDF files
@@ -3002,10 +6987,10 @@ def make_statistics():                          # Function make_statistics():
     load      = (name_template != empty)
     nrXMLfile = 0                               # initialze counter
 
-    XMLdir = os.listdir(direc)                  # files in the current OS folder
+    XMLdir = get_inventory()                    # files in the current OS folder
     for f in XMLdir:                                              
         if p4.match(f):                         # check: XML file name matches
-                                                # "^.+[.]xml$"
+                                                # "^.+[.]xml([.]gz)?$"
             nrXMLfile += 1
 
     print("\nStatistics:")
@@ -3027,6 +7012,35 @@ def make_statistics():                          # Function make_statistics():
               str(pdfcounter).rjust(r), "(in the actual session)")
         print("number of not downloaded PDF files:".ljust(l),
               str(pdfctrerr).rjust(r), "(in the actual session)")
+    if imported > 0:
+        print("number of imported XML files:".ljust(l),
+              str(imported).rjust(r), "(in the actual session)")
+    if unchanged > 0:
+        print("number of unchanged XML files:".ljust(l),
+              str(unchanged).rjust(r), "(in the actual session)")
+    if pdfresumed > 0:
+        print("number of resumed PDF downloads:".ljust(l),
+              str(pdfresumed).rjust(r), "(in the actual session)")
+    if pdfunchanged > 0:
+        print("number of unchanged PDF files:".ljust(l),
+              str(pdfunchanged).rjust(r), "(in the actual session)")
+    if pdflinked > 0:
+        print("number of shared PDF files:".ljust(l),
+              str(pdflinked).rjust(r), "(in the actual session)")
+    if slowdowns > 0:
+        print("number of slowdowns (overload):".ljust(l),
+              str(slowdowns).rjust(r), "(in the actual session)")
+    if retried > 0:
+        print("number of repeated downloads:".ljust(l),
+              str(retried).rjust(r), "(in the actual session)")
+    if (byte_budget > 0) or (time_budget > 0):
+        print("number of downloaded bytes:".ljust(l),
+              str(dbytes).rjust(r), "(in the actual session)")
+    if verify:
+        print("number of verified local files:".ljust(l),
+              str(verified).rjust(r), "(in the actual session)")
+        print("number of corrupt local files:".ljust(l),
+              str(mismatches).rjust(r), "(in the actual session)")
     print("total number of local PDF files:".ljust(l),
           str(len(PDF_toc)).rjust(r))
     print("total number of local XML files:".ljust(l), str(nrXMLfile).rjust(r))
@@ -3034,27 +7048,434 @@ def make_statistics():                          # Function make_statistics():
         print("number of corrected entries:".ljust(l), str(corrected).rjust(r),
               "(in the actual session)")
 
-    print(empty)                                # success of filtering
-    if name_template != name_template_default:  #   name filtering
-        print("no. of packages (based on names):".ljust(l),
-              str(no_np).rjust(r))
-    if key_template != key_template_default:    #   key template
-        print("no. of packages (based on keys):".ljust(l),
-              str(no_tp).rjust(r))
-    if license_template != license_template_default:
-                                                #   license template
-        print("no. of packages (based on licenses):".ljust(l),
-              str(no_lp).rjust(r))
-    if author_template != author_template_default:
-                                                #   author template
-        print("no. of packages (based on authors):".ljust(l),
-              str(no_ap).rjust(r))
-    if year_template != year_template_default:  #   year template
-        print("no. of packages (based on years):".ljust(l),
-              str(no_ly).rjust(r))
-    
+    print(empty)                                # success of filtering
+    if name_template != name_template_default:  #   name filtering
+        print("no. of packages (based on names):".ljust(l),
+              str(no_np).rjust(r))
+    if key_template != key_template_default:    #   key template
+        print("no. of packages (based on keys):".ljust(l),
+              str(no_tp).rjust(r))
+    if license_template != license_template_default:
+                                                #   license template
+        print("no. of packages (based on licenses):".ljust(l),
+              str(no_lp).rjust(r))
+    if author_template != author_template_default:
+                                                #   author template
+        print("no. of packages (based on authors):".ljust(l),
+              str(no_ap).rjust(r))
+    if year_template != year_template_default:  #   year template
+        print("no. of packages (based on years):".ljust(l),
+              str(no_ly).rjust(r))
+    
+    if debugging:
+        print("+++ <CTANLoad:make_statistics")
+
+# ------------------------------------------------------------------
+def queue_add(kind, names):                     # Function queue_add: Records
+                                                # new jobs in the job queue.
+    """
+    Records new jobs in the job queue (state 'pending').
+
+    Jobs which are already recorded are not changed.
+
+    parameters:
+    kind: kind of the jobs ("xml": package, "pdf": PDF file)
+    names: list of (name, data) pairs; data: any picklable object a/o None
+    """
+
+    # 2.60   2026-10-18 new function queue_add
+    # 2.76   2026-10-18 in queue_add: columns named (new column attempts)
+
+    if debugging:
+        print("+++ -CTANLoad:queue_add")
+
+    if queue_db == None:                        # no job queue
+        return
+
+    rows = [(kind, name, "pending", pickle.dumps(data))
+            for (name, data) in names]
+    try:
+        with queue_lock:
+            with queue_db:                      # one transaction
+                queue_db.executemany("INSERT OR IGNORE INTO jobs (kind, " +
+                                     "name, state, data) VALUES (?, ?, ?, ?)",
+                                     rows)
+    except sqlite3.Error:                       # job queue not usable
+        pass                                    # do nothing
+
+# ------------------------------------------------------------------
+def queue_close():                              # Function queue_close: Closes
+                                                # and deletes the job queue.
+    """
+    Closes and deletes the job queue (at the end of a complete load).
+
+    Failed jobs (transient errors after all repetitions, see dload_file and
+    queue_fail) are kept in the job queue; they are retried first in the
+    next session, at most in queue_attempts sessions. Failed jobs, which a
+    later selection does not reach, are dropped then (see queue_open,
+    queue_prune).
+
+    Rewrites the global queue_db.
+
+    no parameter
+
+    global variable:
+    queue_db            connection to the job queue
+
+    possible message:
+    + Info: job queue kept with {0} failed jobs (retried first in the next
+      session)
+    """
+
+    # 2.60   2026-10-18 new function queue_close
+    # 2.69   2026-10-18 in queue_close: failed jobs kept for the next session
+
+    global queue_db                             # connection to the job queue
+
+    if debugging:
+        print("+++ >CTANLoad:queue_close")
+
+    if queue_db != None:
+        with queue_lock:
+            try:
+                with queue_db:                  # one transaction
+                    queue_db.execute("DELETE FROM jobs WHERE " +
+                                     "state != 'failed'")
+                    queue_db.execute("DELETE FROM toc")
+                                                # XML_toc already dumped
+                failed = queue_db.execute("SELECT COUNT(*) FROM " +
+                                          "jobs").fetchone()[0]
+            except sqlite3.Error:               # job queue not usable
+                failed = 0
+            queue_db.close()
+            queue_db = None
+        if failed > 0:                          # failed jobs: job queue kept
+            if verbose:
+                print(f"--- Info: job queue kept with {failed} failed jobs",
+                      "(retried first in the next session)")
+            if debugging:
+                print("+++ <CTANLoad:queue_close")
+            return
+        for ext2 in [empty, "-wal", "-shm"]:    # database and its journals
+            try:
+                os.remove(direc + queue_file + ext2)
+            except OSError:                     # not found
+                pass                            # do nothing
+
+    if debugging:
+        print("+++ <CTANLoad:queue_close")
+
+# ------------------------------------------------------------------
+def queue_fail(kind, name, exc):                # Function queue_fail: Records
+                                                # a failed job.
+    """
+    Records a failed job in the job queue. Only a transient error (network
+    error, timeout, 408, 429, 5xx; see is_transient) keeps the job for the
+    next session, and only up to queue_attempts sessions; a job with a
+    permanent error (e.g. 404) a/o without attempts left is dropped.
+
+    parameters:
+    kind: kind of the job ("xml": package, "pdf": PDF file)
+    name: name of the package a/o URL of the PDF file
+    exc : exception of the failed download a/o None
+
+    global variable:
+    queue_db            connection to the job queue
+    """
+
+    # 2.76   2026-10-18 new function queue_fail
+
+    # queue_fail --> is_transient
+
+    if debugging:
+        print("+++ -CTANLoad:queue_fail")
+
+    if queue_db == None:                        # no job queue
+        return
+
+    try:
+        with queue_lock:
+            with queue_db:                      # one transaction
+                if is_transient(exc):           # retried in the next session
+                    queue_db.execute("UPDATE jobs SET state = 'failed', " +
+                                     "attempts = attempts + 1 WHERE " +
+                                     "kind = ? AND name = ?", (kind, name))
+                    queue_db.execute("DELETE FROM jobs WHERE kind = ? AND " +
+                                     "name = ? AND attempts >= ?",
+                                     (kind, name, queue_attempts))
+                else:                           # permanent error: dropped
+                    queue_db.execute("DELETE FROM jobs WHERE kind = ? AND " +
+                                     "name = ?", (kind, name))
+    except sqlite3.Error:                       # job queue not usable
+        pass                                    # do nothing
+
+# ------------------------------------------------------------------
+def queue_open():                               # Function queue_open: Opens
+                                                # the job queue and takes over
+                                                # the results of an interrupted
+                                                # load.
+    """
+    Opens the job queue (SQLite file next to the pickle files) and takes over
+    the results of an interrupted load.
+
+    A job queue which is left over is the trace of an interrupted load: its
+    XML_toc entries, the validators of the finished XML and PDF files are
+    taken over; finished packages are not loaded again, open PDF files are
+    loaded in the next pipeline. Failed jobs of the last session (see
+    queue_close) are retried first; PDF jobs whose href is no longer in
+    XML_toc are dropped.
+
+    Rewrites the global queue_db, XML_toc, XML_state, PDF_state, PDF_store.
+
+    no parameter
+
+    global variables:
+    queue_db            connection to the job queue
+    XML_toc             global Python dictionary
+    XML_state           python dictionary: validators of the XML files
+    PDF_state           python dictionary: validators and hashes of the PDF
+                        files
+    PDF_store           python dictionary: local PDF files by content
+
+    returns (done, pdfs, failed):
+    done                set: finished packages of the interrupted load
+    pdfs                list: open a/o failed PDF jobs (href2, fkey, onename,
+                        file)
+    failed              set: failed packages of the last session
+
+    possible messages:
+    + Info: {0} PDF jobs without XML_toc entry dropped from the job queue
+    + Info: failed jobs of the last session retried first ({0} packages, {1}
+      PDF files)
+    + Info: interrupted load resumed ({0} packages finished, {1} PDF files open)
+    + Warning: job queue '{0}' not usable
+    """
+
+    # 2.60   2026-10-18 new function queue_open
+    # 2.69   2026-10-18 in queue_open: failed packages returned
+    # 2.76   2026-10-18 in queue_open: new column attempts; PDF jobs without
+    #                   XML_toc entry dropped
+
+    global queue_db                             # connection to the job queue
+    global XML_toc                              # global Python dictionary
+    global XML_state                            # python dictionary: validators
+                                                # of the XML files
+    global PDF_state                            # python dictionary: validators
+                                                # and hashes of the PDF files
+    global PDF_store                            # python dictionary: local PDF
+                                                # files by content
+
+    if debugging:
+        print("+++ >CTANLoad:queue_open")
+
+    done   = set()                              # finished packages
+    pdfs   = []                                 # open PDF jobs
+    failed = set()                              # failed packages
+    nfail  = 0                                  # number of failed PDF jobs
+
+    try:
+        queue_db = sqlite3.connect(direc + queue_file, timeout=timeoutDefault,
+                                   check_same_thread=False)
+                                                # shared by all workers (locked)
+        queue_db.execute("PRAGMA journal_mode=WAL")
+        queue_db.execute("PRAGMA synchronous=NORMAL")
+        with queue_db:
+            queue_db.execute("CREATE TABLE IF NOT EXISTS jobs (kind TEXT, " +
+                             "name TEXT, state TEXT, data BLOB, " +
+                             "attempts INTEGER DEFAULT 0, " +
+                             "PRIMARY KEY (kind, name))")
+            queue_db.execute("CREATE TABLE IF NOT EXISTS toc (href TEXT " +
+                             "PRIMARY KEY, xmlfile TEXT, fkey TEXT, " +
+                             "onename TEXT)")
+            columns = [r[1] for r in
+                       queue_db.execute("PRAGMA table_info(jobs)")]
+            if not "attempts" in columns:       # job queue of an older
+                queue_db.execute("ALTER TABLE jobs ADD COLUMN attempts " +
+                                 "INTEGER DEFAULT 0")
+                                                # version
+        tocs = queue_db.execute("SELECT * FROM toc").fetchall()
+        rows = queue_db.execute("SELECT kind, name, state, data FROM " +
+                                "jobs").fetchall()
+    except sqlite3.Error:                       # job queue not usable
+        if verbose:
+            print(f"--- Warning: job queue '{direc + queue_file}' not usable")
+        queue_db = None
+        return (done, pdfs, failed)
+
+    for (href, xmlfile, fkey, onename) in tocs: # XML_toc entries of the
+        XML_toc[href] = (xmlfile, fkey, onename)
+                                                # interrupted load
+    urls   = {h.replace("ctan:/", ctanUrl2) for h in XML_toc}
+                                                # URLs of the known PDF files
+    stale  = [name for (kind, name, state, data) in rows
+              if (kind == "pdf") and (state != "done") and
+                 (not name in urls)]            # PDF jobs without XML_toc entry
+    if len(stale) > 0:
+        try:
+            with queue_lock:
+                with queue_db:                  # one transaction
+                    queue_db.executemany("DELETE FROM jobs WHERE " +
+                                         "kind = 'pdf' AND name = ?",
+                                         [(n,) for n in stale])
+        except sqlite3.Error:                   # job queue not usable
+            pass                                # do nothing
+        if verbose:
+            print(f"--- Info: {len(stale)} PDF jobs without XML_toc entry",
+                  "dropped from the job queue")
+    stale  = set(stale)
+
+    for (kind, name, state, data) in rows:
+        data = pickle.loads(data)
+        if kind == "xml" and state == "done":   # finished package
+            done.add(name)
+            if data != None:
+                XML_state[name] = data
+        elif kind == "pdf" and state == "done": # finished PDF file
+            if data != None:
+                PDF_state[name] = data
+                (etag, modified, sha, size, file) = data
+                if path.exists(file):
+                    PDF_store[sha] = file
+        elif kind == "xml" and state == "failed":
+            failed.add(name)                    # failed package
+        elif kind == "pdf" and name in stale:   # no longer in XML_toc
+            continue
+        elif kind == "pdf":                     # open a/o failed PDF file
+            pdfs.append(data)
+            if state == "failed":
+                nfail = nfail + 1
+
+    if verbose and (len(failed) + nfail > 0):
+        print("--- Info: failed jobs of the last session retried first",
+              f"({len(failed)} packages, {nfail} PDF files)")
+    if verbose and (len(rows) > len(failed) + nfail):
+        print("--- Info: interrupted load resumed",
+              f"({len(done)} packages finished, {len(pdfs)} PDF files open)")
+
+    if debugging:
+        print("+++ <CTANLoad:queue_open")
+    return (done, pdfs, failed)
+
+# ------------------------------------------------------------------
+def queue_prune(selected, failed, pdfs):        # Function queue_prune: Drops
+                                                # jobs outside the selection
+                                                # from the job queue.
+    """
+    Drops the jobs of the last session from the job queue, which the current
+    selection (-t, -k, -A, -y, ...) does not reach: failed packages and open
+    a/o failed PDF files of packages outside the selection.
+
+    Such jobs are never finished; without this step the job queue would be
+    kept with them forever (see queue_close).
+
+    Returns (failed, pdfs) without the dropped jobs.
+
+    parameters:
+    selected: set of the selected packages
+    failed  : set of the failed packages (see queue_open)
+    pdfs    : list of the open a/o failed PDF jobs (href2, fkey, onename,
+              file) (see queue_open)
+
+    global variable:
+    queue_db            connection to the job queue
+
+    possible message:
+    + Info: jobs outside the selection dropped from the job queue ({0}
+      packages, {1} PDF files)
+    """
+
+    # 2.76   2026-10-18 new function queue_prune
+
+    if debugging:
+        print("+++ >CTANLoad:queue_prune")
+
+    names = failed - selected                   # failed packages outside
+    jobs  = [job for job in pdfs                # PDF jobs outside
+             if not re.sub("[.]xml$", empty, job[3]) in selected]
+    if (queue_db != None) and (len(names) + len(jobs) > 0):
+        try:
+            with queue_lock:
+                with queue_db:                  # one transaction
+                    queue_db.executemany("DELETE FROM jobs WHERE " +
+                                         "kind = 'xml' AND name = ? AND " +
+                                         "state = 'failed'",
+                                         [(f,) for f in names])
+                    queue_db.executemany("DELETE FROM jobs WHERE " +
+                                         "kind = 'pdf' AND name = ?",
+                                         [(job[0],) for job in jobs])
+        except sqlite3.Error:                   # job queue not usable
+            pass                                # do nothing
+        if verbose:
+            print("--- Info: jobs outside the selection dropped from the",
+                  f"job queue ({len(names)} packages, {len(jobs)} PDF files)")
+
+    if debugging:
+        print("+++ <CTANLoad:queue_prune")
+    return (failed & selected, [job for job in pdfs if not job in jobs])
+
+# ------------------------------------------------------------------
+def queue_set(kind, name, state, data=None):    # Function queue_set: Records
+                                                # the state of a job.
+    """
+    Records the state of a job in the job queue.
+
+    parameters:
+    kind: kind of the job ("xml": package, "pdf": PDF file)
+    name: name of the package a/o URL of the PDF file
+    state: new state ("done", "failed")
+    data: validators of the finished file (only for state "done"); a failed
+          job keeps its data
+    """
+
+    # 2.60   2026-10-18 new function queue_set
+    # 2.76   2026-10-18 in queue_set: columns named (new column attempts)
+
     if debugging:
-        print("+++ <CTANLoad:make_statistics")
+        print("+++ -CTANLoad:queue_set")
+
+    if queue_db == None:                        # no job queue
+        return
+
+    try:
+        with queue_lock:
+            with queue_db:                      # one transaction
+                if state != "done":             # keep the data of the job
+                    queue_db.execute("UPDATE jobs SET state = ? WHERE " +
+                                     "kind = ? AND name = ?",
+                                     (state, kind, name))
+                else:
+                    queue_db.execute("INSERT OR REPLACE INTO jobs (kind, " +
+                                     "name, state, data) VALUES (?, ?, ?, ?)",
+                                     (kind, name, state, pickle.dumps(data)))
+    except sqlite3.Error:                       # job queue not usable
+        pass                                    # do nothing
+
+# ------------------------------------------------------------------
+def queue_toc(href, entry):                     # Function queue_toc: Records a
+                                                # new XML_toc entry.
+    """
+    Records a new XML_toc entry in the job queue.
+
+    parameters:
+    href: CTAN address of the PDF file (key of XML_toc)
+    entry: (XML file, key, onename)
+    """
+
+    # 2.60   2026-10-18 new function queue_toc
+
+    if debugging:
+        print("+++ -CTANLoad:queue_toc")
+
+    if queue_db == None:                        # no job queue
+        return
+
+    try:
+        with queue_lock:
+            with queue_db:                      # one transaction
+                queue_db.execute("INSERT OR REPLACE INTO toc " +
+                                 "VALUES (?, ?, ?, ?)", (href,) + entry)
+    except sqlite3.Error:                       # job queue not usable
+        pass                                    # do nothing
 
 # ------------------------------------------------------------------
 def regenerate_pickle_files():                  # regenerate_pickle_files:
@@ -3090,10 +7511,7 @@ def regenerate_pickle_files():                  # regenerate_pickle_files:
     """
 
     # generate_pickle_files --> get_PDF_files
-    # generate_pickle_files --> dload_authors
-    # generate_pickle_files --> dload_packages
-    # generate_pickle_files --> dload_topics
-    # generate_pickle_files --> dload_licenses
+    # generate_pickle_files --> dload_catalogs
     # generate_pickle_files --> generate_topicspackages
     # generate_pickle_files --> analyze_XML_file
     # generate_pickle_files --> generate_pickle2
@@ -3101,7 +7519,12 @@ def regenerate_pickle_files():                  # regenerate_pickle_files:
     # generate_pickle_files --> get_XML_files
 
     # 2.46   2025-02-04 messages in functions' __doc__ texts listed
+    # 2.59   2026-10-18 catalog files via dload_catalogs (in parallel a/o
+    #                   from cache)
     # 2.49   2025-02-11 more f-strings
+    # 2.72   2026-10-18 in regenerate_pickle_files: hrefs of the documentation
+    #                   taken from XML_facts (parsed in worker processes);
+    #                   XML files analyzed in sorted order
 
     global XML_toc                              # global Python dictionary with
                                                 # XML files
@@ -3140,18 +7563,21 @@ def regenerate_pickle_files():                  # regenerate_pickle_files:
         
     get_PDF_files(direc)                        # List all PDF files in a
                                                 # specified OS folder.
-    dload_authors()                             # load authors
-    dload_packages()                            # load packages
-    dload_topics()                              # load topics
-    dload_licenses()                            # load licenses
+    dload_catalogs()                            # load authors, packages,
+                                                # topics, licenses
     generate_topicspackages()                   # generate topicspackages,
                                                 # packagetopics, authorpackages,
                                                 # liocensepackages, yearpackages
     
-    for f in get_XML_files(direc):
+    for f in sorted(get_XML_files(direc)):      # XML_toc in a fixed order
         if verbose:
             print(f"----- Info: local XML file '{direc + f}'")
-        analyze_XML_file(f)
+        entry = XML_facts.get(f[0:-len(ext)], None)
+        if (f[0:-len(ext)] in packages) and (entry != None) and \
+           (entry[4] != None):                  # parsed by
+            analyze_XML_file(f, entry[4][4])    # generate_topicspackages
+        else:
+            analyze_XML_file(f)
 
     thr1 = Thread(target=generate_pickle2)      # dump XML_toc info CTAN2.pkl
     thr1.start()
@@ -3176,6 +7602,202 @@ def regenerate_pickle_files():                  # regenerate_pickle_files:
     if debugging:
         print("+++ <CTANLoad:regenerate_pickle_files")
     
+# ------------------------------------------------------------------
+def release_slot(congested):                    # Function release_slot:
+                                                # Releases a download slot and
+                                                # adapts the limit.
+    """
+    Releases a download slot and adapts the limit of concurrent downloads
+    (AIMD): halved after a timeout, 429 a/o 5xx; increased slowly after a
+    success. The limit starts at half of its upper limit (-j + -jp, at least
+    4: the worker threads) and grows up to it.
+
+    Rewrites the global conc_active, conc_limit, slowdowns.
+
+    parameter:
+    congested : Flag: CTAN seems to be overloaded
+
+    global variables:
+    conc_active     actual number of downloads
+    conc_limit      actual limit of concurrent downloads
+    slowdowns       counter for reductions of the concurrency
+    """
+
+    # 2.57   2026-10-18 new function release_slot
+
+    global conc_active                          # actual number of downloads
+    global conc_limit                           # actual limit of concurrent
+                                                # downloads
+    global slowdowns                            # counter for reductions of
+                                                # the concurrency
+
+    with conc_cond:
+        conc_active = conc_active - 1
+        if congested:                           # multiplicative decrease
+            conc_limit = max(1.0, conc_limit / 2)
+            slowdowns  = slowdowns + 1
+            if debugging:
+                print(f"+++ -CTANLoad:release_slot: limit {conc_limit}")
+        else:                                   # additive increase
+            conc_limit = min(float(conc_max), conc_limit + 1 / conc_limit)
+        conc_cond.notify_all()
+
+# ------------------------------------------------------------------
+def reserve_PDF_file(file):                     # Function reserve_PDF_file:
+                                                # Reserves a PDF download
+                                                # against the limit -n.
+    """
+    Reserves one PDF download against the maximum number of downloaded files
+    (-n) before the PDF file is queued for the PDF download stage. If the
+    limit is reached (downloaded XML and PDF files, queued a/o running PDF
+    downloads), the PDF file is left for the next session.
+
+    Returns True (reserved) a/o False (limit reached).
+    Rewrites the global pdfpending, PDF_XML.
+
+    parameter:
+    file: name of the XML file with the PDF file
+
+    global variables:
+    pdfpending      counter for queued a/o running PDF downloads
+    PDF_XML         Python set: XML files with PDF files not loaded
+    """
+
+    # 2.76   2026-10-18 new function reserve_PDF_file
+
+    global pdfpending                           # counter for queued a/o running
+                                                # PDF downloads
+    global PDF_XML                              # Python set: list of XML files:
+                                                # inconsistencies with PDF files
+
+    if debugging:
+        print("+++ -CTANLoad:reserve_PDF_file")
+
+    with dload_lock:
+        if counter + pdfcounter + pdfpending >= number:
+            PDF_XML.add(re.sub(".xml", empty, file))
+            return False                        # left for the next session
+        pdfpending = pdfpending + 1
+        return True
+
+# ------------------------------------------------------------------
+def reset_inventory():                          # Function reset_inventory:
+                                                # Discards the inventory of the
+                                                # OS folder.
+    """
+    Discards the inventory of the OS folder (files added a/o replaced); the
+    next call of get_inventory scans the OS folder again.
+
+    Rewrites the global inventory.
+
+    no parameters
+
+    global variable:
+    inventory           python dictionary: files in the OS folder
+    """
+
+    # 2.66   2026-10-18 new function reset_inventory
+
+    global inventory                            # python dictionary: files in
+                                                # the OS folder
+
+    if debugging:
+        print("+++ -CTANLoad:reset_inventory")
+
+    inventory = None
+
+# ------------------------------------------------------------------
+def select_packages():                          # Function select_packages:
+                                                # Selects the packages which
+                                                # match all templates.
+    """
+    Selects the packages which match all templates (-t, -k, -A, -L, -y);
+    without any template all packages are selected.
+
+    Returns a set of packages.
+    Rewrites the global no_tp, no_ap, no_np, no_lp, no_ly.
+
+    no parameters
+
+    global variables:
+    no_tp               number of packages selected per topics
+    no_ap               number of packages selected per author names
+    no_np               number of packages selected per names
+    no_lp               number of packages selected per licenses
+    no_ly               number of packages selected per years
+
+    possible message:
+    + Warning: no correct XML file for any specified package found
+    """
+
+    # 2.64   2026-10-18 new function select_packages, split off from call_load
+    #                   (used by call_load and call_plan)
+
+    # select_packages --> get_package_set
+    # select_packages --> get_xyz_lpt
+    # select_packages --> get_xyz_lap
+    # select_packages --> get_xyz_llp
+    # select_packages --> get_year_set
+
+    global no_tp                                # number of packages selected
+                                                # per topics
+    global no_ap                                # number of packages selected
+                                                # per author names
+    global no_np                                # number of packages selected
+                                                # per names
+    global no_lp                                # number of packages selected
+                                                # per licenses
+    global no_ly                                # number of packages selected
+                                                # per years
+
+    if debugging:
+        print("+++ >CTANLoad:select_packages")
+
+    all_packages = set()                        # initializes set
+    for f in packages:
+        all_packages.add(f)                     # constructs a set object
+                                                # (packages has not the right
+                                                # format)
+
+    tmp_tp = all_packages.copy()                # initializes tmp_tp (topics)
+    tmp_ap = all_packages.copy()                # initializes tmp_ap (authors)
+    tmp_np = all_packages.copy()                # initializes tmp_np (names)
+    tmp_lp = all_packages.copy()                # initializes tmp_lp (licenses)
+    tmp_ly = all_packages.copy()                # initializes tmp_ly (years)
+
+    if (name_template != name_template_default):
+        tmp_np = get_package_set()              # analyze 'packages' for name
+                                                # name templates
+    if (key_template != key_template_default):
+        tmp_tp = get_xyz_lpt()                  # load xyz.lpt and analyze it
+                                                # for key templates
+    if (author_template != author_template_default):
+        tmp_ap = get_xyz_lap()                  # load xyz.lap and analyze it
+                                                # for author templates
+    if (license_template != license_template_default):
+        tmp_lp = get_xyz_llp()                  # load xyz.llp and analyze it
+                                                # for license templates
+    if (year_template != year_template_default):
+        tmp_ly = get_year_set()                 # look for packages with the
+                                                # correct year templates
+
+    tmp_pp = tmp_tp & tmp_ap & tmp_np & tmp_lp & tmp_ly
+                                                # built an set intersection
+    if len(tmp_pp) == 0:
+        if verbose:
+            print("--- Warning: no correct XML file for any specified",
+                  " package found")
+
+    no_tp = len(tmp_tp)
+    no_ap = len(tmp_ap)
+    no_np = len(tmp_np)
+    no_lp = len(tmp_lp)
+    no_ly = len(tmp_ly)
+
+    if debugging:
+        print("+++ <CTANLoad:select_packages")
+    return tmp_pp
+
 # ------------------------------------------------------------------
 def set_PDF_toc():                              # Function set_PDF_toc: Fills
                                                 # PDF_toc on the basis of
@@ -3192,6 +7814,12 @@ def set_PDF_toc():                              # Function set_PDF_toc: Fills
     XML_toc             global Python dictionary with PDF files
     """
     
+    # 2.62   2026-10-18 in set_PDF_toc: compressed XML files (-z)
+    # 2.66   2026-10-18 in set_PDF_toc: inventory of the OS folder instead of
+    #                   single tests
+
+    # set_PDF_toc --> get_inventory
+
     global PDF_toc                              # global Python dictionary with
                                                 # PDF files
     global XML_toc                              # global Python dictionary with
@@ -3200,10 +7828,11 @@ def set_PDF_toc():                              # Function set_PDF_toc: Fills
     if debugging:
         print("+++ >CTANLoad:set_PDF_toc")
     
+    inv = get_inventory()                       # files in the OS folder
     for f in XML_toc:
         (xlfn, fkey, plfn) = XML_toc[f]
-        if os.path.exists(direc + xlfn) and os.path.\
-           exists(direc + fkey + "-" + plfn):
+        if ((xlfn in inv) or (xlfn + gz_ext in inv)) and \
+           (fkey + "-" + plfn in inv):
             PDF_toc[fkey + "-" + plfn] = xlfn
         else:
             pass
@@ -3211,6 +7840,314 @@ def set_PDF_toc():                              # Function set_PDF_toc: Fills
     if debugging:
         print("+++ <CTANLoad:set_PDF_toc")
 
+# ------------------------------------------------------------------
+def source_get(url, file, cond=None):           # Function source_get: Copies
+                                                # one file from a local mirror
+                                                # folder a/o archive.
+    """
+    Copies one file from a local mirror folder a/o archive (option -src).
+
+    The CTAN URL is mapped to a path in the source: https://ctan.org/xml/2.0/...
+    --> xml/2.0/..., https://ctan.org/tex-archive/... --> tex-archive/... (a/o
+    without tex-archive/ for a plain CTAN mirror).
+
+    Returns a tuple (status, ETag, ""); ETag is made of size and time stamp;
+    status 304 (not modified) if cond contains the same ETag.
+
+    parameters:
+    url   : URL of the file (CTAN)
+    file  : name of the local file
+    cond  : None or tuple (ETag, Last-Modified) for a conditional request
+
+    possible exception:
+    + DownloadError
+    """
+
+    # 2.58   2026-10-18 new function source_get
+    # 2.76   2026-10-18 in source_get: source_lock only for archives
+
+    # source_get --> source_open
+
+    if debugging:
+        print("+++ -CTANLoad:source_get")
+
+    rel = urlsplit(url).path.lstrip("/")        # path in the source
+    if (not url.startswith(ctanUrl + "/")) or (rel == empty):
+        raise DownloadError(url, 404, "not in the source")
+    names = [rel]
+    if rel.startswith("tex-archive/"):          # plain CTAN mirror
+        names.append(rel[len("tex-archive/"):])
+
+    archive = (source_kind != "folder")         # archives are not thread-safe;
+    if archive:                                 # files of a folder are copied
+        source_lock.acquire()                   # in parallel (-j, -jp)
+    try:
+        for name in names:
+            member = source_open(name)
+            if member != None:
+                break
+        else:
+            raise DownloadError(url, 404, "not found in the source")
+        (stream, size, stamp) = member
+        etag = f'"{size:x}-{stamp:x}"'
+        try:
+            if (cond != None) and (cond[0] == etag):
+                return (304, empty, empty)      # not modified
+            with open(file + part_ext, "wb") as out:
+                shutil.copyfileobj(stream, out, chunk_size)
+            os.replace(file + part_ext, file)
+        except OSError as exc:
+            raise DownloadError(url, 0, repr(exc)) from exc
+        finally:
+            stream.close()
+    finally:
+        if archive:
+            source_lock.release()
+    return (200, etag, empty)
+
+# ------------------------------------------------------------------
+def source_open(name):                          # Function source_open: Opens
+                                                # one file in a local mirror
+                                                # folder a/o archive.
+    """
+    Opens one file in a local mirror folder a/o archive (option -src); the
+    members of an archive may lie in a common top folder.
+
+    Returns a tuple (open binary stream, size, time stamp) a/o None (file not
+    found). A path which leads out of the mirror folder (e.g. with "..") is
+    refused (None).
+
+    Rewrites the global source_archive, source_members.
+
+    parameter:
+    name : path in the source (with "/")
+
+    global variables:
+    source_archive      opened archive
+    source_members      members of the archive
+    """
+
+    # 2.58   2026-10-18 new function source_open
+    # 2.76   2026-10-18 in source_open: paths outside the mirror folder
+    #                   refused
+
+    global source_archive                       # opened archive
+    global source_members                       # members of the archive
+
+    if source_kind == "folder":                 # local mirror folder
+        root  = path.realpath(source)
+        fname = path.realpath(os.path.join(root, *name.split("/")))
+        if os.path.commonpath([root, fname]) != root:
+            return None                         # outside the mirror folder
+        if not path.isfile(fname):
+            return None
+        st = os.stat(fname)
+        return (open(fname, "rb"), st.st_size, int(st.st_mtime))
+
+    if source_members == None:                  # first call: index the archive
+        source_members = {}
+        if tarfile.is_tarfile(source):
+            source_archive = tarfile.open(source)
+            members = [(m.name, m) for m in source_archive.getmembers()
+                       if m.isfile()]
+        else:
+            source_archive = zipfile.ZipFile(source)
+            members = [(m.filename, m) for m in source_archive.infolist()
+                       if not m.is_dir()]
+        for (mname, m) in members:
+            if mname.startswith("./"):
+                mname = mname[2:]
+            source_members[mname] = m
+            if "/" in mname:                    # common top folder
+                source_members.setdefault(mname.split("/", 1)[1], m)
+
+    m = source_members.get(name, None)
+    if m == None:
+        return None
+    if isinstance(source_archive, tarfile.TarFile):
+        return (source_archive.extractfile(m), m.size, int(m.mtime))
+    stamp = int(time.mktime(m.date_time + (0, 0, -1)))
+    return (source_archive.open(m), m.file_size, stamp)
+
+# ------------------------------------------------------------------
+def store_PDF_file(href, file, etag, modified): # Function store_PDF_file:
+                                                # Registers a downloaded PDF
+                                                # file by its content.
+    """
+    Registers a downloaded PDF file by its content (SHA-256); a file identical
+    to an already stored PDF file is replaced by a hard link to it.
+
+    Rewrites the global PDF_state, PDF_store, pdflinked.
+
+    parameters:
+    href     : URL of the PDF file
+    file     : name of the local file
+    etag     : ETag of the response
+    modified : Last-Modified of the response
+
+    global variables:
+    PDF_state           python dictionary: validators and hashes of the PDF
+                        files
+    PDF_store           python dictionary: local PDF files by content
+    pdflinked           counter for PDF files shared with identical files
+
+    possible messages:
+    + Info: PDF documentation file '{0}' shared with '{1}'
+    """
+
+    # 2.56   2026-10-18 new function store_PDF_file
+
+    # store_PDF_file --> get_file_hash
+
+    global PDF_state                            # python dictionary: validators
+                                                # and hashes of the PDF files
+    global PDF_store                            # python dictionary: local PDF
+                                                # files by content
+    global pdflinked                            # counter for PDF files shared
+                                                # with identical files
+
+    if debugging:
+        print("+++ -CTANLoad:store_PDF_file")
+
+    sha  = get_file_hash(file)                  # content of the new file
+    if sha == empty:                            # file not readable
+        return
+    size = os.path.getsize(file)
+
+    with dload_lock:
+        old   = PDF_state.get(href, None)
+        if (old != None) and (PDF_store.get(old[2], None) == file):
+            del PDF_store[old[2]]               # old content of this file
+        other = PDF_store.get(sha, None)        # a file with the same content
+        PDF_state[href] = (etag, modified, sha, size, file)
+        if (other == None) or (other == file):
+            PDF_store[sha] = file
+            return
+
+    try:
+        if os.path.samefile(other, file):       # already shared
+            return
+        if get_file_hash(other) != sha:         # other file has changed
+            with dload_lock:
+                PDF_store[sha] = file
+            return
+        os.link(other, file + part_ext)         # share the identical file
+        os.replace(file + part_ext, file)
+        with dload_lock:
+            pdflinked = pdflinked + 1
+        if verbose:
+            print(f"------- Info: PDF documentation file '{file}' shared",
+                  f"with '{other}'")
+    except OSError:                             # other file lost a/o no hard
+        with dload_lock:                        # links: keep the copy
+            PDF_store[sha] = file
+
+# ------------------------------------------------------------------
+def store_XML_file(file):                       # Function store_XML_file:
+                                                # Stores a local XML file
+                                                # compressed a/o uncompressed.
+    """
+    Stores a local XML file compressed (option -z: file.gz) a/o uncompressed;
+    the other form of the file is deleted.
+
+    parameter:
+    file : name of the XML file (abc.xml)
+
+    possible message:
+    + Warning: XML file '{0}' not compressed
+    """
+
+    # 2.62   2026-10-18 new function store_XML_file
+    # 2.66   2026-10-18 in store_XML_file: inventory of the OS folder discarded
+
+    # store_XML_file --> reset_inventory
+
+    if debugging:
+        print("+++ -CTANLoad:store_XML_file")
+
+    if not path.exists(file):                   # nothing downloaded
+        return
+    reset_inventory()                           # the OS folder is changed
+    try:
+        if compress:                            # option -z
+            with open(file, "rb") as inp:
+                with gzip.open(file + gz_ext + part_ext, "wb") as out:
+                    shutil.copyfileobj(inp, out)
+            os.replace(file + gz_ext + part_ext, file + gz_ext)
+            os.remove(file)
+        elif path.exists(file + gz_ext):        # out-of-date compressed file
+            os.remove(file + gz_ext)
+    except OSError as exc:                      # file system error
+        if verbose:
+            print(f"--- Warning: XML file '{file}' not compressed")
+            print("--- Warning:", exc)
+
+# ------------------------------------------------------------------
+def validate_PDF_files(files):                  # Function validate_PDF_files:
+                                                # Checks the structure of local
+                                                # PDF files in parallel.
+    """
+    Checks the structure of local PDF files (see check_PDF_file) in a pool of
+    hash_jobs workers.
+
+    Returns the set of the files which are not valid.
+
+    parameter:
+    files : names of the local PDF files (in the OS folder)
+    """
+
+    # 2.67   2026-10-18 new function validate_PDF_files
+
+    # validate_PDF_files --> validate_worker --> check_PDF_file
+
+    if debugging:
+        print("+++ >CTANLoad:validate_PDF_files")
+
+    todo    = Queue(queue_size)                 # files to be checked
+    bad     = set()                             # files which are not valid
+    workers = []
+    for i in range(min(hash_jobs, max(1, len(files)))):
+        thr = Thread(target=validate_worker, args=(todo, bad))
+        thr.start()
+        workers.append(thr)
+    for f in files:
+        todo.put(f)
+    for thr in workers:                         # end of the validation
+        todo.put(None)
+    for thr in workers:
+        thr.join()
+
+    if debugging:
+        print("+++ <CTANLoad:validate_PDF_files")
+    return bad
+
+# ------------------------------------------------------------------
+def validate_worker(todo, bad):                 # Function validate_worker:
+                                                # Worker for the validation of
+                                                # PDF files.
+    """
+    Worker for the validation of PDF files.
+
+    Takes file names from todo until None arrives; a file which is not valid
+    is added to bad.
+
+    parameters:
+    todo : queue with the names of the files (in the OS folder)
+    bad  : set of the files which are not valid (shared by all workers)
+    """
+
+    # 2.67   2026-10-18 new function validate_worker
+
+    # validate_worker --> check_PDF_file
+
+    while True:
+        f = todo.get()
+        if f == None:                           # end of the validation
+            return
+        if not check_PDF_file(direc + f):
+            with dload_lock:
+                bad.add(f)
+
 # ------------------------------------------------------------------
 def verify_PDF_files():                         # Function verify_PDF_files:
                                                 # Checks actualized PDF_toc;
@@ -3235,6 +8172,9 @@ def verify_PDF_files():                         # Function verify_PDF_files:
     
     # 2.46   2025-02-04 messages in functions' __doc__ texts listed
     # 2.49   2025-02-11 more f-strings
+    # 2.66   2026-10-18 in verify_PDF_files: inventory of the OS folder
+
+    # verify_PDF_files --> get_inventory
 
     global ok                                   # Flag: ok
     global PDF_toc                              # global Python dictionary with
@@ -3244,16 +8184,17 @@ def verify_PDF_files():                         # Function verify_PDF_files:
     if debugging:
         print("+++ >CTANLoad:verify_PDF_files")
     
-    ok = True
+    ok  = True
+    inv = get_inventory()                       # files in the OS folder
     for g in PDF_toc:                           # loop: move through PDF_toc
         if PDF_toc[g] == empty:                 #    no entry: no ass. XML file
             ok = False
             if verbose:
                 print(f"----- Warning: PDF file '{g}' without",
                       " associated XML file")
-            if os.path.isfile(g):               #    g is file
-                os.remove(g)                    #        delete the PDF file
-                                                #        (if it exists)
+            if g in inv:                        #    g is file
+                os.remove(direc + g)            #        delete the PDF file
+                del inv[g]                      #        (if it exists)
                 corrected += 1                  #        number of corrections
                                                 #        increased
                 if verbose:
@@ -3264,6 +8205,56 @@ def verify_PDF_files():                         # Function verify_PDF_files:
     if debugging:
         print("+++ <CTANLoad:verify_PDF_files")
 
+# ------------------------------------------------------------------
+def verify_worker(todo, bad):                   # Function verify_worker:
+                                                # Worker for the verification
+                                                # of local files.
+    """
+    Worker for the verification of local files (option -vf).
+
+    Takes jobs (kind, name, local file, SHA-256, size a/o None) from todo
+    until None arrives; a file with another size a/o hash (a/o a PDF file
+    which is not valid, see check_PDF_file) is appended to bad.
+    hashlib and zlib release the GIL while hashing a/o decompressing a block,
+    so the workers use all cores.
+
+    Rewrites the global verified.
+
+    parameters:
+    todo : queue with the files to be verified
+    bad  : list of the corrupt files (shared by all workers)
+
+    global variable:
+    verified            counter for verified local files
+    """
+
+    # 2.65   2026-10-18 new function verify_worker
+    # 2.67   2026-10-18 in verify_worker: structural validation of PDF files
+
+    # verify_worker --> get_file_hash
+    # verify_worker --> check_PDF_file
+
+    global verified                             # counter for verified local
+                                                # files
+
+    while True:
+        job = todo.get()
+        if job == None:                         # end of the verification
+            return
+        (kind, name, file, sha, size) = job
+        try:                                    # size first (cheap)
+            good = (size == None) or (os.path.getsize(file) == size)
+        except OSError:                         # file lost
+            good = False
+        if good:
+            good = get_file_hash(file) == sha   # then the content
+        if good and (kind == "pdf"):
+            good = check_PDF_file(file)         # and the structure
+        with dload_lock:
+            verified = verified + 1
+            if not good:
+                bad.append(job)
+
 
 # ==================================================================
 # Main part
@@ -3277,7 +8268,13 @@ def verify_PDF_files():                         # Function verify_PDF_files:
 ##else:
 ##    if verbose:
 ##        print("[CTANLoad] Error: tried to use the program indirectly")
-main()
+
+# 2.72   2026-10-18 no call of main in the worker processes of
+#                   generate_topicspackages (start methods spawn a/o
+#                   forkserver import the program as __mp_main__)
+
+if __name__ != "__mp_main__":                   # not a worker process
+    main()
 
 # ==================================================================
 # Es fehlen noch  bzw. Probleme:
@@ -3470,3 +8467,42 @@ main()
 # 2.48   2025-02-06 wherever appropriate:  string interpolation with f-strings instead of .format
 # 2.49   2025-02-11 more f-strings
 # 2.50   2025-02-12 no test: __name__ == "__main__; ==> CTANLoad.py can be imported 
+# 2.51   2026-10-18 package XML files can be downloaded in parallel: new option -j; new functions dload_XML_file and dload_XML_worker
+# 2.52   2026-10-18 built-in HTTP client with persistent connections (keep-alive); new option -dl (http, wget, wget2); new functions dload_file, http_connection, http_drop, http_get; new exception DownloadError
+# 2.53   2026-10-18 conditional requests (ETag/Last-Modified) for package XML files; unchanged XML files are not analyzed again; new 3rd pickle file CTAN3.pkl (XML_state); new option -fr; new functions generate_pickle3, get_file_hash, load_XML_state
+# 2.54   2026-10-18 pipeline for loading: XML download --> analysis of XML files --> PDF download, connected by queues of limited length; new option -jp; new functions analyze_XML_worker and dload_PDF_worker
+# 2.55   2026-10-18 resumable PDF downloads (built-in HTTP client): partial files kept as .part with a journal (.jnl), resumed with Range/If-Range; new functions generate_part_journal and load_part_journal
+# 2.56   2026-10-18 file keys of PDF files derived from their CTAN address (no more random numbers); PDF files registered by content (SHA-256): identical files shared by hard links, unchanged files not downloaded again (conditional requests); CTAN3.pkl now with XML_state and PDF_state; new functions get_file_key and store_PDF_file
+# 2.57   2026-10-18 politeness: token buckets for requests/s and bytes/s (new options -rr, -br); adaptive concurrency of all downloads (AIMD: halved after timeout/429/5xx, increased after success); new functions acquire_slot, limit_rate, release_slot
+# 2.58   2026-10-18 new option -src: CTAN files from any base URL, a local mirror folder a/o an archive (tar, zip); new functions source_get and source_open
+# 2.59   2026-10-18 the four catalog files (authors, topics, licenses, packages) downloaded in parallel and cached (new 4th pickle file CTAN4.pkl, new option -ttl); new functions dload_catalogs, dload_catalog_worker, generate_pickle4, load_catalogs
+# 2.60   2026-10-18 persistent job queue CTAN-queue.db (SQLite): packages, PDF files and XML_toc entries recorded as they are finished; an interrupted load is resumed; new functions queue_add, queue_close, queue_open, queue_set, queue_toc
+# 2.61   2026-10-18 catalog files (authors, topics, licenses, packages) parsed on the fly while downloading (XMLPullParser), no more second pass over the local file; new function parse_catalog
+# 2.62   2026-10-18 compressed transfer (gzip) with the built-in HTTP client; package XML files optionally stored compressed (abc.xml.gz, new option -z) and read transparently; new functions find_XML_file, open_XML_file, store_XML_file
+# 2.63   2026-10-18 scheduler: byte and time budgets for the downloads (new options -nb, -tb; the rest is loaded in the next session via the job queue), priority policies name/recent/missing (new option -p); new functions check_budget, order_packages
+# 2.64   2026-10-18 dry run: new option -pl plans a load without loading (new, removed and stale packages, XML/PDF transfers, estimated bytes; output on terminal and in xyz.plan.json); new functions call_plan, select_packages
+# 2.65   2026-10-18 verification of the local files: new option -vf re-hashes all local XML and PDF files in parallel (hash_jobs workers, all cores, read in blocks) against the hashes/sizes recorded at download time; corrupt files are downloaded again; compressed XML files hashed by their content; new functions call_verify, verify_worker
+# 2.66   2026-10-18 one os.scandir pass over the OS folder (name, size, mtime), shared by get_PDF_files, get_XML_files, set_PDF_toc, check_integrity, verify_PDF_files, call_plan, call_verify and make_statistics instead of single listdir/isfile/exists/getsize calls; discarded when the OS folder is changed; new functions get_inventory, reset_inventory
+# 2.67   2026-10-18 structural validation of PDF files ("%PDF-" at the begin, "%%EOF" at the end; memory-mapped, only the first/last pdf_probe bytes): downloaded files (an HTML error page a/o a truncated file is deleted and marked for the next load), -c (in a pool of hash_jobs workers; packages with deleted PDF files marked in XML_state), -vf; new functions check_PDF_file, validate_PDF_files, validate_worker
+# 2.68   2026-10-18 telemetry of the downloads: new option -tm records each request (class catalog/xml/pdf, bytes, HTTP status, duration, retries) and writes a JSON report (xyz.telemetry.json: latency and size histograms, percentiles, throughput per class and per session) and a Prometheus textfile (xyz.prom) at the end of the run; new functions add_telemetry, generate_telemetry
+# 2.69   2026-10-18 repeated downloads: a download with a transient error (network error, timeout, 408, 429, 5xx; wget: network failure) is repeated up to -rt times (new option, default 3) after a jittered exponential backoff (new option -bo, base delay; Retry-After of the server respected); catalog parsers restarted; failed jobs are kept in the job queue CTAN-queue.db and retried first in the next session; new function dload_request
+# 2.70   2026-10-18 bulk import/export of XML files: new option -im imports the package XML files of an archive (tar, .tar.gz, .tgz, .tar.bz2, .tar.xz a/o zip; members xml/2.0/pkg/<name>, <name>.xml a/o <name>.xml.gz) in one streaming pass (stored, hashed in XML_state, analyzed for XML_toc; derived dictionaries and pickle files generated); new option -ex exports the local XML files into an archive in the layout of a CTAN mirror (usable with -im and -src); new functions call_export, call_import
+# 2.71   2026-10-18 incremental generate_topicspackages: the facts of each package XML file (topics, authors, licenses, year) are kept with name, size, mtime and SHA-256 in XML_facts (new 5th pickle file CTAN5.pkl); only new a/o changed XML files are parsed again, the dictionaries topicspackages, packagetopics, authorpackages, licensepackages and yearpackages are built from the facts; years of version/copyright no longer taken from the previous package; new functions generate_pickle5, get_XML_facts, load_XML_facts
+# 2.72   2026-10-18 multi-core extraction: new option -jx; the package XML files to be parsed in generate_topicspackages are sharded (extract_chunk files) and parsed by a pool of worker processes (hash and facts incl. the hrefs of the documentation); dictionaries built in the order of packages; regenerate_pickle_files (-r) takes the hrefs from XML_facts instead of parsing again and analyzes the XML files in sorted order; main not called in worker processes; new function extract_worker
+# 2.73   2026-10-18 index file CTAN.idx (written with CTAN.pkl; JSON lines: topicspackages, authorpackages, licensepackages; one read, only the needed line is parsed) used by get_xyz_lpt, get_xyz_lap and get_xyz_llp instead of eval on each line of xyz.lpt/.lap/.llp; the list files (-l) remain as export and fallback (ast.literal_eval); new functions generate_index, load_index
+# 2.74   2026-10-18 optional SQLite catalog: new option -sq writes the dictionaries of CTAN.pkl and XML_toc also into CTAN.db (tables authors, packages, topics, licenses, topicspackages, packagetopics, authorpackages, licensepackages, yearpackages, documentation, meta; relations indexed on key and package; one transaction per part, WAL mode for concurrent readers); used by CTANOut -sq; the pickle files remain the default; new function generate_catalog_db
+# 2.75   2026-10-18 sectioned catalog CTAN.sec (written with CTAN.pkl; each dictionary pickled on its own behind a directory of offsets, for the lazy loading in CTANOut); new function generate_sections
+# 2.76   2026-10-18 http_get: a body shorter than announced (Content-Length, Content-Range) a/o a gzip transfer without its end raises DownloadError ("incomplete"); .part file and journal are kept, the repetition resumes the download
+# 2.76   2026-10-18 http_get: without resume the file is written to file.part and renamed only after the check of the length (no truncated package XML files)
+# 2.76   2026-10-18 conditional loads: a package is loaded and analyzed once more, if its local XML file is not well-formed (validators dropped) a/o one of its PDF files is missing (-f; new function check_PDF_presence; also in call_plan)
+# 2.76   2026-10-18 dload_request: wget/wget2 download to file.part and replace the file, so that a hard-linked PDF file (shared with identical files) is not rewritten in place
+# 2.76   2026-10-18 source_get: the lock is only taken for archives (files of a local mirror folder are copied in parallel); -nb: local sources do not count
+# 2.76   2026-10-18 job queue: failed packages of the last session, which the current selection does not reach, are dropped from CTAN-queue.db (otherwise it was kept forever); new function queue_prune
+# 2.76   2026-10-18 get_XML_files returns a sorted list (deterministic order of the outputs)
+# 2.76   2026-10-18 call_plan, dload_XML_file and dload_document_file share the tests for a conditional request (new functions get_XML_cond, get_PDF_cond): the plan takes the same decisions as the load
+# 2.76   2026-10-18 http_get: a partial response (206) whose Content-Range does not start at the end of the .part file is discarded; the file is loaded again from byte 0
+# 2.76   2026-10-18 source_open: a path which resolves to a file outside the local mirror folder (-src; "..", symbolic links) is refused
+# 2.76   2026-10-18 load_index: topicspackages, authorpackages and licensepackages in memory are used without reading CTAN.idx a/o the list files (no termination, if both are missing)
+# 2.76   2026-10-18 adaptive concurrency: -j and -jp are the upper limit (worker threads); the limit starts at half of it, so that the additive increase ramps up
+# 2.76   2026-10-18 limit -n in the pipeline: each PDF download is reserved before it is queued (new function reserve_PDF_file); the XML download stage stops, when downloaded files and queued a/o running PDF downloads reach the limit
+# 2.76   2026-10-18 job queue: only transient errors (network error, timeout, 408, 429, 5xx) keep a failed job, for at most queue_attempts (3) sessions (new column attempts; new functions is_transient, queue_fail); PDF jobs without XML_toc entry a/o of packages outside the selection are dropped, so that CTAN-queue.db is removed eventually
@@ -97,6 +97,9 @@ import os                                       # OS relevant routines
 from os import path                             # path informations
 import codecs                                   # needed for full UTF-8 output
                                                 # on stdout
+import gzip                                     # compressed XML files
+import json                                     # index file CTAN.idx
+import sqlite3                                  # SQLite catalog (-sq)
 
 
 #===================================================================
@@ -139,8 +142,8 @@ import codecs                                   # needed for full UTF-8 output
 # Settings
 
 programname             = "CTANOut.py"
-programversion          = "2.68"
-programdate             = "2025-02-12"
+programversion          = "2.73"
+programdate             = "2026-10-18"
 programauthor           = "Günter Partosch"
 documentauthor          = "Developers and contributors for" + \
                           " {\\TeX}, {\\LaTeX}, \\& Co"
@@ -178,12 +181,21 @@ pickle_name1            = "CTAN.pkl"            # default name of the
                                                 # 1st pickle file
 pickle_name2            = "CTAN2.pkl"           # default name of the
                                                 # 2nd pickle file
+index_name              = "CTAN.idx"            # default name of the index
+                                                # file (CTANLoad 2.73)
+catalog_name            = "CTAN.db"             # default name of the SQLite
+                                                # catalog (CTANLoad -sq)
+section_name            = "CTAN.sec"            # default name of the
+                                                # sectioned catalog
+                                                # (CTANLoad 2.75)
 empty                   = ""                    # default text in some cases
 blank                   = " "                   # default text in some other
                                                 # cases
 file_encoding           = "UTF-8"               # encoding of output file
 ext                     = ".xml"                # file name extension for info
                                                 # files to be downloaded
+gz_ext                  = ".gz"                 # file name extension for
+                                                # compressed XML files
 
 # ------------------------------------------------------------------
 # Collect infos for elements which cannot be output in another way
@@ -287,6 +299,9 @@ template_text           = "emplate for output filtering on the base of" + \
 year_template_text      = "Template for output filtering on the base of years"
 
 no_files_text           = "Flag: Do not generate output files."
+sqlite_text             = "Flag: Reads the catalog from the SQLite" + \
+                          " database CTAN.db (CTANLoad -sq) instead of" + \
+                          " the pickle files."
 statistics_text         = "Flag: Prints statistics on terminal."   
 topics_text             = "Flag: Generates topic lists [meaning of" + \
                           " topics|licenses + cross-references" + \
@@ -303,6 +318,7 @@ verbose_default          = False                # default for global flag:
 statistics_default       = False                # default for global flag:
                                                 # statistics output (-stat)
 no_files_default         = False                # default for option -nf
+sqlite_default           = False                # default for option -sq
 license_template_default = """^.+$"""           # default for option -L (license
                                                 # name template)
 name_template_default    = """^.+$"""           # default for file name template
@@ -344,6 +360,7 @@ year_template           = empty                 # variable for -y
 out_file                = empty                 # variable for -o
 skip                    = empty                 # variable for -s
 skip_biblatex           = empty                 # variable for -sb
+sqlite                  = None                  # variable for -sq
 statistics              = None                  # variable for -stat
 verbose                 = None                  # variable for -v
 debugging               = None                  # variable for -dbg
@@ -457,6 +474,16 @@ authors                  = {}                   # python dictionary:
                                                 # each element:
                                                 # <author key>:<tuple with
                                                 # givenname and familyname>
+catalog_db               = None                 # connection to the SQLite
+                                                # catalog (-sq)
+sections                 = {}                   # python dictionary:
+                                                # sections of CTAN.sec not
+                                                # loaded up to now
+                                                # each element:
+                                                # <name>:<tuple with offset
+                                                # and length>
+sections_base            = 0                    # begin of the sections in
+                                                # CTAN.sec
 
 # ------------------------------------------------------------------
 # Strings for Excel output
@@ -641,6 +668,12 @@ group1.add_argument("-sb", "--skip_biblatex",   # Parameter -sb|--skip_biblatex
                     dest    = "skip_biblatex",
                     default = skip_biblatex_default)
 
+group1.add_argument("-sq", "--sqlite",          # Parameter -sq|--sqlite
+                    help    = sqlite_text + " -- Default: " + "%(default)s",
+                    action  = "store_true",
+                    dest    = "sqlite",
+                    default = sqlite_default)
+
 group1.add_argument("-t", "--name_template",    # Parameter -t|--name_template
                     metavar = "<name template>",
                     help    = template_text + " -- Default: " + "%(default)s",
@@ -673,6 +706,7 @@ no_files         = args.no_files                # Parameter -nf
 out_file         = args.out_file                # Parameter -o
 skip             = args.skip                    # Parameter -s
 skip_biblatex    = args.skip_biblatex           # Parameter -sb
+sqlite           = args.sqlite                  # Parameter -sq
 statistics       = args.statistics              # Parameter -stat
 verbose          = args.verbose                 # Parameter -v
 debugging        = args.debugging               # parameter -dbg
@@ -775,8 +809,9 @@ p3  = re.compile(key_template)                  # regular expression based on -k
 p4  = re.compile("[- |.,a-z]")                  # split a string to find year
                                                 # data
 p5  = re.compile(author_template)               # regular expression based on -A
-p6  = re.compile("^.+[.]xml$")                  # regular expression for local
-                                                # XML file names
+p6  = re.compile("^.+[.]xml([.]gz)?$")          # regular expression for local
+                                                # XML file names (a/o
+                                                # compressed)
 p7  = re.compile(r"[\s]+")                      # regular expression: test of
                                                 # "white space"
 p8  = re.compile("§§=([1-2][0-9]|[1-9])")       # regular expression: processing
@@ -927,14 +962,22 @@ def biblatex_citationkey():                     # auxiliary function: Generates
         """
 
     # 2.67    2025-02-11 more f-strings
+    # 2.69    2026-10-18 in biblatex_citationkey: compressed XML files
+    # 2.72    2026-10-18 in biblatex_citationkey: catalog sections loaded on
+    #                    first access
 
     # biblatex_citationkeys --> get_year()
     # biblatex_citationkeys --> get_authoryear()
+    # biblatex_citationkeys --> open_XML_file()
+    # biblatex_citationkeys --> load_section()
 
     global citation_keys                        # set: citation keys
 
     if debugging:
         print("+++ >CTANOut: >CTANOut:biblatex_citationkey")
+
+    load_section("authors")                     # catalog section (loaded on
+                                                # first access)
         
     author_id_default = authorunknown
     citation_key      = {}
@@ -952,7 +995,8 @@ def biblatex_citationkey():                     # auxiliary function: Generates
         ff           = direc + f + ext
         
         try:
-            op = ET.parse(ff)                   # parse XML file
+            with open_XML_file(ff) as xf:       # XML file a/o compressed file
+                op = ET.parse(xf)               # parse XML file
             OK = True
         except:                                 # not successfull
             if verbose:
@@ -1037,6 +1081,32 @@ def comment_fold(s):                            # auxiliary function:
     out = out + line            
     return out
 
+# ------------------------------------------------------------------
+def find_XML_file(file):                        # auxiliary function
+                                                # find_XML_file: finds a local
+                                                # XML file (a/o its compressed
+                                                # form)
+    """
+    auxiliary function: Finds a local XML file: file itself a/o the compressed
+    file file.gz (CTANLoad -z).
+
+    parameter:
+    file: name of the XML file (abc.xml)
+
+    Returns the name of the existing file or None.
+    """
+
+    # 2.69    2026-10-18 new function find_XML_file
+
+    if debugging:
+        print("+++ -CTANOut:find_XML_file")
+
+    if path.exists(file):                       # uncompressed
+        return file
+    if path.exists(file + gz_ext):              # compressed
+        return file + gz_ext
+    return None
+
 # ------------------------------------------------------------------
 def fold(s):                                    # auxiliary function fold:
                                                 # shortens long option values
@@ -1236,9 +1306,12 @@ def get_local_packages(d):                      # auxiliary function
 
     d: OS folder to be analyzed
 
-    Returns a set (= local packages).
+    Returns a set (= local packages); compressed XML files (abc.xml.gz) are
+    included.
     """
 
+    # 2.69    2026-10-18 in get_local_packages: compressed XML files
+
     if debugging:
         print("+++ -CTANOut:get_local_packages")
 
@@ -1248,7 +1321,8 @@ def get_local_packages(d):                      # auxiliary function
     for f in tmp:                               # check all the files
         if p6.match(f) and not (f in exclusion):
                                                 #   name matches
-            tmp3 = f[0:len(f) - 4]
+            tmp3 = re.sub("[.]xml([.]gz)?$", empty, f)
+                                                #   without .xml a/o .xml.gz
             tmp2.append(tmp3)
     return set(tmp2)
 
@@ -1270,6 +1344,12 @@ def get_year_packages():                        # Function get_package_set:
     """
 
     # 2.67    2025-02-11 more f-strings
+    # 2.71    2026-10-18 in get_year_packages: SQLite catalog (-sq)
+    # 2.72    2026-10-18 in get_year_packages: catalog sections loaded on first
+    #                    access
+
+    # get_year_packages --> query_catalog_db
+    # get_year_packages --> load_section
 
     global yearpackages
     
@@ -1277,12 +1357,17 @@ def get_year_packages():                        # Function get_package_set:
         print("+++ -CTANOut:get_year_packages")
 
     tmp = set()
-    for f in yearpackages:                      # loop over all the
+    if catalog_db != None:                      # SQLite catalog (-sq)
+        tmp = query_catalog_db("yearpackages", p10.match)
+    else:
+        load_section("yearpackages")            # catalog section (loaded on
+                                                # first access)
+        for f in yearpackages:                  # loop over all the
                                                 # year-package correspondences
-        if p10.match(f):                        #    check:
+            if p10.match(f):                    #    check:
                                                 #    year matches year_template
-            tmp2 = set(yearpackages[f])                              
-            tmp = tmp | tmp2
+                tmp2 = set(yearpackages[f])                              
+                tmp = tmp | tmp2
     if len(tmp) == 0:
         if verbose:
             tmp_y = "year"
@@ -1323,6 +1408,33 @@ def get_year(s):                                # auxiliary function: gets the
     else:                                       # there is no year
         return year_default
 
+# ------------------------------------------------------------------
+def open_XML_file(file):                        # auxiliary function
+                                                # open_XML_file: opens a local
+                                                # XML file (a/o its compressed
+                                                # form)
+    """
+    auxiliary function: Opens a local XML file for reading: file itself a/o
+    the compressed file file.gz (CTANLoad -z).
+
+    parameter:
+    file: name of the XML file (abc.xml)
+
+    Returns the opened file; raises FileNotFoundError if there is none.
+    """
+
+    # 2.69    2026-10-18 new function open_XML_file
+
+    # open_XML_file --> find_XML_file
+
+    if debugging:
+        print("+++ -CTANOut:open_XML_file")
+
+    name = find_XML_file(file) or file          # name of the existing file
+    if name.endswith(gz_ext):                   # compressed
+        return gzip.open(name, encoding=file_encoding, mode="rt")
+    return open(name, encoding=file_encoding, mode="r")
+
 # ------------------------------------------------------------------
 def TeX_fold(s):                                # auxiliary function TeX_fold:
                                                 # shortens|folds long option
@@ -1466,8 +1578,10 @@ def also(k):                                    # function: processes element
 
     # 2.65    2025-02-06 wherever appropriate: string interpolation with
     #                    f-strings instead of .format
+    # 2.72    2026-10-18 in also: catalog sections loaded on first access
 
     # also --> TeXchars
+    # also --> load_section
     
     global s_also                               # string for Eccel: also
     global notice                               # string for RIS|BibLaTeX:
@@ -1476,6 +1590,9 @@ def also(k):                                    # function: processes element
 
     if debugging:
         print("+++ >CTANOut:also")
+
+    load_section("packages")                    # catalog section (loaded on
+                                                # first access)
     
     refid = k.get("refid",empty)                # get attribute refid
 
@@ -1536,6 +1653,9 @@ def authorref(k):                               # function: processes element
     #                   author|owner names
     # 2.65   2025-02-06 wherever appropriate: string interpolation with
     #                   f-strings instead of .format
+    # 2.72   2026-10-18 in authorref: catalog sections loaded on first access
+
+    # authorref --> load_section
     
     global authorexists                         # flag
     global s_author                             # string for Excel: authorref
@@ -1544,6 +1664,9 @@ def authorref(k):                               # function: processes element
 
     if debugging:
         print("+++ >CTANOut:authorref")
+
+    load_section("authors")                     # catalog section (loaded on
+                                                # first access)
     
     key        = k.get("key", empty)            # get attribute key
     xid        = k.get("id", empty)             # get attribute id
@@ -2150,6 +2273,9 @@ def first_lines():                              # function: creates the first
                   format("-mt", "(" + (topics_text + ")")[0:50] + ellipsis))
         if ("-nf" in call) or ("--no_files" in call):
             print("  {0:5} {1:60}".format("-nf", "(" + no_files_text + ")"))
+        if ("-sq" in call) or ("--sqlite" in call):
+            print("  {0:5} {1:60}".\
+                  format("-sq", "(" + (sqlite_text + ")")[0:50] + ellipsis))
         if ("-stat" in call) or ("--statistics" in call):
             print("  {0:5} {1:60}".\
                   format("-stat", "(" + statistics_text + ")"))
@@ -2358,12 +2484,35 @@ def get_author_packages():                      # Function get_author_packages:
 
     # 2.65    2025-02-06 wherever appropriate: string interpolation with
     #                    f-strings instead of .format
+    # 2.70    2026-10-18 in get_author_packages: authorpackages taken from the
+    #                    index file (if present)
+    # 2.71    2026-10-18 in get_author_packages: SQLite catalog (-sq)
+    # 2.72    2026-10-18 in get_author_packages: catalog sections loaded on
+    #                    first access
+    # 2.73    2026-10-18 in get_author_packages: index file only as fallback
+    #                    (authorpackages of the catalog preferred)
+
+    # get_author_packages --> load_index
+    # get_author_packages --> query_catalog_db
+    # get_author_packages --> load_section
 
     if debugging:
         print("+++ -CTANOut:get_author_packages")
 
+    load_section("authors")                     # catalog section (loaded on
+                                                # first access)
+
     author_pack = set()                         # initialize set
     tmp_set     = set()                         # initialize auxiliary set
+    if catalog_db != None:                      # SQLite catalog (-sq)
+        index = None
+    else:
+        load_section("authorpackages")          # authors and their packages
+        index = authorpackages
+        if len(index) == 0:                     # not in the catalog: index
+            index = load_index("authorpackages")# file as fallback
+            if index == None:
+                index = {}
     
     for f in authors:                           # loop over authors
         (gn, fn) = authors[f]
@@ -2375,10 +2524,14 @@ def get_author_packages():                      # Function get_author_packages:
         if p5.match(tmp_a):                     # member matches template
             tmp_set.add(f)                      # built-up a new auxiliary set
             
-    for f in tmp_set:                           # loop over auxiliary set
-        if f in authorpackages:                 # prevent a wrong entry                         
-            for g in authorpackages[f]:
-                author_pack.add(g)              # built-up the resulting set
+    if catalog_db != None:                      # only the rows of tmp_set
+        author_pack = query_catalog_db("authorpackages",
+                                       lambda f: f in tmp_set)
+    else:
+        for f in tmp_set:                       # loop over auxiliary set
+            if f in index:                      # prevent a wrong entry
+                for g in index[f]:
+                    author_pack.add(g)          # built-up the resulting set
     if len(author_pack) == 0:
         if verbose:
             tmp_a = "author"
@@ -2400,10 +2553,17 @@ def get_name_packages():                        # Function get_name_packages:
     """
 
     # 2.67    2025-02-11 more f-strings
+    # 2.72    2026-10-18 in get_name_packages: catalog sections loaded on first
+    #                    access
+
+    # get_name_packages --> load_section
 
     if debugging:
         print("+++ -CTANOut:get_name_packages")
 
+    load_section("packages")                    # catalog section (loaded on
+                                                # first access)
+
     name_pack = set()                           # initialize set
     
     for f in packages:                          # loop over packages
@@ -2429,16 +2589,36 @@ def get_topic_packages():                       # Function get_topic_packages:
     """
 
     # 2.67    2025-02-11 more f-strings
+    # 2.70    2026-10-18 in get_topic_packages: topicspackages taken from the
+    #                    index file (if present)
+    # 2.71    2026-10-18 in get_topic_packages: SQLite catalog (-sq)
+    # 2.72    2026-10-18 in get_topic_packages: catalog sections loaded on
+    #                    first access
+    # 2.73    2026-10-18 in get_topic_packages: index file only as fallback
+    #                    (topicspackages of the catalog preferred)
+
+    # get_topic_packages --> load_index
+    # get_topic_packages --> query_catalog_db
+    # get_topic_packages --> load_section
 
     if debugging:
         print("+++ -CTANOut:get_topic_packages")
 
     topic_pack = set()                          # initialize set
+    if catalog_db != None:                      # SQLite catalog (-sq)
+        topic_pack = query_catalog_db("topicspackages", p3.match)
+    else:
+        load_section("topicspackages")          # topics and their packages
+        index = topicspackages
+        if len(index) == 0:                     # not in the catalog: index
+            index = load_index("topicspackages")# file as fallback
+            if index == None:
+                index = {}
     
-    for f in topicspackages:                    # loop over topicspackages
-        if p3.match(f):                         # member matches template
-            for g in topicspackages[f]:         # all packagexs for this entry
-                topic_pack.add(g)               # built-up the resulting set
+        for f in index:                         # loop over topicspackages
+            if p3.match(f):                     # member matches template
+                for g in index[f]:              # all packagexs for this entry
+                    topic_pack.add(g)           # built-up the resulting set
     if len(topic_pack) == 0:
         if verbose:
             tmp_t = "topic"
@@ -2459,24 +2639,49 @@ def get_license_packages():                     # Function get_license_packages:
     """
 
     # 2.67    2025-02-11 more f-strings
+    # 2.70    2026-10-18 in get_license_packages: licensepackages taken from
+    #                    the index file (if present)
+    # 2.71    2026-10-18 in get_license_packages: SQLite catalog (-sq)
+    # 2.72    2026-10-18 in get_license_packages: catalog sections loaded on
+    #                    first access
+    # 2.73    2026-10-18 in get_license_packages: index file only as fallback
+    #                    (licensepackages of the catalog preferred)
+
+    # get_license_packages --> load_index
+    # get_license_packages --> query_catalog_db
+    # get_license_packages --> load_section
 
     if debugging:
         print("+++ -CTANOut:get_license_packages")
 
-    license_pack = set()                        # initialize set
-    
-    for lic in licensepackages:                 # loop over licensepackages
+    load_section("licenses")                    # catalog section (loaded on
+                                                # first access)
+
+    def license_match(lic):                     # license matches template
         lic2 = licenses[lic][0]
         lic3 = licenses[lic][1]
         if lic3 == "true":
             lic3 = "free"
         else:
             lic3 = "not free"
-        if p9.match(lic2) or p9.match(lic) or p9.match(lic3):
-                                                # collect packages with
+        return p9.match(lic2) or p9.match(lic) or p9.match(lic3)
+
+    license_pack = set()                        # initialize set
+    if catalog_db != None:                      # SQLite catalog (-sq)
+        license_pack = query_catalog_db("licensepackages", license_match)
+    else:
+        load_section("licensepackages")         # licenses and their packages
+        index = licensepackages
+        if len(index) == 0:                     # not in the catalog: index
+            index = load_index("licensepackages")
+            if index == None:                   # file as fallback
+                index = {}
+    
+        for lic in index:                       # loop over licensepackages
+            if license_match(lic):              # collect packages with
                                                 # specified licenses
-            for g in licensepackages[lic]:
-                license_pack.add(g)
+                for g in index[lic]:
+                    license_pack.add(g)
     if len(license_pack) == 0:
         if verbose:
             tmp_l = "license"
@@ -2607,8 +2812,10 @@ def keyval(k):                                  # function: processes element
 
     # 2.65    2025-02-06 wherever appropriate: string interpolation with
     #                    f-strings instead of .format
+    # 2.72    2026-10-18 in keyval: catalog sections loaded on first access
 
     # keyval --> TeXchars
+    # keyval --> load_section
     
     global s_keyval                             # string for Excel: keyval
     global usedTopics                           # dictionary for collecting
@@ -2618,6 +2825,9 @@ def keyval(k):                                  # function: processes element
     if debugging:
         print("+++ >CTANOut:keyval")
 
+    load_section("topics")                      # catalog section (loaded on
+                                                # first access)
+
     key   = k.get("key", empty)                 # get attribute key
     value = k.get("value", empty)               # get attribute value
 
@@ -2672,11 +2882,13 @@ def leading(k, p, t):                           # function leading:
 
     # 2.65    2025-02-06 wherever appropriate: string interpolation with
     #                    f-strings instead of .format
+    # 2.72    2026-10-18 in leading: catalog sections loaded on first access
 
     # leading --> TeXchars
     # leading --> get_year
     # leading --> get_authoryear
     # leading --> bibfield_test
+    # leading --> load_section
     
     global authorexists                         # flag
     global s_lastaccess                         # string for Excel: Last access
@@ -2685,6 +2897,9 @@ def leading(k, p, t):                           # function leading:
     if debugging:
         print("+++ >CTANOut:leading")
 
+    load_section("authors")                     # catalog section (loaded on
+                                                # first access)
+
     xname = k.get("id", empty)                  # get attribute id
     xpath = ctanUrl4 + p
 
@@ -2828,6 +3043,9 @@ def licenseT(k):                                # function licenseT:  processes
 
     # 2.65    2025-02-06 wherever appropriate: string interpolation with
     #                    f-strings instead of .format
+    # 2.72    2026-10-18 in licenseT: catalog sections loaded on first access
+
+    # licenseT --> load_section
     
     global notice                               # string for RIS|BibLaTeX:
                                                 # collection for N1 a/o note
@@ -2843,6 +3061,9 @@ def licenseT(k):                                # function licenseT:  processes
     if debugging:
         print("+++ >CTANOut:licenseT")
 
+    load_section("licenses")                    # catalog section (loaded on
+                                                # first access)
+
     typeT     = k.get("type", empty)            # get attribute type; get a
                                                 # license key
     tmp       = typeT
@@ -2900,6 +3121,135 @@ def licenseT(k):                                # function licenseT:  processes
     if debugging:
         print("+++ <CTANOut:licenseT")
 
+# ------------------------------------------------------------------
+def load_catalog_db():                          # Function load_catalog_db:
+                                                # opens the SQLite catalog
+    """
+    Opens the SQLite catalog CTAN.db (generated by CTANLoad.py -sq) read-only
+    and gets the structures authors, packages, topics, licenses and XML_toc.
+    The relations (topicspackages, authorpackages, licensepackages,
+    yearpackages) stay in the database: the selections query only the rows
+    they need (see query_catalog_db); they are only read completely for the
+    topic/author/license lists of -m LaTeX -mt.
+
+    The table documentation is only written by a complete load of CTANLoad
+    (-sq); if it is missing, XML_toc is taken from the 2nd pickle file (see
+    load_pickle2). Any other missing table terminates the program.
+
+    Rewrites the global catalog_db, authors, packages, topics, licenses,
+    XML_toc (a/o topicspackages, authorpackages, licensepackages).
+
+    no parameter
+
+    possible (error) messages:
+    + Error: SQLite catalog '{0}' not found or not usable
+    + Error: table(s) {0} missing in SQLite catalog '{1}'
+    + Info: table 'documentation' missing in SQLite catalog '{0}'; XML_toc
+      taken from pickle file '{1}'
+    """
+
+    # 2.71    2026-10-18 new function load_catalog_db
+    # 2.73    2026-10-18 in load_catalog_db: missing tables named; XML_toc
+    #                    from the 2nd pickle file, if table documentation is
+    #                    missing
+
+    # load_catalog_db --> load_pickle2
+
+    global catalog_db, authors, packages, topics, licenses, XML_toc
+    global topicspackages, authorpackages, licensepackages
+
+    if debugging:
+        print("+++ >CTANOut:load_catalog_db")
+
+    def rows(table):                            # all rows of a table in the
+                                                # order of CTANLoad
+        return catalog_db.execute(f"SELECT * FROM {table} ORDER BY rowid")
+
+    def relation(table):                        # key --> list of packages
+        tmp = {}
+        for (k, g) in rows(table):
+            tmp.setdefault(k, []).append(g)
+        return tmp
+
+    needed = ["authors", "packages", "topics", "licenses", "topicspackages",
+              "authorpackages", "licensepackages", "yearpackages"]
+                                                # tables of the catalog part
+    try:
+        catalog_db = sqlite3.connect("file:" + direc + catalog_name +
+                                     "?mode=ro", uri=True)
+        tables  = {r[0] for r in catalog_db.execute("SELECT name FROM " +
+                                                    "sqlite_master WHERE " +
+                                                    "type = 'table'")}
+    except sqlite3.Error:                       # unable to open the catalog
+        print(f"--- Error: SQLite catalog '{catalog_name}' not found or",
+              "not usable")
+        sys.exit("[CTANOut] Error: program is terminated")
+
+    missing = [t for t in needed if not t in tables]
+    if len(missing) > 0:                        # catalog part not written
+        print("--- Error: table(s)", ", ".join(f"'{t}'" for t in missing),
+              f"missing in SQLite catalog '{catalog_name}'")
+        sys.exit("[CTANOut] Error: program is terminated")
+
+    try:
+        authors  = {r[0]: tuple(r[1:]) for r in rows("authors")}
+        packages = {r[0]: tuple(r[1:]) for r in rows("packages")}
+        topics   = {r[0]: r[1] for r in rows("topics")}
+        licenses = {r[0]: tuple(r[1:]) for r in rows("licenses")}
+        if "documentation" in tables:
+            XML_toc = {r[0]: tuple(r[1:]) for r in rows("documentation")}
+        if (mode == "LaTeX") and make_topics:   # complete lists are needed
+            topicspackages  = relation("topicspackages")
+            authorpackages  = relation("authorpackages")
+            licensepackages = relation("licensepackages")
+    except sqlite3.Error:                       # unable to read the catalog
+        print(f"--- Error: SQLite catalog '{catalog_name}' not found or",
+              "not usable")
+        sys.exit("[CTANOut] Error: program is terminated")
+
+    if not "documentation" in tables:           # toc part not written
+        if verbose:
+            print("--- Info: table 'documentation' missing in SQLite",
+                  f"catalog '{catalog_name}'; XML_toc taken from pickle",
+                  f"file '{pickle_name2}'")
+        load_pickle2()
+
+    if debugging:
+        print("+++ <CTANOut:load_catalog_db")
+
+# ------------------------------------------------------------------
+def load_index(section):                        # Function load_index:
+                                                # loads one dictionary of the
+                                                # index file
+    """
+    Gets one dictionary of the index file CTAN.idx (generated by CTANLoad.py
+    together with the 1st pickle file; JSON lines: one line
+    ["<name>", {key: [packages]}] per dictionary). Only the line of section
+    is parsed. Fallback, if the dictionary is not in the catalog (pickle
+    file a/o sectioned catalog).
+
+    Returns the dictionary a/o None (no usable index file).
+
+    parameter:
+    section: name of the dictionary ("topicspackages", "authorpackages",
+             "licensepackages")
+    """
+
+    # 2.70    2026-10-18 new function load_index
+
+    if debugging:
+        print("+++ -CTANOut:load_index")
+
+    prefix = json.dumps([section])[0:-1] + ","  # begin of the line
+    try:
+        with open(direc + index_name, encoding="utf-8") as f:
+            for line in f:
+                if line.startswith(prefix):     # only this line is parsed
+                    return json.loads(line)[1]
+    except (OSError, ValueError):               # no usable index file
+        pass
+    return None
+
 # ------------------------------------------------------------------
 def load_pickle1():                             # Function load_pickle1:
                                                 # loads|unpacks pickle file 1
@@ -2907,19 +3257,27 @@ def load_pickle1():                             # Function load_pickle1:
     Gets the structures authors, packages, topics, topicspackages,
     authorpackages, licensepackages (generated by CTANLoad.py).
 
+    If the sectioned catalog CTAN.sec is present (and not older than the
+    pickle file), only its directory is read: each structure is loaded on
+    its first access (see load_section).
+
     Rewrites the global authors, packages, topics, licenses, topicspackages,
-    packagetopics, authorpackages, licensepackages, yearpackages.
+    packagetopics, authorpackages, licensepackages, yearpackages (a/o
+    sections, sections_base).
 
     global variables:
     authors, packages, topics, licenses, topicspackages, packagetopics,
-    authorpackages, licensepackages, yearpackages
+    authorpackages, licensepackages, yearpackages, sections, sections_base
     """
 
     # 2.65    2025-02-06 wherever appropriate: string interpolation with
     #                    f-strings instead of .format
+    # 2.72    2026-10-18 in load_pickle1: directory of the sectioned catalog
+    #                    (structures loaded on first access)
 
     global authors, packages, topics, licenses, topicspackages, packagetopics
     global authorpackages, licensepackages, yearpackages
+    global sections, sections_base
 
     if debugging:
         print("+++ >CTANOut:load_pickle1")
@@ -2943,6 +3301,18 @@ def load_pickle1():                             # Function load_pickle1:
     # yearpackages: Python dictionary 
     #   each element: <year>:<list with package names>
 
+    try:                                        # sectioned catalog
+        if path.getmtime(direc + section_name) >= \
+           path.getmtime(direc + pickle_name1): # not older than pickle file
+            with open(direc + section_name, "br") as f:
+                sections      = pickle.load(f)  # directory of the sections
+                sections_base = f.tell()
+            if debugging:
+                print("+++ <CTANOut:load_pickle1")
+            return
+    except (OSError, pickle.UnpicklingError, EOFError):
+        sections = {}                           # no usable sectioned catalog
+
     try:                                        # try to open 1st pickle file 
         pickleFile1 = open(direc + pickle_name1, "br")
         (authors, packages, topics, licenses, topicspackages, packagetopics,
@@ -2995,6 +3365,48 @@ def load_pickle2():                             # Function load_pickle2:
     if debugging:
         print("+++ <CTANOut:load_pickle2")
 
+# ------------------------------------------------------------------
+def load_section(*names):                       # Function load_section:
+                                                # loads sections of the
+                                                # sectioned catalog
+    """
+    Loads the named structures of the sectioned catalog CTAN.sec (generated
+    by CTANLoad.py together with the 1st pickle file) on their first access:
+    only the bytes of these sections are read and unpickled. Structures
+    already loaded (a/o loaded by load_pickle1 a/o load_catalog_db) are
+    skipped.
+
+    Rewrites the global sections and the globals named in names.
+
+    parameter:
+    names: names of the structures ("authors", "packages", "topics",
+           "licenses", "topicspackages", "packagetopics", "authorpackages",
+           "licensepackages", "yearpackages")
+
+    possible (error) messages:
+    + Error: sectioned catalog '{0}' not usable
+    """
+
+    # 2.72    2026-10-18 new function load_section
+
+    global sections
+
+    if debugging:
+        print("+++ -CTANOut:load_section")
+
+    for name in names:
+        if name in sections:                    # not loaded up to now
+            (offset, length) = sections.pop(name)
+            try:
+                with open(direc + section_name, "br") as f:
+                    f.seek(sections_base + offset)
+                    globals()[name] = pickle.loads(f.read(length))
+                                                # global structure name
+            except (OSError, pickle.UnpicklingError, EOFError):
+                print(f"--- Error: sectioned catalog '{section_name}'",
+                      "not usable")
+                sys.exit("[CTANOut] Error: program is terminated")
+
 # ------------------------------------------------------------------
 def main():                                     # function: Main function
                                                 # (calls the other functions)
@@ -3006,10 +3418,13 @@ def main():                                     # function: Main function
 
     # 2.65    2025-02-06 wherever appropriate: string interpolation with
     #                    f-strings instead of .format
+    # 2.71    2026-10-18 in main: SQLite catalog instead of the pickle files
+    #                    (-sq)
 
     # main --> biblatex_citationkey
     # main --> load_pickle1
     # main --> load_pickle2
+    # main --> load_catalog_db
     # main --> first_lines
     # main --> process_packages
     # main --> make_tops
@@ -3026,8 +3441,11 @@ def main():                                     # function: Main function
     starttotal   = time.time()                  # set begin of total time
     startprocess = time.process_time()          # set begin of process time
 
-    load_pickle1()                              # load pickle file 1
-    load_pickle2()                              # load pickle file 21
+    if sqlite:                                  # option -sq
+        load_catalog_db()                       # open the SQLite catalog
+    else:
+        load_pickle1()                          # load pickle file 1
+        load_pickle2()                          # load pickle file 21
     if mode == "BibLaTeX":
         biblatex_citationkey()                  # generate BibLaTeX citation keys
     
@@ -3125,10 +3543,17 @@ def make_stat():                                # function make_stat: generates
     # 2.61    2024-04-12 smaller changes in make_statistics
     # 2.65    2025-02-06 wherever appropriate: string interpolation with
     #                    f-strings instead of .format
+    # 2.72    2026-10-18 in make_stat: catalog sections loaded on first access
+
+    # make_stat --> load_section
 
     if debugging:
         print("+++ >CTANOut:make_stat")
 
+    load_section("authors", "packages", "topics", "licenses")
+                                                # catalog sections (loaded on
+                                                # first access)
+
     # write statistics in the stat (.stat) file
 
     text1 = empty
@@ -3232,9 +3657,18 @@ def make_statistics():                          # function make_statistics:
     no parameter
     """
 
+    # 2.72    2026-10-18 in make_statistics: catalog sections loaded on first
+    #                    access
+
+    # make_statistics --> load_section
+
     if debugging:
         print("+++ >CTANOut:make_statistics")
 
+    load_section("authors", "packages", "topics", "licenses")
+                                                # catalog sections (loaded on
+                                                # first access)
+
     l = left + 3
     r = 6
     
@@ -3301,10 +3735,17 @@ def make_tap():                                 # function make_tap: Generate
     #                    output texts
     # 2.65    2025-02-06 wherever appropriate: string interpolation with
     #                    f-strings instead of .format
+    # 2.72    2026-10-18 in make_tap: catalog sections loaded on first access
+
+    # make_tap --> load_section
 
     if debugging:
         print("+++ >CTANOut:make_tap")
 
+    load_section("authors", "packages", "authorpackages")
+                                                # catalog sections (loaded on
+                                                # first access)
+
     # Authors|Packages cross-reference
         
     tap = open(direc + args.out_file + ".tap", encoding=file_encoding, mode="w")
@@ -3367,10 +3808,17 @@ def make_tlp():                                 # function make_tlp: Generates
     #                    output texts
     # 2.65    2025-02-06 wherever appropriate: string interpolation with
     #                    f-strings instead of .format
+    # 2.72    2026-10-18 in make_tlp: catalog sections loaded on first access
+
+    # make_tlp --> load_section
 
     if debugging:
         print("+++ >CTANOut:make_tlp")
 
+    load_section("licenses", "packages", "licensepackages")
+                                                # catalog sections (loaded on
+                                                # first access)
+
     # Authors|Packages cross-reference
         
     tlp = open(direc + args.out_file + ".tlp", encoding=file_encoding, mode="w")
@@ -3430,10 +3878,16 @@ def make_tops():                                # function make_tops: Generates
     #                    make_xref: Small additions to the output texts
     # 2.65    2025-02-06 wherever appropriate: string interpolation with
     #                    f-strings instead of .format
+    # 2.72    2026-10-18 in make_tops: catalog sections loaded on first access
+
+    # make_tops --> load_section
 
     if debugging:
         print("+++ >CTANOut:make_tops")
 
+    load_section("topics")                      # catalog section (loaded on
+                                                # first access)
+
     # Topic list
     tops = open(direc + args.out_file + ".top", encoding=file_encoding, mode="w")
     
@@ -3474,10 +3928,16 @@ def make_lics():                                # function make_lics: Generates
     #                    make_xref: Small additions to the output texts
     # 2.65    2025-02-06 wherever appropriate: string interpolation with
     #                    f-strings instead of .format
+    # 2.72    2026-10-18 in make_lics: catalog sections loaded on first access
+
+    # make_lics --> load_section
 
     if debugging:
         print("+++ >CTANOut:make_lics")
 
+    load_section("licenses")                    # catalog section (loaded on
+                                                # first access)
+
     # License list
     lics = open(direc + args.out_file + ".lic", encoding=file_encoding, mode="w")
     
@@ -3522,10 +3982,17 @@ def make_xref():                                # function make_xref: Generates
     #                    make_xref: Small additions to the output texts
     # 2.65    2025-02-06 wherever appropriate: string interpolation with
     #                    f-strings instead of .format
+    # 2.72    2026-10-18 in make_xref: catalog sections loaded on first access
+
+    # make_xref --> load_section
 
     if debugging:
         print("+++ >CTANOut:make_xref")
 
+    load_section("packages", "topics", "topicspackages")
+                                                # catalog sections (loaded on
+                                                # first access)
+
     # Topics|Packages cross-reference
     xref = open(direc + args.out_file + ".xref", encoding=file_encoding,
                 mode="w")
@@ -3693,7 +4160,9 @@ def onepackage(s, t):                           # function onepackage: loads a
 
     # 2.65    2025-02-06 wherever appropriate: string interpolation with
     #                    f-strings instead of .format
+    # 2.69    2026-10-18 in onepackage: compressed XML files
 
+    # onepackage --> open_XML_file
     # onepackage --> entry
     
     global counter                              # counter for packages
@@ -3704,8 +4173,9 @@ def onepackage(s, t):                           # function onepackage: loads a
     left = 33
 
     try:
-        onePackage     = ET.parse(direc + s + ext)
-                                                # parse XML file
+        with open_XML_file(direc + s + ext) as xf:
+                                                # XML file a/o compressed file
+            onePackage = ET.parse(xf)           # parse XML file
     except:                                     # not successfull
         if verbose:
             print(f"----- Warning: XML file for package '{s}' not well-formed")
@@ -3740,7 +4210,11 @@ def process_packages():                         # function process_packages:
 
     # 2.65    2025-02-06 wherever appropriate: string interpolation with
     #                    f-strings instead of .format
+    # 2.69    2026-10-18 in process_packages: compressed XML files
+    # 2.72    2026-10-18 in process_packages: catalog sections loaded on first
+    #                    access
 
+    # process_packages --> open_XML_file
     # process_packages --> onepackage
     # process_packages --> get_topic_packages
     # process_packages --> get_author_packages
@@ -3748,6 +4222,7 @@ def process_packages():                         # function process_packages:
     # process_packages --> get_local_packages
     # process_packages --> get_license_packages
     # process_packages --> get_year_packages
+    # process_packages --> load_section
 
     global no_package_processed                 # Flag: if there is no correct
                                                 # XML file
@@ -3755,6 +4230,9 @@ def process_packages():                         # function process_packages:
 
     if debugging:
         print("+++ >CTANOut:process_packages")
+
+    load_section("packages")                    # catalog section (loaded on
+                                                # first access)
     
     all_packages = set()                        # initialize set
     for f in packages:
@@ -3787,9 +4265,10 @@ def process_packages():                         # function process_packages:
         fext = f + ext                          # XML file name (with extension)
  
         try:                                    # try to open file
-            ff       = open(direc + fext, encoding=file_encoding, mode="r")
+            ff       = open_XML_file(direc + fext)
+                                                # XML file a/o compressed file
             mod_time = time.strftime('%Y-%m-%d',
-                                     time.gmtime(os.path.getmtime(fext)))
+                                     time.gmtime(os.path.getmtime(ff.name)))
             onepackage(f, mod_time)             # process loaded XML file 
             ff.close()                          # loaded XML file closed
         except FileNotFoundError:               # specified XML file not found
@@ -3815,6 +4294,37 @@ def process_packages():                         # function process_packages:
     if debugging:
         print("+++ <CTANOut:process_packages")
 
+# ------------------------------------------------------------------
+def query_catalog_db(table, test):              # Function query_catalog_db:
+                                                # selects packages in the
+                                                # SQLite catalog
+    """
+    Selects packages in one relation table of the SQLite catalog: only the
+    distinct keys are read and matched; the packages are fetched for the
+    matching keys (indexed column key).
+
+    Returns a set of package names.
+
+    parameters:
+    table: name of the relation table ("topicspackages", "authorpackages",
+           "licensepackages", "yearpackages")
+    test:  function (key --> True|False)
+    """
+
+    # 2.71    2026-10-18 new function query_catalog_db
+
+    if debugging:
+        print("+++ -CTANOut:query_catalog_db")
+
+    tmp = set()
+    for (k,) in catalog_db.execute(f"SELECT DISTINCT key FROM {table}"). \
+            fetchall():
+        if test(k):                             # key matches template
+            for (g,) in catalog_db.execute(f"SELECT package FROM {table} " +
+                                           "WHERE key = ?", (k,)):
+                tmp.add(g)
+    return tmp
+
 # ------------------------------------------------------------------
 def texlive(k):                                 # function texlive: processes
                                                 # element <texlive .../>
@@ -5431,6 +5941,12 @@ main()
 # 2.66    2025-02-06 everywhere: all source code lines wrapped at a maximum of 80 characters
 # 2.67    2025-02-11 more f-strings
 # 2.68    2025-02-12 no test: __name__ == "__main__; ==> CTANLoad.py can be imported 
+# 2.69    2026-10-18 package XML files may be compressed (abc.xml.gz, CTANLoad -z); new functions find_XML_file, open_XML_file
+# 2.70    2026-10-18 index file CTAN.idx of CTANLoad (topicspackages, authorpackages, licensepackages) used by get_topic_packages, get_author_packages and get_license_packages (fallback: dictionaries of the 1st pickle file); new function load_index
+# 2.71    2026-10-18 new option -sq|--sqlite: catalog read from the SQLite database CTAN.db of CTANLoad (-sq); get_topic_packages, get_author_packages, get_license_packages and get_year_packages query only the needed rows; new functions load_catalog_db and query_catalog_db
+# 2.72    2026-10-18 sectioned catalog CTAN.sec of CTANLoad: load_pickle1 reads only its directory; each structure is loaded on its first access (new function load_section); fallback: 1st pickle file
+# 2.73    2026-10-18 -sq: tables missing in CTAN.db are named in the error message; XML_toc taken from the 2nd pickle file, if table documentation is missing (CTANLoad -sq without a complete load)
+# 2.73    2026-10-18 get_topic_packages, get_author_packages, get_license_packages: the dictionaries of the catalog (1st pickle file a/o CTAN.sec) preferred; the index file CTAN.idx is only read as fallback
 
 # ------------------------------------------------------------------
 # Probleme/Ideen: